@@ -7,10 +7,17 @@ from modeltranslation.admin import TabbedTranslationAdmin
 from sage_ticket.admin.filters import TutorialsStatusFilter
 from sage_ticket.models import TutorialCategory
 from sage_ticket.resources import TutorialCategoryResource
+from sage_ticket.utils.import_export.preview import BulkDryRunAdminMixin
+from sage_ticket.utils.import_export.streaming import StreamingExportAdminMixin
 
 
 @admin.register(TutorialCategory)
-class TutorialCategoryAdmin(ImportExportModelAdmin, TabbedTranslationAdmin):
+class TutorialCategoryAdmin(
+    BulkDryRunAdminMixin,
+    StreamingExportAdminMixin,
+    ImportExportModelAdmin,
+    TabbedTranslationAdmin,
+):
     """
     Django admin customization for the TutorialCategory model.
 
@@ -45,10 +52,12 @@ class TutorialCategoryAdmin(ImportExportModelAdmin, TabbedTranslationAdmin):
 
     def get_queryset(self, request):
         queryset = super().get_queryset(request)
-        queryset = queryset.join_tutorials()
+        queryset = queryset.annotate_published_tutorials_count()
         return queryset
 
-    @admin.display(description=_("Published Tutorials"))
+    @admin.display(
+        description=_("Published Tutorials"),
+        ordering="published_tutorials_count",
+    )
     def published_tutorials_count(self, obj):
-        # Annotate the count of published tutorials directly when accessed
-        return obj.tutorials.filter(is_published=True).count()
+        return obj.published_tutorials_count
@@ -8,7 +8,9 @@ from sage_ticket.models import Comment
 class CommentAdmin(admin.ModelAdmin):
     list_display = ("title", "user", "issue", "status", "is_read", "created_at")
     list_filter = ("status", "is_read", "created_at")
-    search_fields = ("title", "user__username", "issue__title")
+    search_fields = ("title", "user__username", "issue__subject")
+    list_select_related = ("user", "issue")
+    raw_id_fields = ("user", "issue", "replay")
     readonly_fields = ("created_at", "modified_at")
     ordering = ("-created_at",)
 
@@ -16,5 +16,11 @@ class TutorialsStatusFilter(admin.SimpleListFilter):
         if self.value() == "no_tutorials":
             return queryset.filter(tutorials__isnull=True)
         elif self.value() == "published_tutorials":
-            return queryset.filter_published_tutorials().distinct()
+            # Filter on the count annotation; joining tutorials again would
+            # multiply the annotated counts.
+            return (
+                queryset.annotate_published_tutorials_count()
+                .filter_published()
+                .filter(published_tutorials_count__gt=0)
+            )
         return queryset
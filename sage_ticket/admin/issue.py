@@ -1,4 +1,9 @@
 from django.contrib import admin
+from django.contrib.admin.widgets import ForeignKeyRawIdWidget
+from django.forms.models import BaseInlineFormSet
+from django.urls import NoReverseMatch, reverse
+from django.utils.html import format_html, format_html_join
+from django.utils.text import Truncator
 from django.utils.translation import gettext_lazy as _
 
 from sage_ticket.models import Attachment, Comment, Department, Issue
@@ -11,11 +16,95 @@ class AttachmentInline(admin.TabularInline):
     show_change_link = True
 
 
+class LoadedRawIdWidget(ForeignKeyRawIdWidget):
+    """
+    Raw id widget that labels its value from objects that are already loaded,
+    instead of fetching the related object for every rendered row.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.loaded = {}
+
+    def label_and_url_for_value(self, value):
+        obj = self.loaded.get(str(value))
+        if obj is None:
+            return super().label_and_url_for_value(value)
+        opts = obj._meta
+        try:
+            url = reverse(
+                f"{self.admin_site.name}:{opts.app_label}_{opts.model_name}_change",
+                args=(obj.pk,),
+            )
+        except NoReverseMatch:
+            url = ""
+        return Truncator(obj).words(14), url
+
+
+class CommentInlineFormSet(BaseInlineFormSet):
+    """Hands the users selected with the comments to each row's user widget."""
+
+    def _construct_form(self, i, **kwargs):
+        form = super()._construct_form(i, **kwargs)
+        widget = form.fields["user"].widget
+        if isinstance(widget, LoadedRawIdWidget):
+            widget.loaded = self.get_loaded_users()
+        return form
+
+    def get_loaded_users(self):
+        if not hasattr(self, "_loaded_users"):
+            self._loaded_users = {
+                str(comment.user_id): comment.user
+                for comment in self.get_queryset()
+                if comment.user_id is not None
+            }
+        return self._loaded_users
+
+
 class CommentInline(admin.TabularInline):
+    """
+    Shows one page of the latest comments of an issue.
+
+    Issues can collect hundreds of comments, so only ``per_page`` of them are
+    rendered at a time; ``?comments_page=N`` selects older pages and the full
+    list is linked from the issue's activity fieldset.
+    """
+
     model = Comment
+    formset = CommentInlineFormSet
     extra = 1
     fields = ("title", "user", "message", "is_read")
+    raw_id_fields = ("user",)
     show_change_link = True
+    per_page = 20
+    page_param = "comments_page"
+
+    def get_page(self, request):
+        try:
+            return max(int(request.GET.get(self.page_param, 1)), 1)
+        except ValueError:
+            return 1
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name in self.raw_id_fields:
+            kwargs["widget"] = LoadedRawIdWidget(
+                db_field.remote_field, self.admin_site, using=kwargs.get("using")
+            )
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request).select_related("user")
+        object_id = request.resolver_match.kwargs.get("object_id")
+        if not object_id:
+            return queryset
+
+        offset = (self.get_page(request) - 1) * self.per_page
+        page = list(
+            queryset.filter(issue_id=object_id)
+            .order_by("-created_at", "-pk")
+            .values_list("pk", flat=True)[offset : offset + self.per_page]
+        )
+        return queryset.filter(pk__in=page).order_by("-created_at", "-pk")
 
 
 class DepartmentInline(admin.TabularInline):
@@ -29,10 +118,21 @@ class DepartmentInline(admin.TabularInline):
 class IssueAdmin(admin.ModelAdmin):
     inlines = [AttachmentInline, CommentInline]
     list_display = ("subject", "state", "department", "raised_by", "uid", "is_public", "is_read", "is_archive", "created_at")
+    list_select_related = ("department", "raised_by")
+    show_full_result_count = False
     list_filter = ("state", "is_public", "is_read", "is_archive", "created_at", "department")
     search_fields = ("subject", "message", "raised_by__username", "department__title", "uid")
     ordering = ("-created_at",)
-    readonly_fields = ("uid", "created_at", "modified_at")
+    readonly_fields = (
+        "uid",
+        "comments_count",
+        "unread_comments_count",
+        "unanswered_comments_count",
+        "last_activity_at",
+        "comments_pages",
+        "created_at",
+        "modified_at",
+    )
     autocomplete_fields = ("raised_by", "department")
     save_on_top = True
 
@@ -51,6 +151,19 @@ class IssueAdmin(admin.ModelAdmin):
                 "description": _("Flags indicating whether the issue is public, unread, or archived."),
             },
         ),
+        (
+            _("Activity"),
+            {
+                "fields": (
+                    "comments_count",
+                    "unread_comments_count",
+                    "unanswered_comments_count",
+                    "last_activity_at",
+                    "comments_pages",
+                ),
+                "description": _("Comment counters and the time of the latest comment."),
+            },
+        ),
         (
             _("Identifiers"),
             {
@@ -66,3 +179,23 @@ class IssueAdmin(admin.ModelAdmin):
             },
         ),
     )
+
+    @admin.display(description=_("Comment pages"))
+    def comments_pages(self, obj):
+        if not obj.pk:
+            return "-"
+        per_page = CommentInline.per_page
+        pages = max((obj.comments_count + per_page - 1) // per_page, 1)
+        links = format_html_join(
+            " ",
+            '<a href="?{}={}">{}</a>',
+            ((CommentInline.page_param, page, page) for page in range(1, pages + 1)),
+        )
+        url = reverse("admin:sage_ticket_comment_changelist")
+        return format_html(
+            '{} | <a href="{}?issue__id__exact={}">{}</a>',
+            links,
+            url,
+            obj.pk,
+            _("All comments"),
+        )
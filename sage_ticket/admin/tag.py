@@ -6,10 +6,17 @@ from modeltranslation.admin import TabbedTranslationAdmin
 
 from sage_ticket.models import TutorialTag
 from sage_ticket.resources import TutorialTagResource
+from sage_ticket.utils.import_export.preview import BulkDryRunAdminMixin
+from sage_ticket.utils.import_export.streaming import StreamingExportAdminMixin
 
 
 @admin.register(TutorialTag)
-class TutorialTagAdmin(ImportExportModelAdmin, TabbedTranslationAdmin):
+class TutorialTagAdmin(
+    BulkDryRunAdminMixin,
+    StreamingExportAdminMixin,
+    ImportExportModelAdmin,
+    TabbedTranslationAdmin,
+):
     """
     Django admin customization for the TutorialTag model.
 
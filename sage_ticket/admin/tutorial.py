@@ -8,6 +8,7 @@ from polymorphic.admin import PolymorphicParentModelAdmin, PolymorphicChildModel
 
 from sage_ticket.models import Tutorial, TutorialFaq, VideoTutorial, PictureTutorial
 from sage_ticket.resources import TutorialResource
+from sage_ticket.utils.import_export.streaming import StreamingExportAdminMixin
 
 
 class TutorialFaqInline(TranslationTabularInline):
@@ -18,6 +19,7 @@ class TutorialFaqInline(TranslationTabularInline):
 @admin.register(Tutorial)
 class TutorialAdmin(
     PolymorphicParentModelAdmin,
+    StreamingExportAdminMixin,
     ImportExportModelAdmin,
     TabbedTranslationAdmin,
     AdminImageMixin
@@ -119,7 +121,8 @@ class TutorialAdmin(
     @staticmethod
     @admin.display(description=_("Tags"))
     def get_tags(obj):
-        return ", ".join([tag.title for tag in obj.tags.all()])
+        tag_titles = getattr(obj, "tag_titles", None)
+        return tag_titles or ""
 
     @staticmethod
     @admin.display(description=_("Summary"))
@@ -129,7 +132,7 @@ class TutorialAdmin(
     # Filter customization
     def get_queryset(self, request):
         queryset = super().get_queryset(request)
-        queryset = queryset.prefetch_related("tags")
+        queryset = queryset.select_related("category", "author").annotate_tag_titles()
         return queryset
 
 
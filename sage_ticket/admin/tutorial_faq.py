@@ -9,10 +9,13 @@ from modeltranslation.admin import TabbedTranslationAdmin
 
 from sage_ticket.models import TutorialFaq
 from sage_ticket.resources import TutorialFaqResource
+from sage_ticket.utils.import_export.streaming import StreamingExportAdminMixin
 
 
 @admin.register(TutorialFaq)
-class TutorialFaqAdmin(ImportExportModelAdmin, TabbedTranslationAdmin):
+class TutorialFaqAdmin(
+    StreamingExportAdminMixin, ImportExportModelAdmin, TabbedTranslationAdmin
+):
     """
     FAQ Admin
     """
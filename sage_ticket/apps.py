@@ -1,4 +1,6 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+from django.db.models.signals import m2m_changed, post_delete, post_migrate, pre_delete
 from django.utils.translation import gettext_lazy as _
 
 
@@ -8,4 +10,44 @@ class TicketConfig(AppConfig):
     verbose_name = _("Ticket")
 
     def ready(self) -> None:
-        pass
+        from sage_ticket import signals
+        from sage_ticket.models import Tutorial
+        from sage_ticket.search.config import configure_trigram_thresholds
+        from sage_ticket.search.schema import ensure_search_schema
+        from sage_ticket.utils.cache import connect_cache_invalidation
+
+        post_migrate.connect(
+            ensure_search_schema,
+            sender=self,
+            dispatch_uid="sage_ticket_ensure_search_schema",
+        )
+        connection_created.connect(
+            configure_trigram_thresholds,
+            dispatch_uid="sage_ticket_configure_trigram_thresholds",
+        )
+        m2m_changed.connect(
+            signals.refresh_tag_usage_on_tags_changed,
+            sender=Tutorial.tags.through,
+            dispatch_uid="sage_ticket_refresh_tag_usage_on_tags_changed",
+        )
+        m2m_changed.connect(
+            signals.refresh_recommendations_on_tags_changed,
+            sender=Tutorial.tags.through,
+            dispatch_uid="sage_ticket_refresh_recommendations_on_tags_changed",
+        )
+        pre_delete.connect(
+            signals.remember_tutorial_tags,
+            sender=Tutorial,
+            dispatch_uid="sage_ticket_remember_tutorial_tags",
+        )
+        post_delete.connect(
+            signals.refresh_tag_usage_on_tutorial_delete,
+            sender=Tutorial,
+            dispatch_uid="sage_ticket_refresh_tag_usage_on_tutorial_delete",
+        )
+        post_delete.connect(
+            signals.refresh_navigation_on_tutorial_delete,
+            sender=Tutorial,
+            dispatch_uid="sage_ticket_refresh_navigation_on_tutorial_delete",
+        )
+        connect_cache_invalidation()
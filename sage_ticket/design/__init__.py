@@ -1,3 +1,3 @@
-from .state import TicketState
+from .state import TicketState, can_transition
 
-__all__ = ["TicketState"]
+__all__ = ["TicketState", "can_transition"]
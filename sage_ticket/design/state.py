@@ -1,4 +1,4 @@
-import abc
+from types import MappingProxyType
 
 from sage_ticket.helper.choice import TicketStateEnum
 from sage_ticket.helper.exception import (
@@ -7,312 +7,272 @@ from sage_ticket.helper.exception import (
     InvalidOpenStateOperation,
     InvalidPendingStateOperation,
     InvalidResolvedStateOperation,
+    InvalidStateException,
 )
 
+TRANSITIONS = MappingProxyType(
+    {
+        TicketStateEnum.NEW: frozenset(
+            {TicketStateEnum.OPEN, TicketStateEnum.CLOSED}
+        ),
+        TicketStateEnum.OPEN: frozenset(
+            {TicketStateEnum.PENDING, TicketStateEnum.CLOSED}
+        ),
+        TicketStateEnum.PENDING: frozenset(
+            {TicketStateEnum.HOLD, TicketStateEnum.CLOSED}
+        ),
+        TicketStateEnum.HOLD: frozenset(
+            {TicketStateEnum.RESOLVED, TicketStateEnum.CLOSED}
+        ),
+        TicketStateEnum.RESOLVED: frozenset({TicketStateEnum.CLOSED}),
+        TicketStateEnum.CLOSED: frozenset({TicketStateEnum.OPEN}),
+    }
+)
+"""Immutable transition table: each state mapped to the states it can move to."""
+
+SOURCES = MappingProxyType(
+    {
+        target: tuple(
+            source for source in TicketStateEnum if target in TRANSITIONS[source]
+        )
+        for target in TicketStateEnum
+    }
+)
+"""Reverse of ``TRANSITIONS``: each state mapped to the states that reach it."""
+
+INVALID_OPERATIONS = MappingProxyType(
+    {
+        TicketStateEnum.NEW: InvalidNewStateOperation,
+        TicketStateEnum.OPEN: InvalidOpenStateOperation,
+        TicketStateEnum.PENDING: InvalidPendingStateOperation,
+        TicketStateEnum.HOLD: InvalidHoldStateOperation,
+        TicketStateEnum.RESOLVED: InvalidResolvedStateOperation,
+    }
+)
+"""Exception raised by ``TicketState`` when a target state cannot be reached."""
 
-class State(abc.ABC):
-    """Abstract base class representing the state of a ticket in a state
-    machine.
 
-    This class defines the interface for different states and provides a way
-    to set the current ticket attribute. Each concrete state class must
-    implement the abstract methods to handle state-specific behavior.
+def can_transition(source, target):
+    """Checks whether a ticket can move from ``source`` to ``target``.
 
-    Attributes:
-        _current_ticket (TicketState): Holds the reference to the ticket's
-        current state.
+    This is a plain table lookup and never raises, so it is safe to call for
+    every row of a bulk operation.
 
-    Methods:
-        set_ticket_attribute(ticket): Sets the current ticket reference.
-        new(): Abstract method for handling the transition to the 'new' state.
-        open(): Abstract method for handling the transition to the 'open' state.
-        pending(): Abstract method for handling the transition to the 'pending' state.
-        hold(): Abstract method for handling the transition to the 'hold' state.
-        resolved(): Abstract method for handling the transition to the 'resolved' state.
-        closed(): Abstract method for handling the transition to the 'closed' state.
+    Args:
+        source (TicketStateEnum): The current state.
+        target (TicketStateEnum): The requested state.
+
+    Returns:
+        bool: True if the transition is allowed.
 
     """
+    targets = TRANSITIONS.get(source)
+    return targets is not None and target in targets
 
-    _current_ticket = None
 
-    def set_ticket_attribute(self, ticket):
-        """Sets the ticket attribute to the given ticket instance.
+def get_allowed_transitions():
+    """Returns the transition table.
 
-        Args:
-            ticket (TicketState): The ticket instance to associate with the state.
+    Returns:
+        MappingProxyType: A read-only mapping of each ``TicketStateEnum`` to the
+        frozenset of states it can move to.
 
-        """
-        self._current_ticket = ticket
+    """
+    return TRANSITIONS
 
-    @abc.abstractmethod
-    def new(self):
-        raise NotImplementedError
 
-    @abc.abstractmethod
-    def open(self):
-        raise NotImplementedError
+def get_source_states(target):
+    """Returns the states from which ``target`` can be reached.
 
-    @abc.abstractmethod
-    def pending(self):
-        raise NotImplementedError
+    Args:
+        target (TicketStateEnum): The destination state.
 
-    @abc.abstractmethod
-    def hold(self):
-        raise NotImplementedError
+    Returns:
+        tuple: The source states, in ``TicketStateEnum`` declaration order.
 
-    @abc.abstractmethod
-    def resolved(self):
-        raise NotImplementedError
+    """
+    return SOURCES[TicketStateEnum(target)]
 
-    @abc.abstractmethod
-    def closed(self):
-        raise NotImplementedError
 
+class State:
+    """Base class representing the state of a ticket in a state machine.
 
-class TicketState:
-    """Manages the state of a ticket and provides methods to transition between
-    states.
-
-    This class uses the State design pattern to allow different states of a ticket
-    to be represented by different classes that share a common interface.
+    States are stateless singletons: instantiating a concrete state always
+    returns the same object, and all transition rules live in ``TRANSITIONS``.
 
     Attributes:
-        _state (State): The current state of the ticket.
+        value (TicketStateEnum): The state this class represents.
 
     Methods:
-        set_state(state): Sets the current state of the ticket.
-        set_new(): Transitions the ticket to the 'new' state.
-        set_open(): Transitions the ticket to the 'open' state.
-        set_pending(): Transitions the ticket to the 'pending' state.
-        set_hold(): Transitions the ticket to the 'hold' state.
-        set_resolved(): Transitions the ticket to the 'resolved' state.
-        set_closed(): Transitions the ticket to the 'closed' state.
-        show_state(): Returns the current state by executing the corresponding
-        state method.
+        can_transition(target): Checks whether this state can move to target.
 
     """
 
-    _state = None
+    value = None
+    _instance = None
 
-    def __init__(self, state):
-        self.set_state(state)
+    def __new__(cls):
+        if cls.__dict__.get("_instance") is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
 
-    def set_state(self, state):
-        """Sets the current state of the ticket and updates the state's ticket
-        reference.
+    def can_transition(self, target):
+        """Checks whether this state can move to ``target`` without raising.
 
         Args:
-            state (State): The state to set as the current state.
+            target (TicketStateEnum): The requested state.
 
         """
-        self._state = state
-        self._state.set_ticket_attribute(self)
+        return can_transition(self.value, target)
 
-    def set_new(self):
-        """Transitions the ticket to the 'new' state."""
-        self._state.new()
-
-    def set_open(self):
-        """Transitions the ticket to the 'open' state."""
-        self._state.open()
-
-    def set_pending(self):
-        """Transitions the ticket to the 'pending' state."""
-        self._state.pending()
-
-    def set_hold(self):
-        """Transitions the ticket to the 'hold' state."""
-        self._state.hold()
-
-    def set_resolved(self):
-        """Transitions the ticket to the 'resolved' state."""
-        self._state.resolved()
-
-    def set_closed(self):
-        """Transitions the ticket to the 'closed' state."""
-        self._state.closed()
-
-    def show_state(self):
-        """Executes the method corresponding to the current state and returns
-        the result.
-
-        This method uses the class name of the current state to determine the
-        appropriate method to execute.
-
-        Returns:
-            The result of the executed state method.
-
-        """
-        state_map = {
-            "NewState": self._state.new,
-            "OpenState": self._state.open,
-            "PendingState": self._state.pending,
-            "HoldState": self._state.hold,
-            "ResolvedState": self._state.resolved,
-            "ClosedState": self._state.closed,
-        }
-        show_current_state = state_map.get(self._state.__class__.__name__)
-
-        return show_current_state()
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self.value}>"
 
 
 class NewState(State):
-    """Represents the 'new' state of a ticket.
-
-    This class implements the behavior specific to the 'new' state,
-    including transitions to other states.
-
-    """
-
-    def new(self):
-        return TicketStateEnum.NEW
-
-    def open(self):
-        return self._current_ticket.set_state(OpenState())
-
-    def pending(self):
-        raise InvalidPendingStateOperation()
-
-    def hold(self):
-        raise InvalidHoldStateOperation()
-
-    def resolved(self):
-        raise InvalidResolvedStateOperation()
+    """Represents the 'new' state of a ticket."""
 
-    def closed(self):
-        return self._current_ticket.set_state(ClosedState())
+    value = TicketStateEnum.NEW
 
 
 class OpenState(State):
-    """Represents the 'open' state of a ticket.
+    """Represents the 'open' state of a ticket."""
 
-    This class implements the behavior specific to the 'open' state,
-    including transitions to other states.
-
-    """
-
-    def new(self):
-        raise InvalidNewStateOperation()
-
-    def open(self):
-        return TicketStateEnum.OPEN
-
-    def pending(self):
-        return self._current_ticket.set_state(PendingState())
-
-    def hold(self):
-        raise InvalidHoldStateOperation()
-
-    def resolved(self):
-        raise InvalidResolvedStateOperation()
-
-    def closed(self):
-        return self._current_ticket.set_state(ClosedState())
+    value = TicketStateEnum.OPEN
 
 
 class PendingState(State):
-    """Represents the 'pending' state of a ticket.
+    """Represents the 'pending' state of a ticket."""
 
-    This class implements the behavior specific to the 'pending' state,
-    including transitions to other states.
+    value = TicketStateEnum.PENDING
 
-    """
-
-    def new(self):
-        raise InvalidNewStateOperation()
-
-    def open(self):
-        raise InvalidOpenStateOperation()
-
-    def pending(self):
-        return TicketStateEnum.PENDING
 
-    def hold(self):
-        return self._current_ticket.set_state(HoldState())
+class HoldState(State):
+    """Represents the 'hold' state of a ticket."""
 
-    def resolved(self):
-        raise InvalidResolvedStateOperation()
+    value = TicketStateEnum.HOLD
 
-    def closed(self):
-        return self._current_ticket.set_state(ClosedState())
 
+class ResolvedState(State):
+    """Represents the 'resolved' state of a ticket."""
 
-class HoldState(State):
-    """Represents the 'hold' state of a ticket.
+    value = TicketStateEnum.RESOLVED
 
-    This class implements the behavior specific to the 'hold' state,
-    including transitions to other states.
 
-    """
+class ClosedState(State):
+    """Represents the 'closed' state of a ticket."""
+
+    value = TicketStateEnum.CLOSED
+
+
+STATES = MappingProxyType(
+    {
+        state_class.value: state_class()
+        for state_class in (
+            NewState,
+            OpenState,
+            PendingState,
+            HoldState,
+            ResolvedState,
+            ClosedState,
+        )
+    }
+)
+"""Singleton state object for each ``TicketStateEnum``."""
 
-    def new(self):
-        raise InvalidNewStateOperation()
 
-    def open(self):
-        raise InvalidOpenStateOperation()
+class TicketState:
+    """Manages the state of a ticket and provides methods to transition between
+    states.
 
-    def pending(self):
-        raise InvalidPendingStateOperation()
+    Transitions are validated against ``TRANSITIONS`` and switch between the
+    singleton objects in ``STATES``, so no state objects are allocated.
 
-    def hold(self):
-        return TicketStateEnum.HOLD
+    Attributes:
+        _state (State): The current state of the ticket.
 
-    def resolved(self):
-        return self._current_ticket.set_state(ResolvedState())
+    Methods:
+        set_state(state): Sets the current state of the ticket.
+        set_new(): Transitions the ticket to the 'new' state.
+        set_open(): Transitions the ticket to the 'open' state.
+        set_pending(): Transitions the ticket to the 'pending' state.
+        set_hold(): Transitions the ticket to the 'hold' state.
+        set_resolved(): Transitions the ticket to the 'resolved' state.
+        set_closed(): Transitions the ticket to the 'closed' state.
+        can_transition(target): Checks whether a transition is allowed.
+        show_state(): Returns the current state.
 
-    def closed(self):
-        return self._current_ticket.set_state(ClosedState())
+    """
 
+    __slots__ = ("_state",)
 
-class ResolvedState(State):
-    """Represents the 'resolved' state of a ticket.
+    def __init__(self, state):
+        self.set_state(state)
 
-    This class implements the behavior specific to the 'resolved' state,
-    including transitions to other states.
+    def set_state(self, state):
+        """Sets the current state of the ticket.
 
-    """
+        Args:
+            state (State | TicketStateEnum): The state to set as the current
+            state.
 
-    def new(self):
-        raise InvalidNewStateOperation()
+        """
+        if not isinstance(state, State):
+            state = STATES[TicketStateEnum(state)]
+        self._state = state
 
-    def open(self):
-        raise InvalidOpenStateOperation
+    def transition(self, target):
+        """Moves the ticket to ``target``.
 
-    def pending(self):
-        raise InvalidPendingStateOperation
+        Moving to the current state is a no-op.
 
-    def hold(self):
-        raise InvalidHoldStateOperation
+        Args:
+            target (TicketStateEnum): The requested state.
 
-    def resolved(self):
-        return TicketStateEnum.RESOLVED
+        Raises:
+            InvalidStateException: If the transition is not allowed.
 
-    def closed(self):
-        return self._current_ticket.set_state(ClosedState())
+        """
+        source = self._state.value
+        if target == source:
+            return
+        if not can_transition(source, target):
+            raise INVALID_OPERATIONS.get(target, InvalidStateException)()
+        self._state = STATES[target]
 
+    def can_transition(self, target):
+        """Checks whether the ticket can move to ``target`` without raising."""
+        return self._state.can_transition(target)
 
-class ClosedState(State):
-    """Represents the 'closed' state of a ticket.
+    def set_new(self):
+        """Transitions the ticket to the 'new' state."""
+        self.transition(TicketStateEnum.NEW)
 
-    This class implements the behavior specific to the 'closed' state,
-    including transitions to other states.
+    def set_open(self):
+        """Transitions the ticket to the 'open' state."""
+        self.transition(TicketStateEnum.OPEN)
 
-    """
+    def set_pending(self):
+        """Transitions the ticket to the 'pending' state."""
+        self.transition(TicketStateEnum.PENDING)
 
-    def new(self):
-        raise InvalidNewStateOperation()
+    def set_hold(self):
+        """Transitions the ticket to the 'hold' state."""
+        self.transition(TicketStateEnum.HOLD)
 
-    def open(self):
-        return self._current_ticket.set_state(OpenState())
+    def set_resolved(self):
+        """Transitions the ticket to the 'resolved' state."""
+        self.transition(TicketStateEnum.RESOLVED)
 
-    def pending(self):
-        raise InvalidPendingStateOperation()
+    def set_closed(self):
+        """Transitions the ticket to the 'closed' state."""
+        self.transition(TicketStateEnum.CLOSED)
 
-    def hold(self):
-        raise InvalidHoldStateOperation()
+    def show_state(self):
+        """Returns the current state.
 
-    def resolved(self):
-        raise InvalidResolvedStateOperation()
+        Returns:
+            TicketStateEnum: The current state of the ticket.
 
-    def closed(self):
-        return TicketStateEnum.CLOSED
+        """
+        return self._state.value
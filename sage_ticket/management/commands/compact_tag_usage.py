@@ -0,0 +1,70 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from sage_ticket.models import TutorialTag, TutorialTagUsage
+from sage_ticket.repository.queryset.tag import to_usage_day
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the per-day tag usage rollup and the tutorial totals of tags.
+
+    Signals keep the rollup current, but raw SQL, `QuerySet.update` on
+    creation times or restored backups bypass them; run this periodically to
+    repair drift. Tags are processed in primary-key batches.
+    """
+
+    help = "Rebuild the tag usage rollup in batches and drop expired days."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=200,
+            help="Number of tags rebuilt per batch (default: 200).",
+        )
+        parser.add_argument(
+            "--keep-days",
+            type=int,
+            default=None,
+            help=(
+                "Delete rollup rows older than this many days. Trend windows "
+                "longer than this undercount; totals are not affected."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size <= 0:
+            self.stderr.write("`--batch-size` must be a positive integer.")
+            return
+
+        last_pk = 0
+        total = 0
+        while True:
+            pks = list(
+                TutorialTag.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not pks:
+                break
+
+            total += TutorialTag.objects.filter(pk__in=pks).refresh_usage()
+
+            last_pk = pks[-1]
+            if options["verbosity"] > 1:
+                self.stdout.write(f"Rebuilt tags up to pk {last_pk}.")
+
+        expired = 0
+        if options["keep_days"] is not None:
+            since = to_usage_day(timezone.now() - timedelta(days=options["keep_days"]))
+            expired, _ = TutorialTagUsage.objects.filter(day__lt=since).delete()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {total} tag usage rows, removed {expired} expired rows."
+            )
+        )
@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from sage_ticket.resources import TutorialResource
+
+
+class Command(BaseCommand):
+    """
+    Import tutorials from a CSV or JSON Lines file in streaming mode.
+
+    Unlike the admin import, the file is never loaded as a whole: rows are
+    read and written `--chunk-size` at a time with bulk queries, which makes
+    it suitable for catalogs of tens of thousands of tutorials. Rows are
+    matched to existing tutorials by title.
+    """
+
+    help = "Stream tutorials from a CSV or JSON Lines file into the database."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path of the file to import.")
+        parser.add_argument(
+            "--format",
+            choices=("csv", "jsonl"),
+            default="csv",
+            help="Format of the file (default: csv).",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of rows written per transaction (default: 1000).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate and count the rows without saving them.",
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] <= 0:
+            raise CommandError("`--chunk-size` must be a positive integer.")
+
+        with open(options["path"], encoding="utf-8-sig", newline="") as file:
+            result = TutorialResource().import_stream(
+                file,
+                format=options["format"],
+                chunk_size=options["chunk_size"],
+                dry_run=options["dry_run"],
+            )
+
+        for number, error in result.errors:
+            self.stderr.write(f"Row {number}: {error}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {result.created}, updated {result.updated} tutorials, "
+                f"skipped {len(result.errors)} rows."
+            )
+        )
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+
+from sage_ticket.models import TutorialRecommendation
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the precomputed recommendations of every published tutorial.
+
+    Saves and tag changes update recommendations incrementally, scoring only
+    tutorials that share a tag or the category with the changed one. Run this
+    periodically to rank every tutorial against the whole catalog with global
+    term weights, and after imports or raw SQL, which bypass the updates.
+    """
+
+    help = "Rebuild tutorial recommendations from shared tags, category and text."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--top-k",
+            type=int,
+            default=None,
+            help="Number of recommendations stored per tutorial.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of tutorials written per batch (default: 500).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        top_k = options["top_k"]
+        if batch_size <= 0 or (top_k is not None and top_k <= 0):
+            self.stderr.write("`--batch-size` and `--top-k` must be positive integers.")
+            return
+
+        total = TutorialRecommendation.objects.rebuild(
+            top_k=top_k, batch_size=batch_size
+        )
+        self.stdout.write(self.style.SUCCESS(f"Stored {total} recommendations."))
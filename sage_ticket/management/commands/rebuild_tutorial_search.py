@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+
+from sage_ticket.models import Tutorial
+from sage_ticket.search.schema import ensure_search_schema
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the per-language search documents of all tutorials.
+
+    Run it once after upgrading, and after imports or bulk updates that bypass
+    `Tutorial.save`.
+    """
+
+    help = "Rebuild the search documents and vectors of all tutorials in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of tutorials rebuilt per batch (default: 500).",
+        )
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Database alias to rebuild (default: 'default').",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size <= 0:
+            self.stderr.write("`--batch-size` must be a positive integer.")
+            return
+
+        database = options["database"]
+        ensure_search_schema(using=database)
+        total = Tutorial.objects.db_manager(database).refresh_search_documents(
+            batch_size
+        )
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {total} search documents."))
@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from sage_ticket.models import Issue
+
+
+class Command(BaseCommand):
+    """
+    Recompute the denormalized comment counters and last activity of issues.
+
+    Issues are processed in primary-key batches, each recomputed with a single
+    ``UPDATE`` in its own transaction, so the command can repair drift on large
+    tables without holding long locks.
+    """
+
+    help = "Recompute comment counters and last activity of issues in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of issues recomputed per UPDATE (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size <= 0:
+            self.stderr.write("`--batch-size` must be a positive integer.")
+            return
+
+        last_pk = 0
+        total = 0
+        while True:
+            pks = list(
+                Issue.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not pks:
+                break
+
+            with transaction.atomic():
+                total += Issue.objects.filter(pk__in=pks).refresh_comment_counters()
+
+            last_pk = pks[-1]
+            if options["verbosity"] > 1:
+                self.stdout.write(f"Refreshed issues up to pk {last_pk}.")
+
+        self.stdout.write(self.style.SUCCESS(f"Refreshed {total} issues."))
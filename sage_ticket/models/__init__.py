@@ -6,7 +6,9 @@ from .faq import Faq, FaqCategory
 from .tutorial import Tutorial, PictureTutorial, VideoTutorial
 from .tutorial_faq import TutorialFaq
 from .category import TutorialCategory
-from .tag import TutorialTag
+from .tag import TutorialTag, TutorialTagUsage
+from .search import TutorialSearchDocument
+from .recommendation import TutorialRecommendation
 
 __all__ = [
     "Attachment",
@@ -19,6 +21,9 @@ __all__ = [
     "TutorialFaq",
     "TutorialCategory",
     "TutorialTag",
+    "TutorialTagUsage",
     "PictureTutorial",
     "VideoTutorial",
+    "TutorialSearchDocument",
+    "TutorialRecommendation",
 ]
@@ -1,9 +1,10 @@
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 from sage_tools.mixins.models import TimeStampMixin
 
 from sage_ticket.helper import StatusEnum
+from sage_ticket.repository.manager import CommentDataAccessLayer
 
 
 class Comment(TimeStampMixin):
@@ -60,11 +61,59 @@ class Comment(TimeStampMixin):
         db_comment="The comment to which this is a reply.",
     )
 
+    objects: CommentDataAccessLayer = CommentDataAccessLayer()
+
     class Meta:
         verbose_name = _("Comment")
         verbose_name_plural = _("Comments")
+        default_manager_name = "objects"
         db_table = "sage_ticket_comment"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_issue_id = instance.__dict__.get("issue_id")
+        return instance
+
+    def get_issue_queryset(self, using=None):
+        """
+        Returns the issues whose comment counters this comment contributes to:
+        its issue and, if it was moved, the issue it was loaded with.
+        """
+        issue_ids = {self.issue_id, getattr(self, "_loaded_issue_id", None)}
+        issue_model = self._meta.get_field("issue").related_model
+        return issue_model.objects.db_manager(using).filter(
+            pk__in=issue_ids - {None}
+        )
+
+    def save(self, *args, **kwargs):
+        """
+        Saves the comment and keeps the denormalized counters of its issue in
+        sync: a new comment is added to them, an edited one recomputes them.
+        """
+        adding = self._state.adding
+        using = kwargs.get("using") or self._state.db
+        with transaction.atomic(using=using):
+            super().save(*args, **kwargs)
+            issues = self.get_issue_queryset(using=self._state.db)
+            if adding:
+                issues.bump_comment_counters([self])
+            else:
+                issues.refresh_comment_counters()
+        self._loaded_issue_id = self.issue_id
+
+    def delete(self, *args, **kwargs):
+        """
+        Deletes the comment with its replies and recomputes the counters of its
+        issue.
+        """
+        using = kwargs.get("using") or self._state.db
+        issues = self.get_issue_queryset(using=using)
+        with transaction.atomic(using=using):
+            deleted = super().delete(*args, **kwargs)
+            issues.refresh_comment_counters()
+        return deleted
+
     def __repr__(self):
         return f"<Comment(id={self.id}, title={self.title},user={self.user_id}"
 
@@ -6,13 +6,15 @@ from django.utils.translation import gettext_lazy as _
 
 from sage_tools.mixins.models.base import TimeStampMixin, TitleSlugMixin
 
+from sage_ticket.repository.manager import FaqCategoryDataAccessLayer
+
 
 class FaqCategory(TitleSlugMixin, TimeStampMixin):
     """
     Portfolio (Gallery) category
     """
 
-    objects = models.Manager()
+    objects = FaqCategoryDataAccessLayer()
 
     class Meta:
         """Meta Information"""
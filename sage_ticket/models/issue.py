@@ -6,12 +6,20 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 from sage_tools.mixins.models import TimeStampMixin
 
+from sage_ticket.design.state import TRANSITIONS, can_transition
 from sage_ticket.helper import SeverityEnum, TicketStateEnum
+from sage_ticket.repository.manager import DataAccessLayerManager
 
 
 class Issue(TimeStampMixin):
     """Model to represent an issue in the django_sage_ticket ticketing
-    system."""
+    system.
+
+    The comment counters are kept in sync by ``Comment.save`` and
+    ``Comment.delete`` and by the ``bulk_create`` and ``delete`` of the comment
+    queryset. Other writes, such as ``update()`` or raw SQL, must be followed by
+    ``refresh_comment_counters`` (or the ``refresh_issue_counters`` command).
+    """
 
     subject = models.CharField(
         max_length=255,
@@ -72,6 +80,35 @@ class Issue(TimeStampMixin):
         help_text=_("Indicates if the issue is public."),
         db_comment="Indicates if the issue is public.",
     )
+    comments_count = models.PositiveIntegerField(
+        verbose_name=_("Comments"),
+        default=0,
+        editable=False,
+        help_text=_("The number of comments on the issue."),
+        db_comment="Denormalized number of comments on the issue.",
+    )
+    unread_comments_count = models.PositiveIntegerField(
+        verbose_name=_("Unread Comments"),
+        default=0,
+        editable=False,
+        help_text=_("The number of unread comments on the issue."),
+        db_comment="Denormalized number of unread comments on the issue.",
+    )
+    unanswered_comments_count = models.PositiveIntegerField(
+        verbose_name=_("Unanswered Comments"),
+        default=0,
+        editable=False,
+        help_text=_("The number of unanswered comments on the issue."),
+        db_comment="Denormalized number of unanswered comments on the issue.",
+    )
+    last_activity_at = models.DateTimeField(
+        verbose_name=_("Last Activity"),
+        null=True,
+        blank=True,
+        editable=False,
+        help_text=_("The time of the latest comment on the issue."),
+        db_comment="Creation time of the latest comment on the issue.",
+    )
     uid = models.UUIDField(
         verbose_name=_("UID"),
         default=uuid.uuid4,
@@ -81,23 +118,56 @@ class Issue(TimeStampMixin):
         db_comment="A globally unique identifier for the issue.",
     )
 
+    objects: DataAccessLayerManager = DataAccessLayerManager()
+
     class Meta:
         verbose_name = _("Issue")
         verbose_name_plural = _("Issues")
+        default_manager_name = "objects"
         db_table = "sage_ticket_issue"
+        indexes = [
+            # Agent queue: open issues of a department, newest first.
+            models.Index(
+                fields=["department", "state", "-created_at"],
+                name="issue_dept_state_created_idx",
+                condition=models.Q(is_archive=False),
+            ),
+            # Cross-department queue filtered by state, newest first.
+            models.Index(
+                fields=["state", "-created_at"],
+                name="issue_state_created_idx",
+                condition=models.Q(is_archive=False),
+            ),
+            # Active/archive listings and unread badges.
+            models.Index(
+                fields=["is_archive", "is_read", "-created_at"],
+                name="issue_archive_read_idx",
+            ),
+            # Sorting queues by last activity.
+            models.Index(
+                fields=["-last_activity_at"],
+                name="issue_last_activity_idx",
+            ),
+            # Default changelist ordering and stable keyset pagination.
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="issue_created_id_idx",
+            ),
+        ]
 
     @staticmethod
     def get_valid_states():
         """Get the valid state transitions for an issue."""
-        valid_state = {
-            "new": ["open", "closed"],
-            "open": ["pending", "closed"],
-            "pending": ["hold", "closed"],
-            "hold": ["resolved", "closed"],
-            "resolved": ["closed"],
-            "closed": ["new"],
+        return {
+            source.value: [
+                target.value for target in TicketStateEnum if target in targets
+            ]
+            for source, targets in TRANSITIONS.items()
         }
-        return valid_state
+
+    def can_transition(self, target):
+        """Check whether the issue can move to ``target`` without raising."""
+        return can_transition(self.state, target)
 
     def __repr__(self):
         return f"<Issue(id={self.id}, subject={self.subject}, state={self.state})>"
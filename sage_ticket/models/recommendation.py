@@ -0,0 +1,67 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from sage_ticket.repository.manager import RecommendationDataAccessLayer
+
+
+class TutorialRecommendation(models.Model):
+    """
+    A tutorial recommended alongside another one.
+
+    Stores the top-K most similar published tutorials of each tutorial, by
+    shared tags, text and category, so detail pages read a few indexed rows
+    instead of computing overlaps per request. Rows are recomputed when a
+    tutorial's tags, text, category or publication change, and rebuilt by the
+    `rebuild_recommendations` command.
+    """
+
+    tutorial = models.ForeignKey(
+        "Tutorial",
+        on_delete=models.CASCADE,
+        related_name="recommendations",
+        verbose_name=_("Tutorial"),
+        db_comment="The tutorial the recommendation is shown on.",
+    )
+    recommended = models.ForeignKey(
+        "Tutorial",
+        on_delete=models.CASCADE,
+        related_name="recommended_by",
+        verbose_name=_("Recommended tutorial"),
+        db_comment="The recommended tutorial.",
+    )
+    score = models.FloatField(
+        _("Score"),
+        db_comment="Similarity of the two tutorials, between 0 and 1.",
+    )
+    rank = models.PositiveSmallIntegerField(
+        _("Rank"),
+        db_comment="Position of the recommendation, starting at 1.",
+    )
+
+    objects: RecommendationDataAccessLayer = RecommendationDataAccessLayer()
+
+    class Meta:
+        verbose_name = _("Tutorial Recommendation")
+        verbose_name_plural = _("Tutorial Recommendations")
+        default_manager_name = "objects"
+        db_table = "sage_tutorial_recommendation"
+        db_table_comment = "Precomputed top-K recommendations of tutorials."
+        constraints = [
+            models.UniqueConstraint(
+                fields=["tutorial", "recommended"],
+                name="tutorial_recommendation_uniq",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["tutorial", "rank"], name="tutorial_recommendation_rank_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.tutorial_id} -> {self.recommended_id} ({self.score:.3f})"
+
+    def __repr__(self):
+        return (
+            f"<TutorialRecommendation: {self.tutorial_id} -> {self.recommended_id}>"
+        )
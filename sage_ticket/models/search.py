@@ -0,0 +1,78 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from sage_ticket.repository.manager import SearchDocumentDataAccessLayer
+from sage_ticket.search import PortableSearchVectorField
+
+
+class TutorialSearchDocument(models.Model):
+    """
+    Search document of a tutorial in one language.
+
+    Holds the plain text of the tutorial's title, summary and description and,
+    on PostgreSQL, the precomputed weighted search vector backed by a GIN
+    index. Rows are rebuilt whenever the tutorial's searchable fields change.
+    """
+
+    tutorial = models.ForeignKey(
+        "Tutorial",
+        on_delete=models.CASCADE,
+        related_name="search_documents",
+        verbose_name=_("Tutorial"),
+        help_text=_("The tutorial this search document belongs to."),
+        db_comment="The tutorial this search document belongs to.",
+    )
+    language = models.CharField(
+        _("Language"),
+        max_length=15,
+        help_text=_("The language of the indexed content."),
+        db_comment="The language code of the indexed content.",
+    )
+    config = models.CharField(
+        _("Search Configuration"),
+        max_length=63,
+        help_text=_("The text search configuration used for the language."),
+        db_comment="The PostgreSQL text search configuration of the language.",
+    )
+    title = models.TextField(
+        _("Title"),
+        blank=True,
+        db_comment="Plain text title of the tutorial.",
+    )
+    summary = models.TextField(
+        _("Summary"),
+        blank=True,
+        db_comment="Plain text summary of the tutorial.",
+    )
+    body = models.TextField(
+        _("Body"),
+        blank=True,
+        db_comment="Plain text description of the tutorial, without HTML.",
+    )
+    vector = PortableSearchVectorField(
+        _("Search Vector"),
+        null=True,
+        editable=False,
+        db_comment="Weighted search vector of title, summary and body.",
+    )
+
+    objects: SearchDocumentDataAccessLayer = SearchDocumentDataAccessLayer()
+
+    class Meta:
+        verbose_name = _("Tutorial Search Document")
+        verbose_name_plural = _("Tutorial Search Documents")
+        default_manager_name = "objects"
+        db_table = "sage_tutorial_search"
+        db_table_comment = "Per-language search documents of tutorials."
+        constraints = [
+            models.UniqueConstraint(
+                fields=["tutorial", "language"],
+                name="tutorial_search_language_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.title} ({self.language})"
+
+    def __repr__(self):
+        return f"<TutorialSearchDocument: {self.tutorial_id} ({self.language})>"
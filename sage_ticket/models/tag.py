@@ -24,6 +24,23 @@ class TutorialTag(TitleSlugMixin, TimeStampMixin):
         ),
     )
 
+    tutorials_count = models.PositiveIntegerField(
+        _("Tutorials Count"),
+        default=0,
+        editable=False,
+        help_text=_("Number of tutorials using this tag."),
+        db_comment="Denormalized number of tutorials using the tag.",
+    )
+
+    last_used_at = models.DateTimeField(
+        _("Last Used At"),
+        null=True,
+        blank=True,
+        editable=False,
+        help_text=_("Creation time of the newest tutorial using this tag."),
+        db_comment="Creation time of the newest tutorial using the tag.",
+    )
+
     objects: TagDataAccessLayer = TagDataAccessLayer()
 
     class Meta:
@@ -36,9 +53,58 @@ class TutorialTag(TitleSlugMixin, TimeStampMixin):
         default_manager_name = "objects"
         db_table = "sage_tutorial_tag"
         db_table_comment = "Table for preserving blog tutorial tags"
+        indexes = [
+            models.Index(fields=["-tutorials_count"], name="tag_tutorials_count_idx"),
+            models.Index(fields=["-last_used_at"], name="tag_last_used_idx"),
+        ]
 
     def __str__(self):
         return str(self.title)
 
     def __repr__(self):
         return f"<Tutorial Tag: {self.title}>"
+
+
+class TutorialTagUsage(models.Model):
+    """
+    Number of tutorials created on a day that use a tag.
+
+    A materialized rollup of the tutorial-tag relation: trend queries sum a
+    few rows per tag instead of joining every tutorial. Rows are refreshed
+    when tags are added to or removed from tutorials, and rebuilt by the
+    `compact_tag_usage` command.
+    """
+
+    tag = models.ForeignKey(
+        TutorialTag,
+        on_delete=models.CASCADE,
+        related_name="usage",
+        verbose_name=_("Tag"),
+        db_comment="The tag being counted.",
+    )
+    day = models.DateField(
+        _("Day"),
+        db_comment="Creation day of the counted tutorials.",
+    )
+    count = models.PositiveIntegerField(
+        _("Count"),
+        default=0,
+        db_comment="Number of tutorials created on the day that use the tag.",
+    )
+
+    objects = models.Manager()
+
+    class Meta:
+        verbose_name = _("Tag Usage")
+        verbose_name_plural = _("Tag Usage")
+        db_table = "sage_tutorial_tag_usage"
+        db_table_comment = "Per-day usage rollup of tutorial tags."
+        constraints = [
+            models.UniqueConstraint(fields=["tag", "day"], name="tag_usage_day_uniq"),
+        ]
+        indexes = [
+            models.Index(fields=["day", "tag"], name="tag_usage_day_tag_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.tag_id} {self.day}: {self.count}"
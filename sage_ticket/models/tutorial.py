@@ -1,6 +1,9 @@
-from django.db import models
+import functools
+
+from django.db import models, transaction
 from django.urls import reverse
 from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -16,13 +19,27 @@ try:
     import readtime
 except ImportError:
     raise ImportError("Install `readtime` package. Run `pip install readtime` ")
+from modeltranslation import settings as mt_settings
+from modeltranslation.utils import build_localized_fieldname
 from polymorphic.models import PolymorphicModel
 
 from sage_tools.mixins.models.abstract import PictureOperationAbstract
 from sage_tools.mixins.models.base import TimeStampMixin, TitleSlugDescriptionMixin
 
+from sage_ticket.recommendation import get_recommendation_settings
 from sage_ticket.repository.manager import TutorialDataAccessLayer
 
+from .search import TutorialSearchDocument
+
+
+@functools.lru_cache(maxsize=None)
+def _get_tracked_fields(model):
+    names = {description for description, _ in model.get_reading_time_fields()}
+    for _, *columns in model.get_search_fields():
+        names.update(columns)
+    names.update(model.get_navigation_fields())
+    return frozenset(names)
+
 
 class Tutorial(
     PolymorphicModel,
@@ -67,6 +84,17 @@ class Tutorial(
         help_text=_("The date and time when the tutorial was published."),
     )
 
+    reading_time = models.PositiveIntegerField(
+        _("Reading Time"),
+        default=0,
+        editable=False,
+        help_text=_("Estimated reading time of the description in minutes."),
+        db_comment=(
+            "Estimated reading time of the description in minutes, recomputed "
+            "whenever the description changes."
+        ),
+    )
+
     author = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         verbose_name=_("Author"),
@@ -109,6 +137,36 @@ class Tutorial(
         help_text=_("Select tutorials related to this product."),
     )
 
+    prev_tutorial = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+        verbose_name=_("Previous tutorial"),
+        help_text=_("The previously published tutorial of the same category."),
+        db_comment=(
+            "The published tutorial preceding this one in its category by "
+            "publication date, maintained on publish."
+        ),
+    )
+
+    next_tutorial = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+        verbose_name=_("Next tutorial"),
+        help_text=_("The next published tutorial of the same category."),
+        db_comment=(
+            "The published tutorial following this one in its category by "
+            "publication date, maintained on publish."
+        ),
+    )
+
     objects: TutorialDataAccessLayer = TutorialDataAccessLayer()
 
     class Meta:
@@ -124,21 +182,203 @@ class Tutorial(
         default_manager_name = "objects"
         db_table = "sage_tutorial"
         db_table_comment = "Table for preserving blog tutorials"
+        indexes = [
+            models.Index(
+                fields=["category", "is_published", "published_at"],
+                name="tutorial_navigation_idx",
+            ),
+        ]
 
-    @property
-    def reading_time(self):
+    navigation_link_fields = ("prev_tutorial", "next_tutorial")
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = instance.get_tracked_values()
+        return instance
+
+    @classmethod
+    def get_reading_time_fields(cls):
+        """
+        Pairs each description column with the column storing its reading time.
+
+        When `description` and `reading_time` are registered for translation,
+        one pair is returned per language (e.g. `description_en` and
+        `reading_time_en`); otherwise the base columns are used.
         """
-        Estimate the reading time of the description using the `readtime` library.
+        pairs = []
+        for language in mt_settings.AVAILABLE_LANGUAGES:
+            description = build_localized_fieldname("description", language)
+            reading_time = build_localized_fieldname("reading_time", language)
+            try:
+                cls._meta.get_field(description)
+                cls._meta.get_field(reading_time)
+            except FieldDoesNotExist:
+                continue
+            pairs.append((description, reading_time))
+        return pairs or [("description", "reading_time")]
+
+    @classmethod
+    def get_search_fields(cls):
+        """
+        Lists the searchable columns of every language as
+        `(language, title, summary, description)` tuples.
+
+        The default language comes first. Without translations a single tuple
+        with the base columns is returned.
+        """
+        languages = [mt_settings.DEFAULT_LANGUAGE] + [
+            language
+            for language in mt_settings.AVAILABLE_LANGUAGES
+            if language != mt_settings.DEFAULT_LANGUAGE
+        ]
+        fields = []
+        for language in languages:
+            columns = tuple(
+                build_localized_fieldname(name, language)
+                for name in ("title", "summary", "description")
+            )
+            try:
+                for column in columns:
+                    cls._meta.get_field(column)
+            except FieldDoesNotExist:
+                continue
+            fields.append((language, *columns))
+        return fields or [
+            (mt_settings.DEFAULT_LANGUAGE, "title", "summary", "description")
+        ]
+
+    @classmethod
+    def get_navigation_fields(cls):
+        """
+        Returns the columns deciding the position of a tutorial in the
+        next/previous navigation of its category.
+        """
+        return ("category_id", "is_published", "published_at")
+
+    @classmethod
+    def get_tracked_fields(cls):
+        """
+        Returns the columns whose changes trigger derived data to be rebuilt.
+
+        Computed once per class, as it is read for every loaded row.
+        """
+        return _get_tracked_fields(cls)
+
+    def get_tracked_values(self):
+        return {
+            name: self.__dict__[name]
+            for name in self.get_tracked_fields()
+            if name in self.__dict__
+        }
+
+    def has_changed(self, names):
+        """
+        Checks whether any of the given loaded columns changed since the
+        instance was read from the database.
+        """
+        loaded = getattr(self, "_loaded_values", {})
+        return any(
+            name in self.__dict__
+            and (name not in loaded or loaded[name] != self.__dict__[name])
+            for name in names
+        )
+
+    @staticmethod
+    def estimate_reading_time(text):
+        """
+        Estimate the reading time of a text using the `readtime` library.
 
         Returns:
-            int: Estimated reading time in minutes.
-        """
-        result = readtime.of_text(self.description)
-        # Extracting minutes from the result text (e.g., "1 min read" -> 1)
-        minutes = int(
-            result.text.split()[0]
-        )  # assuming the format is always "X min read"
-        return minutes
+            int: Estimated reading time in minutes, or None for an empty text.
+        """
+        if not text:
+            return None
+        return readtime.of_text(text).minutes
+
+    def update_reading_time(self, force=False):
+        """
+        Recompute the stored reading time of every description that changed
+        since the instance was loaded.
+
+        Returns:
+            list: The names of the updated reading time fields.
+        """
+        updated = []
+        for description, reading_time in self.get_reading_time_fields():
+            if description not in self.__dict__:
+                continue
+            if not force and not self.has_changed([description]):
+                continue
+            minutes = self.estimate_reading_time(self.__dict__[description])
+            if reading_time == "reading_time":
+                minutes = minutes or 0
+            self.__dict__[reading_time] = minutes
+            updated.append(reading_time)
+        return updated
+
+    def save(self, *args, **kwargs):
+        # A loaded instance whose pk was cleared is saved as a copy.
+        adding = self._state.adding or self.pk is None or kwargs.get("force_insert")
+        search_columns = [
+            column for _, *columns in self.get_search_fields() for column in columns
+        ]
+        search_changed = adding or self.has_changed(search_columns)
+        navigation_changed = adding or self.has_changed(self.get_navigation_fields())
+        recommendations_changed = adding or self.has_changed(
+            [*search_columns, "category_id", "is_published"]
+        )
+        categories = {
+            self.category_id,
+            getattr(self, "_loaded_values", {}).get("category_id"),
+        } - {None}
+
+        updated = self.update_reading_time(force=adding)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and updated:
+            kwargs["update_fields"] = {*update_fields, *updated}
+        # Navigation links are computed for the whole category at once. A save
+        # writing them stores the values this instance was loaded with, which
+        # may be stale, so they are recomputed afterwards.
+        link_names = {
+            name
+            for link in self.navigation_link_fields
+            for name in (link, f"{link}_id")
+        }
+        writes_links = update_fields is None or not link_names.isdisjoint(
+            update_fields
+        )
+
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
+            if search_changed:
+                TutorialSearchDocument.objects.sync([self])
+            if navigation_changed or writes_links:
+                Tutorial.objects.db_manager(self._state.db).filter(
+                    category_id__in=categories
+                ).refresh_navigation()
+                # Reloaded from the database on access.
+                for name in self.navigation_link_fields:
+                    self.__dict__.pop(f"{name}_id", None)
+                    self._state.fields_cache.pop(name, None)
+            if (
+                recommendations_changed
+                and get_recommendation_settings()["INCREMENTAL"]
+            ):
+                transaction.on_commit(
+                    self.refresh_recommendations, using=self._state.db
+                )
+
+        self._loaded_values = self.get_tracked_values()
+
+    def refresh_recommendations(self):
+        """
+        Recomputes the recommendations of this tutorial and of the tutorials
+        similar to it.
+        """
+        Tutorial.objects.db_manager(self._state.db).filter(
+            pk=self.pk
+        ).refresh_recommendations()
 
     def __str__(self):
         return str(self.title)
@@ -0,0 +1,7 @@
+from .config import get_recommendation_settings
+from .engine import RecommendationCorpus
+
+__all__ = [
+    "get_recommendation_settings",
+    "RecommendationCorpus",
+]
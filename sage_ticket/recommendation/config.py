@@ -0,0 +1,26 @@
+from django.conf import settings
+
+DEFAULTS = {
+    "TOP_K": 10,
+    "INCREMENTAL": True,
+    "MAX_CANDIDATES": 500,
+    "MAX_DF": 0.5,
+    "WEIGHTS": {"tags": 0.5, "text": 0.35, "category": 0.15},
+}
+"""Defaults of the `SAGE_TICKET_RECOMMENDATIONS` setting."""
+
+
+def get_recommendation_settings():
+    """
+    Returns the `SAGE_TICKET_RECOMMENDATIONS` setting merged with `DEFAULTS`.
+
+    `TOP_K` is the number of recommendations stored per tutorial and
+    `WEIGHTS` the share of tag, text and category similarity in their score.
+    Terms used by more than `MAX_DF` of the tutorials are ignored.
+    `INCREMENTAL` recomputes the recommendations of changed tutorials on
+    commit, scoring at most `MAX_CANDIDATES` tutorials sharing a tag or the
+    category with them.
+    """
+    config = {**DEFAULTS, **getattr(settings, "SAGE_TICKET_RECOMMENDATIONS", {})}
+    config["WEIGHTS"] = {**DEFAULTS["WEIGHTS"], **config["WEIGHTS"]}
+    return config
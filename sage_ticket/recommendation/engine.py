@@ -0,0 +1,141 @@
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+
+TOKEN_RE = re.compile(r"\w{3,}")
+
+
+def tokenize(text):
+    """
+    Splits plain text into lowercase terms of at least three characters.
+    """
+    return TOKEN_RE.findall(text.lower())
+
+
+def normalize(vector, weight):
+    """
+    Scales a sparse vector to a length of ``sqrt(weight)``, so the dot product
+    of two normalized blocks is their cosine similarity times `weight`.
+    """
+    norm = math.sqrt(sum(value * value for value in vector.values()))
+    if not norm:
+        return {}
+    scale = math.sqrt(weight) / norm
+    return {key: value * scale for key, value in vector.items()}
+
+
+class RecommendationCorpus:
+    """
+    Sparse feature vectors of a set of tutorials and their similarities.
+
+    Each tutorial is a vector of TF-IDF weighted tags and text terms, both
+    blocks normalized separately, so the dot product of two vectors is the
+    weighted sum of their tag and text cosine similarities. Sharing the
+    category adds its weight on top. Dot products are accumulated over an
+    inverted index, so only tutorials with a feature in common are compared.
+    """
+
+    def __init__(self, tutorials, weights, max_df):
+        """
+        `tutorials` maps primary keys, newest first, to
+        ``(category_id, tag_ids, text)`` tuples.
+        """
+        self.weights = weights
+        self.categories = {}
+        self.members = defaultdict(list)
+        tags = {}
+        terms = {}
+        for pk, (category_id, tag_ids, text) in tutorials.items():
+            self.categories[pk] = category_id
+            self.members[category_id].append(pk)
+            tags[pk] = set(tag_ids)
+            terms[pk] = Counter(tokenize(text))
+
+        size = len(tutorials)
+        limit = max(max_df * size, 2)
+        tag_idf = self.get_idf(tags.values(), size, size)
+        term_idf = self.get_idf(terms.values(), size, limit)
+
+        self.vectors = {}
+        for pk in tutorials:
+            tag_block = {
+                ("tag", tag): tag_idf[tag] for tag in tags[pk] if tag in tag_idf
+            }
+            text_block = {
+                ("term", term): (1 + math.log(count)) * term_idf[term]
+                for term, count in terms[pk].items()
+                if term in term_idf
+            }
+            self.vectors[pk] = {
+                **normalize(tag_block, weights["tags"]),
+                **normalize(text_block, weights["text"]),
+            }
+
+        self.index = defaultdict(list)
+        for pk, vector in self.vectors.items():
+            for feature, value in vector.items():
+                self.index[feature].append((pk, value))
+
+    @staticmethod
+    def get_idf(documents, size, limit):
+        """
+        Returns the smoothed inverse document frequency of every feature used
+        by at most `limit` documents.
+        """
+        frequency = Counter(feature for document in documents for feature in document)
+        return {
+            feature: math.log((1 + size) / (1 + count)) + 1
+            for feature, count in frequency.items()
+            if count <= limit
+        }
+
+    def __contains__(self, pk):
+        return pk in self.vectors
+
+    def score(self, pk, other):
+        """
+        Returns the similarity of two tutorials of the corpus.
+        """
+        vector, other_vector = self.vectors[pk], self.vectors[other]
+        if len(other_vector) < len(vector):
+            vector, other_vector = other_vector, vector
+        score = sum(
+            value * other_vector[feature]
+            for feature, value in vector.items()
+            if feature in other_vector
+        )
+        if self.categories[pk] == self.categories[other]:
+            score += self.weights["category"]
+        return score
+
+    def neighbours(self, pk, top_k):
+        """
+        Returns the `top_k` most similar tutorials as ``(pk, score)`` pairs,
+        best first.
+
+        Tutorials of the same category without another feature in common are
+        only considered, newest first, when fewer than `top_k` are found.
+        """
+        scores = defaultdict(float)
+        for feature, value in self.vectors[pk].items():
+            for other, other_value in self.index[feature]:
+                scores[other] += value * other_value
+        scores.pop(pk, None)
+
+        category_id = self.categories[pk]
+        for other in scores:
+            if self.categories[other] == category_id:
+                scores[other] += self.weights["category"]
+        if len(scores) < top_k and self.weights["category"] > 0:
+            for other in self.members[category_id]:
+                if len(scores) >= top_k:
+                    break
+                if other != pk and other not in scores:
+                    scores[other] = self.weights["category"]
+
+        return heapq.nlargest(
+            top_k,
+            ((other, score) for other, score in scores.items() if score > 0),
+            key=lambda item: (item[1], item[0]),
+        )
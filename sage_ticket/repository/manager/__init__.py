@@ -1,3 +1,8 @@
 from .category import CategoryDataAccessLayer
 from .tutorial import TutorialDataAccessLayer
 from .tag import TagDataAccessLayer
+from .ticketing import DataAccessLayerManager
+from .comment import CommentDataAccessLayer
+from .search import SearchDocumentDataAccessLayer
+from .faq import FaqCategoryDataAccessLayer
+from .recommendation import RecommendationDataAccessLayer
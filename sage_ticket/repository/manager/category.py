@@ -1,13 +1,23 @@
 from django.db.models import Manager
 
+from sage_ticket.utils.cache import CachedManagerMixin
+
 from ..queryset import CategoryQuerySet
 
 
-class CategoryDataAccessLayer(Manager):
+class CategoryDataAccessLayer(CachedManagerMixin, Manager):
     """
     Tutorial Data Access Layer
     """
 
+    cached_methods = (
+        "annotate_total_tutorials",
+        "annotate_published_tutorials_count",
+        "filter_published",
+        "filter_recent_categories",
+    )
+    cache_dependencies = ("sage_ticket.Tutorial",)
+
     def get_queryset(self):
         """
         Override the default get_queryset method to return a TutorialQuerySet instance.
@@ -28,6 +38,12 @@ class CategoryDataAccessLayer(Manager):
         """
         return self.get_queryset().annotate_total_tutorials()
 
+    def annotate_published_tutorials_count(self):
+        """
+        Annotates each category with the number of its published tutorials.
+        """
+        return self.get_queryset().annotate_published_tutorials_count()
+
     def filter_published(self, is_published=True):
         """
         Filters categories based on their active status.
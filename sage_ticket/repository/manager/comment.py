@@ -0,0 +1,35 @@
+from django.db.models import Manager
+
+from ..queryset import CommentQuerySet
+
+
+class CommentDataAccessLayer(Manager):
+    """
+    Comment Data Access Layer
+    """
+
+    def get_queryset(self):
+        """
+        Override the default get_queryset method to return a CommentQuerySet
+        instance.
+        """
+        return CommentQuerySet(self.model, using=self._db)
+
+    def filter_unread(self, is_read: bool = False):
+        """
+        Filters comments based on their read status.
+        """
+        return self.get_queryset().filter_unread(is_read)
+
+    def thread(self, issue):
+        """
+        Loads the whole comment thread of an issue in a single query and
+        returns its root comments with their ``replies`` populated.
+        """
+        return self.get_queryset().thread(issue)
+
+    def subtree(self, root, max_depth=None, use_cte=None):
+        """
+        Loads the replies of a comment down to ``max_depth`` levels.
+        """
+        return self.get_queryset().subtree(root, max_depth=max_depth, use_cte=use_cte)
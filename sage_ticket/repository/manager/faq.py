@@ -0,0 +1,32 @@
+from django.db.models import Manager
+
+from sage_ticket.utils.cache import CachedManagerMixin
+
+from ..queryset import FaqCategoryQuerySet
+
+
+class FaqCategoryDataAccessLayer(CachedManagerMixin, Manager):
+    """
+    FAQ Category Data Access Layer
+    """
+
+    cached_methods = ("annotate_total_faqs", "join_faqs")
+    cache_dependencies = ("sage_ticket.Faq",)
+
+    def get_queryset(self):
+        """
+        Returns a FaqCategoryQuerySet instance.
+        """
+        return FaqCategoryQuerySet(self.model, using=self._db)
+
+    def annotate_total_faqs(self):
+        """
+        Annotates each category with the number of its FAQs.
+        """
+        return self.get_queryset().annotate_total_faqs()
+
+    def join_faqs(self, is_popular=None):
+        """
+        Prefetches the FAQs of each category.
+        """
+        return self.get_queryset().join_faqs(is_popular)
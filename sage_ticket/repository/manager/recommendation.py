@@ -0,0 +1,28 @@
+from django.db.models import Manager
+
+from ..queryset import RecommendationQuerySet
+
+
+class RecommendationDataAccessLayer(Manager):
+    """
+    Tutorial Recommendation Data Access Layer
+    """
+
+    def get_queryset(self):
+        """
+        Override the default get_queryset method to return a
+        RecommendationQuerySet instance.
+        """
+        return RecommendationQuerySet(self.model, using=self._db)
+
+    def rebuild(self, top_k=None, batch_size=500):
+        """
+        Recomputes the recommendations of every published tutorial.
+        """
+        return self.get_queryset().rebuild(top_k=top_k, batch_size=batch_size)
+
+    def refresh_for(self, tutorial_ids, top_k=None):
+        """
+        Recomputes the recommendations of the given tutorials.
+        """
+        return self.get_queryset().refresh_for(tutorial_ids, top_k=top_k)
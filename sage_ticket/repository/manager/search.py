@@ -0,0 +1,34 @@
+from django.db.models import Manager
+
+from ..queryset import SearchDocumentQuerySet
+
+
+class SearchDocumentDataAccessLayer(Manager):
+    """
+    Tutorial Search Document Data Access Layer
+    """
+
+    def get_queryset(self):
+        """
+        Override the default get_queryset method to return a
+        SearchDocumentQuerySet instance.
+        """
+        return SearchDocumentQuerySet(self.model, using=self._db)
+
+    def filter_language(self, language):
+        """
+        Filters documents of the given language.
+        """
+        return self.get_queryset().filter_language(language)
+
+    def sync(self, tutorials, batch_size=500):
+        """
+        Rebuilds the search documents of the given tutorials.
+        """
+        return self.get_queryset().sync(tutorials, batch_size=batch_size)
+
+    def update_vectors(self):
+        """
+        Recomputes the search vectors of every document on PostgreSQL.
+        """
+        return self.get_queryset().update_vectors()
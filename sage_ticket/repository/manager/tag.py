@@ -2,14 +2,25 @@ from typing import Any, Optional
 
 from django.db.models import Manager, QuerySet
 
+from sage_ticket.utils.cache import CachedManagerMixin
+
 from ..queryset import TagQuerySet
 
 
-class TagDataAccessLayer(Manager):
+class TagDataAccessLayer(CachedManagerMixin, Manager):
     """
     Tutorial Data Access Layer
     """
 
+    cached_methods = (
+        "filter_recent_tags",
+        "filter_trend_tags",
+        "annotate_total_tutorials",
+        "sort_by_popularity",
+        "filter_published",
+    )
+    cache_dependencies = ("sage_ticket.Tutorial", "sage_ticket.Tutorial.tags")
+
     def get_queryset(self):
         """
         Override the default get_queryset method to return a TutorialQuerySet instance.
@@ -75,6 +86,12 @@ class TagDataAccessLayer(Manager):
         """
         return self.get_queryset().filter_trend_tags(days_ago, min_count, limit)
 
+    def refresh_usage(self, days=None) -> int:
+        """
+        Recomputes the per-day usage rollup and the tutorial totals of all tags.
+        """
+        return self.get_queryset().refresh_usage(days)
+
     def annotate_total_tutorials(self) -> QuerySet:
         """
         Annotate tags with the total number of associated tutorials.
@@ -1,11 +1,93 @@
+from typing import Any, Optional
+
 from django.db.models import Manager
 
 from ..queryset import TicketQueryAccess
 
 
 class DataAccessLayerManager(Manager):
+    """
+    Issue Data Access Layer
+    """
+
     def get_queryset(self):
+        """
+        Override the default get_queryset method to return a TicketQueryAccess
+        instance.
+        """
         return TicketQueryAccess(self.model, using=self._db)
 
+    def get_actives(self):
+        """
+        Returns issues that have not been archived.
+        """
+        return self.get_queryset().get_actives()
+
+    def get_archive(self):
+        """
+        Returns archived issues.
+        """
+        return self.get_queryset().get_archive()
+
     def find_publisher(self, publisher):
+        """
+        Filters issues raised by the given user.
+        """
         return self.get_queryset().find_publisher(publisher)
+
+    def queue(
+        self,
+        state=None,
+        severity=None,
+        department=None,
+        assignee=None,
+        include_archived: bool = False,
+    ):
+        """
+        Builds an agent queue filtered by state, severity, department and
+        assignee, ordered newest first.
+        """
+        return self.get_queryset().queue(
+            state=state,
+            severity=severity,
+            department=department,
+            assignee=assignee,
+            include_archived=include_archived,
+        )
+
+    def seek(self, after: Optional[Any] = None, limit: int = 25):
+        """
+        Returns a page of issues using keyset pagination on (created_at, id).
+        """
+        return self.get_queryset().seek(after=after, limit=limit)
+
+    def bulk_transition(self, target, dry_run: bool = False):
+        """
+        Moves every issue allowed by the state machine to ``target`` and
+        reports the rejected ones.
+        """
+        return self.get_queryset().bulk_transition(target, dry_run=dry_run)
+
+    def filter_unanswered(self):
+        """
+        Filters issues that have at least one unanswered comment.
+        """
+        return self.get_queryset().filter_unanswered()
+
+    def order_by_activity(self):
+        """
+        Orders issues by their latest comment, most recent first.
+        """
+        return self.get_queryset().order_by_activity()
+
+    def bump_comment_counters(self, comments):
+        """
+        Adds newly created comments to the counters of their issues.
+        """
+        return self.get_queryset().bump_comment_counters(comments)
+
+    def refresh_comment_counters(self):
+        """
+        Recomputes the comment counters of every issue from the comments table.
+        """
+        return self.get_queryset().refresh_comment_counters()
@@ -17,6 +17,18 @@ class TutorialDataAccessLayer(PolymorphicManager):
         """
         return TutorialQuerySet(self.model, using=self._db)
 
+    def base_only(self, *fields):
+        """
+        Returns plain `Tutorial` instances in a single query.
+        """
+        return self.get_queryset().base_only(*fields)
+
+    def select_subclasses(self):
+        """
+        Returns subclass instances loaded in a single query.
+        """
+        return self.get_queryset().select_subclasses()
+
     def filter_actives(self, is_published=True):
         """
         Returns a queryset of tutorials filtered by their active status.
@@ -61,6 +73,32 @@ class TutorialDataAccessLayer(PolymorphicManager):
         """
         return self.get_queryset().annotate_total_tags()
 
+    def annotate_tag_titles(self, delimiter=", "):
+        """
+        Annotates each tutorial with the titles of its tags joined into a single
+        string.
+        """
+        return self.get_queryset().annotate_tag_titles(delimiter)
+
+    def annotate_reading_time(self):
+        """
+        Annotates each tutorial with the stored reading time of the active
+        language.
+        """
+        return self.get_queryset().annotate_reading_time()
+
+    def refresh_reading_time(self, batch_size=500):
+        """
+        Recomputes the stored reading time of every tutorial.
+        """
+        return self.get_queryset().refresh_reading_time(batch_size)
+
+    def refresh_search_documents(self, batch_size=500):
+        """
+        Rebuilds the per-language search documents of every tutorial.
+        """
+        return self.get_queryset().refresh_search_documents(batch_size)
+
     def annotate_published_since(self):
         """
         Annotates each tutorial in the queryset with the number of days since it was
@@ -79,7 +117,9 @@ class TutorialDataAccessLayer(PolymorphicManager):
         """
         Performs a full-text search on 'title' and 'description' fields of the tutorials.
         This method is optimized for finding complete words or phrases, not partial
-        substrings.
+        substrings. The database's search backend matches the stored search
+        documents of the active language and annotates each tutorial with its
+        `rank`.
         """
         return self.get_queryset().full_text_search(search_query)
 
@@ -93,21 +133,32 @@ class TutorialDataAccessLayer(PolymorphicManager):
 
     def trigram_similarity_search(self, search_query):
         """
-        Performs a search using trigram similarity on 'title' and 'description' fields
-        of the tutorials.
+        Performs a search using trigram similarity on 'title', 'summary' and
+        'description' fields of the tutorials.
         This method supports partial word matches and is more linguistically aware than
-        a simple substring search, but it requires TutorialgreSQL with pg_trgm extension.
+        a simple substring search, but it requires PostgreSQL with pg_trgm extension.
+        On PostgreSQL rows are selected with the indexable `%` and `%>` operators.
         """
         return self.get_queryset().trigram_similarity_search(search_query)
 
-    def heavy_search(self, search_query):
+    def ranked_search(self, search_query, trigram_candidates=500):
+        """
+        Runs full-text, substring and trigram matching in a single query and
+        orders the matches by relevance, capping the trigram candidates scored.
+        """
+        return self.get_queryset().ranked_search(search_query, trigram_candidates)
+
+    def heavy_search(self, search_query, ranked=False, trigram_candidates=500):
         """
         Combines full-text search, substring search, and trigram similarity search to
         provide a comprehensive search experience. The method first tries a full-text
         search. If it yields no results, it falls back to a substring search. If
         available and suitable, it also uses trigram similarity for nuanced matching.
+        With `ranked=True` everything runs as a single query.
         """
-        return self.get_queryset().heavy_search(search_query)
+        return self.get_queryset().heavy_search(
+            search_query, ranked=ranked, trigram_candidates=trigram_candidates
+        )
 
     def join_category(self):
         return self.get_queryset().join_category()
@@ -118,12 +169,24 @@ class TutorialDataAccessLayer(PolymorphicManager):
     def annotate_next_and_prev(self):
         """
         Annotates each tutorial in the queryset with slugs of the next and previous tutorials
-        in the same category.
-
-        This method uses subqueries to determine the 'slug' of the
-        next and previous tutorials based on their primary key (pk)
-        within the same category. The result is the addition
-        of two new fields to each tutorial object in the queryset:
-        `next_tutorial_slug` and `prev_tutorial_slug`.
+        in the same category, read from the precomputed navigation links.
         """
         return self.get_queryset().annotate_next_and_prev()
+
+    def join_navigation(self):
+        """
+        Selects the next and previous tutorials along with each tutorial.
+        """
+        return self.get_queryset().join_navigation()
+
+    def filter_recommended_for(self, tutorial):
+        """
+        Filters the precomputed recommendations of a tutorial, best first.
+        """
+        return self.get_queryset().filter_recommended_for(tutorial)
+
+    def refresh_navigation(self, batch_size=500):
+        """
+        Recomputes the next/previous links of every category.
+        """
+        return self.get_queryset().refresh_navigation(batch_size)
@@ -1,12 +1,21 @@
-from .ticket import TicketQueryAccess
+from .ticket import BulkTransitionResult, TicketQueryAccess
+from .comment import CommentQuerySet
 from .category import CategoryQuerySet
 from .tutorial import TutorialQuerySet
 from .tag import TagQuerySet
+from .search import SearchDocumentQuerySet
+from .faq import FaqCategoryQuerySet
+from .recommendation import RecommendationQuerySet
 
 
 __all__ = [
+    "BulkTransitionResult",
     "TicketQueryAccess",
+    "CommentQuerySet",
     "CategoryQuerySet",
     "TutorialQuerySet",
     "TagQuerySet",
+    "SearchDocumentQuerySet",
+    "FaqCategoryQuerySet",
+    "RecommendationQuerySet",
 ]
@@ -19,6 +19,23 @@ class CategoryQuerySet(QuerySet):
         qs = published_tutorials.annotate(total_tutorials=Count("tutorials"))
         return qs
 
+    def annotate_published_tutorials_count(self):
+        """
+        Annotates each category with the number of its published tutorials.
+
+        Unlike `annotate_total_tutorials`, categories without published
+        tutorials are kept and annotated with zero, which makes the value
+        usable for display and ordering in listings. Calling it again on an
+        annotated queryset is a no-op.
+        """
+        if "published_tutorials_count" in self.query.annotations:
+            return self
+        return self.annotate(
+            published_tutorials_count=Count(
+                "tutorials", filter=Q(tutorials__is_published=True)
+            )
+        )
+
     def filter_published(self, is_published: bool = True):
         """
         Filters categories based on their published status.
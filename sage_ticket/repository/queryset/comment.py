@@ -0,0 +1,170 @@
+from typing import Any, List, Optional
+
+from django.db import connections, transaction
+from django.db.models import QuerySet
+from django.db.models.expressions import RawSQL
+
+
+class CommentQuerySet(QuerySet):
+    """
+    A custom QuerySet for the Comment model that keeps the denormalized comment
+    counters of the related issues in sync and loads reply threads without
+    walking ``comment.children`` level by level.
+
+    ``bulk_create`` and ``delete`` update the counters like ``Comment.save``
+    and ``Comment.delete`` do; ``update`` does not, so run
+    ``refresh_comment_counters`` on the affected issues after it.
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """
+        Creates the comments and updates the counters of their issues in the
+        same transaction.
+        """
+        issue_model = self.model._meta.get_field("issue").related_model
+        with transaction.atomic(using=self.db):
+            created = super().bulk_create(objs, *args, **kwargs)
+            issue_model.objects.using(self.db).bump_comment_counters(created)
+        return created
+
+    def delete(self):
+        """
+        Deletes the comments and recomputes the counters of their issues in the
+        same transaction.
+        """
+        issue_model = self.model._meta.get_field("issue").related_model
+        with transaction.atomic(using=self.db):
+            issue_ids = list(
+                self.order_by().values_list("issue_id", flat=True).distinct()
+            )
+            deleted = super().delete()
+            issue_model.objects.using(self.db).filter(
+                pk__in=issue_ids
+            ).refresh_comment_counters()
+        return deleted
+
+    def filter_unread(self, is_read: bool = False):
+        """
+        Filters comments based on their read status.
+        """
+        return self.filter(is_read=is_read)
+
+    def thread(self, issue) -> List[Any]:
+        """
+        Loads the whole comment thread of an issue in a single query and
+        returns its root comments.
+
+        Every returned comment has a ``replies`` list and a ``depth`` attribute,
+        so templates can render the tree without touching ``children``.
+
+        Examples:
+            >>> for comment in Comment.objects.thread(issue):
+            ...     render(comment, comment.replies)
+        """
+        comments = (
+            self.filter(issue=issue).select_related("user").order_by("created_at", "pk")
+        )
+        return self.build_tree(comments)
+
+    def subtree(self, root, max_depth: Optional[int] = None, use_cte=None):
+        """
+        Loads the replies of ``root`` down to ``max_depth`` levels and returns
+        ``root`` with its ``replies`` populated.
+
+        On PostgreSQL the subtree is selected with a recursive CTE, so only the
+        requested branch is read. Other backends load the issue thread in one
+        query and prune it in Python.
+
+        Args:
+            root: The comment (instance) whose replies are loaded.
+            max_depth (int, optional): The number of reply levels to load. If
+                None, the whole branch is loaded.
+            use_cte (bool, optional): Force or disable the recursive CTE. If
+                None, it is used on PostgreSQL only.
+        """
+        if max_depth is not None and (not isinstance(max_depth, int) or max_depth < 0):
+            raise ValueError("`max_depth` must be a non-negative integer or None")
+
+        if use_cte is None:
+            use_cte = connections[self.db].vendor == "postgresql"
+
+        if use_cte:
+            comments = self.filter(pk__in=self._subtree_sql(root.pk, max_depth))
+        else:
+            comments = self.filter(issue_id=root.issue_id)
+
+        comments = comments.select_related("user").order_by("created_at", "pk")
+        nodes = {comment.pk: comment for comment in comments}
+        self.build_tree(nodes.values())
+        node = nodes.get(root.pk)
+        if node is None:
+            root.replies = []
+            node = root
+        node.depth = 0
+        self._prune(node, max_depth)
+        return node
+
+    def _subtree_sql(self, root_pk, max_depth):
+        opts = self.model._meta
+        table = connections[self.db].ops.quote_name(opts.db_table)
+        pk_column = opts.pk.column
+        parent_column = opts.get_field("replay").column
+        depth_limit = "" if max_depth is None else "WHERE tree.depth < %s"
+        params = [root_pk] if max_depth is None else [root_pk, max_depth]
+        sql = (
+            f"WITH RECURSIVE tree AS ("
+            f"SELECT c.{pk_column} AS id, 0 AS depth FROM {table} c "
+            f"WHERE c.{pk_column} = %s "
+            f"UNION ALL "
+            f"SELECT c.{pk_column}, tree.depth + 1 FROM {table} c "
+            f"JOIN tree ON c.{parent_column} = tree.id {depth_limit}"
+            f") SELECT id FROM tree"
+        )
+        return RawSQL(sql, params)
+
+    @classmethod
+    def _prune(cls, node, max_depth):
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if max_depth is not None and current.depth >= max_depth:
+                current.replies = []
+                continue
+            for reply in current.replies:
+                reply.depth = current.depth + 1
+                stack.append(reply)
+
+    @staticmethod
+    def build_tree(comments) -> List[Any]:
+        """
+        Links already loaded comments into a tree in O(n) time.
+
+        Each comment receives a ``replies`` list, ordered like the input, and a
+        ``depth`` attribute. Comments whose parent is not in ``comments`` are
+        treated as roots.
+
+        Returns:
+            list: The root comments.
+        """
+        comments = list(comments)
+        nodes = {comment.pk: comment for comment in comments}
+        roots = []
+        for comment in comments:
+            comment.replies = []
+            comment.depth = 0
+
+        for comment in comments:
+            parent = nodes.get(comment.replay_id)
+            if parent is None:
+                roots.append(comment)
+            else:
+                parent.replies.append(comment)
+
+        stack = list(roots)
+        while stack:
+            parent = stack.pop()
+            for reply in parent.replies:
+                reply.depth = parent.depth + 1
+                stack.append(reply)
+
+        return roots
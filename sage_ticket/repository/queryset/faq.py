@@ -0,0 +1,25 @@
+from django.db.models import Count, Prefetch, QuerySet
+
+
+class FaqCategoryQuerySet(QuerySet):
+    """
+    FAQ Category Querysets
+    """
+
+    def annotate_total_faqs(self):
+        """
+        Annotates each category with the number of its FAQs as `total_faqs`.
+        """
+        return self.annotate(total_faqs=Count("faqs"))
+
+    def join_faqs(self, is_popular=None):
+        """
+        Prefetches the FAQs of each category, optionally only the popular
+        (or unpopular) ones, so listings render without a query per category.
+        """
+        from sage_ticket.models import Faq
+
+        faqs = Faq.objects.order_by("pk")
+        if is_popular is not None:
+            faqs = faqs.filter(is_popular=is_popular)
+        return self.prefetch_related(Prefetch("faqs", queryset=faqs))
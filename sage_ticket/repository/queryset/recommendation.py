@@ -0,0 +1,196 @@
+import heapq
+
+from django.db import transaction
+from django.db.models import QuerySet
+
+from modeltranslation import settings as mt_settings
+
+from sage_ticket.recommendation import (
+    RecommendationCorpus,
+    get_recommendation_settings,
+)
+
+
+class RecommendationQuerySet(QuerySet):
+    """
+    A custom QuerySet for tutorial recommendations, computing and storing the
+    top-K recommendations of tutorials.
+    """
+
+    def get_tutorial_model(self):
+        return self.model._meta.get_field("tutorial").related_model
+
+    def get_published_tutorials(self):
+        return (
+            self.get_tutorial_model()
+            .objects.db_manager(self.db)
+            .non_polymorphic()
+            .filter(is_published=True)
+        )
+
+    def load_corpus(self, tutorials):
+        """
+        Builds the recommendation corpus of the given published tutorials
+        from their category, tags and default language search document, in
+        three queries.
+        """
+        config = get_recommendation_settings()
+        tutorial_model = self.get_tutorial_model()
+        through = tutorial_model.tags.through
+        document_model = tutorial_model._meta.get_field(
+            "search_documents"
+        ).related_model
+
+        categories = dict(
+            tutorials.order_by("-published_at", "-pk").values_list(
+                "pk", "category_id"
+            )
+        )
+        pks = tutorials.values("pk")
+        tags = {pk: [] for pk in categories}
+        for tutorial_id, tag_id in (
+            through.objects.using(self.db)
+            .filter(tutorial_id__in=pks)
+            .values_list("tutorial_id", "tutorialtag_id")
+        ):
+            if tutorial_id in tags:
+                tags[tutorial_id].append(tag_id)
+        texts = {
+            tutorial_id: " ".join((title, summary, body))
+            for tutorial_id, title, summary, body in (
+                document_model.objects.using(self.db)
+                .filter(language=mt_settings.DEFAULT_LANGUAGE, tutorial_id__in=pks)
+                .values_list("tutorial_id", "title", "summary", "body")
+            )
+        }
+        return RecommendationCorpus(
+            {
+                pk: (category_id, tags[pk], texts.get(pk, ""))
+                for pk, category_id in categories.items()
+            },
+            weights=config["WEIGHTS"],
+            max_df=config["MAX_DF"],
+        )
+
+    def replace(self, recommendations, batch_size=500):
+        """
+        Replaces the stored recommendations of tutorials, given as a mapping
+        of tutorial primary keys to ``(pk, score)`` pairs, best first.
+
+        Returns:
+            int: The number of recommendations written.
+        """
+        rows = [
+            self.model(
+                tutorial_id=tutorial_id, recommended_id=pk, score=score, rank=rank
+            )
+            for tutorial_id, neighbours in recommendations.items()
+            for rank, (pk, score) in enumerate(neighbours, start=1)
+        ]
+        with transaction.atomic(using=self.db):
+            self.filter(tutorial_id__in=list(recommendations)).delete()
+            self.bulk_create(rows, batch_size=batch_size)
+        return len(rows)
+
+    def rebuild(self, top_k=None, batch_size=500):
+        """
+        Recomputes the recommendations of every published tutorial against
+        all others and drops those of unpublished tutorials.
+
+        Returns:
+            int: The number of recommendations written.
+        """
+        top_k = top_k or get_recommendation_settings()["TOP_K"]
+        corpus = self.load_corpus(self.get_published_tutorials())
+        self.exclude(
+            tutorial__is_published=True, recommended__is_published=True
+        ).delete()
+
+        total = 0
+        batch = {}
+        for pk in corpus.categories:
+            batch[pk] = corpus.neighbours(pk, top_k)
+            if len(batch) >= batch_size:
+                total += self.replace(batch, batch_size=batch_size)
+                batch = {}
+        if batch:
+            total += self.replace(batch, batch_size=batch_size)
+        return total
+
+    def refresh_for(self, tutorial_ids, top_k=None):
+        """
+        Recomputes the recommendations of the given tutorials and merges them
+        into those of the tutorials they are similar to.
+
+        Only tutorials sharing a tag or the category with the changed ones,
+        or recommending them, are scored, and term weights are computed over
+        them; `rebuild` recomputes everything against the whole catalog.
+
+        Returns:
+            int: The number of recommendations written.
+        """
+        config = get_recommendation_settings()
+        top_k = top_k or config["TOP_K"]
+        limit = config["MAX_CANDIDATES"]
+        published = self.get_published_tutorials()
+
+        changed = set(
+            published.filter(pk__in=tutorial_ids).values_list("pk", flat=True)
+        )
+        removed = set(tutorial_ids) - changed
+        if removed:
+            self.filter(tutorial_id__in=removed).delete()
+            self.filter(recommended_id__in=removed).delete()
+        if not changed:
+            return 0
+
+        tutorial_model = self.get_tutorial_model()
+        tag_ids = tutorial_model.tags.through.objects.using(self.db).filter(
+            tutorial_id__in=changed
+        )
+        by_recency = published.order_by("-published_at", "-pk")
+        candidates = (
+            changed
+            | set(
+                by_recency.filter(
+                    tags__in=tag_ids.values("tutorialtag_id")
+                ).values_list("pk", flat=True).distinct()[:limit]
+            )
+            | set(
+                by_recency.filter(
+                    category_id__in=published.filter(pk__in=changed).values(
+                        "category_id"
+                    )
+                ).values_list("pk", flat=True)[:limit]
+            )
+            | set(
+                self.filter(recommended_id__in=changed).values_list(
+                    "tutorial_id", flat=True
+                )
+            )
+        )
+        corpus = self.load_corpus(published.filter(pk__in=candidates))
+
+        recommendations = {pk: corpus.neighbours(pk, top_k) for pk in changed}
+        stored = {}
+        for tutorial_id, pk, score in (
+            self.filter(tutorial_id__in=candidates - changed)
+            .order_by("rank")
+            .values_list("tutorial_id", "recommended_id", "score")
+        ):
+            stored.setdefault(tutorial_id, []).append((pk, score))
+        for tutorial_id in candidates - changed:
+            if tutorial_id not in corpus:
+                continue
+            current = stored.get(tutorial_id, [])
+            scores = {pk: score for pk, score in current if pk not in changed}
+            for pk in changed:
+                score = corpus.score(tutorial_id, pk)
+                if score > 0:
+                    scores[pk] = score
+            neighbours = heapq.nlargest(
+                top_k, scores.items(), key=lambda item: (item[1], item[0])
+            )
+            if neighbours != current:
+                recommendations[tutorial_id] = neighbours
+        return self.replace(recommendations)
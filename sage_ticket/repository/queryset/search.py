@@ -0,0 +1,101 @@
+from html import unescape
+
+from django.contrib.postgres.search import SearchVector
+from django.db import connections, transaction
+from django.db.models import F, QuerySet
+from django.utils.html import strip_tags
+
+from sage_ticket.search import get_search_config
+
+
+def to_plain_text(html):
+    """
+    Converts CKEditor HTML to plain text suitable for indexing.
+    """
+    if not html:
+        return ""
+    return " ".join(unescape(strip_tags(html)).split())
+
+
+class SearchDocumentQuerySet(QuerySet):
+    """
+    A custom QuerySet for tutorial search documents, building one document per
+    tutorial and language and maintaining their search vectors.
+    """
+
+    def filter_language(self, language):
+        """
+        Filters documents of the given language.
+        """
+        return self.filter(language=language)
+
+    def build_documents(self, tutorial):
+        """
+        Builds unsaved search documents of a tutorial for every language.
+
+        Languages without a translation fall back to the default language,
+        mirroring what modeltranslation displays.
+        """
+        search_fields = tutorial.get_search_fields()
+        _, *default_columns = search_fields[0]
+        defaults = [getattr(tutorial, column) for column in default_columns]
+
+        documents = []
+        for language, *columns in search_fields:
+            values = [
+                getattr(tutorial, column) or default
+                for column, default in zip(columns, defaults)
+            ]
+            title, summary, description = values
+            documents.append(
+                self.model(
+                    tutorial_id=tutorial.pk,
+                    language=language,
+                    config=get_search_config(language),
+                    title=to_plain_text(title),
+                    summary=to_plain_text(summary),
+                    body=to_plain_text(description),
+                )
+            )
+        return documents
+
+    def sync(self, tutorials, batch_size=500):
+        """
+        Rebuilds the search documents of the given tutorials.
+
+        Existing documents are replaced with one bulk insert and, on
+        PostgreSQL, their vectors are computed by a single ``UPDATE``.
+
+        Returns:
+            int: The number of documents written.
+        """
+        tutorials = [tutorial for tutorial in tutorials if tutorial.pk]
+        if not tutorials:
+            return 0
+
+        documents = []
+        for tutorial in tutorials:
+            documents.extend(self.build_documents(tutorial))
+
+        pks = [tutorial.pk for tutorial in tutorials]
+        with transaction.atomic(using=self.db):
+            self.filter(tutorial_id__in=pks).delete()
+            self.bulk_create(documents, batch_size=batch_size)
+            self.filter(tutorial_id__in=pks).update_vectors()
+        return len(documents)
+
+    def update_vectors(self):
+        """
+        Recomputes the weighted search vectors (title A, summary B, body C)
+        with each document's own text search configuration.
+
+        Only PostgreSQL stores vectors; on other databases this is a no-op.
+        """
+        if connections[self.db].vendor != "postgresql":
+            return 0
+        config = F("config")
+        return self.update(
+            vector=SearchVector("title", config=config, weight="A")
+            + SearchVector("summary", config=config, weight="B")
+            + SearchVector("body", config=config, weight="C")
+        )
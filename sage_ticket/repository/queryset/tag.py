@@ -1,9 +1,31 @@
 from datetime import timedelta
 
-from django.db.models import Count, Max, Q, QuerySet
+from django.db import connections, transaction
+from django.db.models import (
+    Count,
+    Exists,
+    F,
+    Max,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+    Sum,
+)
+from django.db.models.functions import Coalesce, TruncDate
 from django.utils import timezone
 
 
+def to_usage_day(value):
+    """
+    Returns the day a tutorial creation time is counted on in the tag usage
+    rollup, in the current time zone like `TruncDate`.
+    """
+    if timezone.is_aware(value):
+        return timezone.localdate(value)
+    return value.date()
+
+
 class TagQuerySet(QuerySet):
     """
     A custom QuerySet for Tag model, providing specialized querying capabilities for
@@ -15,6 +37,10 @@ class TagQuerySet(QuerySet):
         """
         Filter tags that have been used in tutorials within the specified number of days.
         If 'obj' is provided, it excludes that object from the results.
+
+        Reads the denormalized `last_used_at` and the per-day usage rollup, so
+        the tutorial-tag relation is not joined. Days are whole days in the
+        current time zone.
         """
         if not isinstance(days_ago, int) or days_ago < 0:
             raise ValueError("`days_ago` must be a non-negative integer")
@@ -23,12 +49,11 @@ class TagQuerySet(QuerySet):
             raise ValueError("`limit` must be a positive integer or None")
 
         if days_ago == 0:
-            qs = self.annotate(latest_tutorial_date=Max("tutorials__created_at")).order_by(
+            qs = self.annotate(latest_tutorial_date=F("last_used_at")).order_by(
                 "-latest_tutorial_date"
             )
         else:
-            recent_date = timezone.now() - timedelta(days=days_ago)
-            qs = self.filter(tutorials__created_at__gte=recent_date).distinct()
+            qs = self.filter(Exists(self.get_recent_usage(days_ago)))
 
         if obj:
             qs = qs.exclude(Q(pk=obj.pk))
@@ -72,6 +97,9 @@ class TagQuerySet(QuerySet):
 
             - To get the top 3 trending tags in the last 30 days:
             >>> monthly = Tag.objects.filter_trend_tags(days_ago=30, min_count=5, limit=3)
+
+        Counts are read from the denormalized `tutorials_count` and the per-day
+        usage rollup (see `refresh_usage`) instead of the tutorial-tag relation.
         """
         if not isinstance(days_ago, int) or days_ago < 0:
             raise ValueError("`days_ago` must be a non-negative integer")
@@ -84,16 +112,19 @@ class TagQuerySet(QuerySet):
 
         if days_ago == 0:
             qs = (
-                self.annotate(total_count=Count("tutorials"))
-                .filter(total_count__gte=min_count)
+                self.filter(tutorials_count__gte=min_count)
+                .annotate(total_count=F("tutorials_count"))
                 .order_by("-total_count")
             )
         else:
-            recent_date = timezone.now() - timedelta(days=days_ago)
+            recent_count = (
+                self.get_recent_usage(days_ago)
+                .values("tag")
+                .annotate(total=Sum("count"))
+                .values("total")
+            )
             qs = self.annotate(
-                recent_count=Count(
-                    "tutorials", filter=Q(tutorials__created_at__gte=recent_date)
-                )
+                recent_count=Coalesce(Subquery(recent_count), 0)
             ).filter(recent_count__gte=min_count)
 
         if limit is not None:
@@ -101,6 +132,85 @@ class TagQuerySet(QuerySet):
 
         return qs
 
+    def get_recent_usage(self, days_ago):
+        """
+        Returns the usage rollup rows of the last `days_ago` days, correlated to
+        the outer tag.
+        """
+        usage_model = self.model._meta.get_field("usage").related_model
+        since = to_usage_day(timezone.now() - timedelta(days=days_ago))
+        return usage_model.objects.filter(tag=OuterRef("pk"), day__gte=since)
+
+    def refresh_usage(self, days=None):
+        """
+        Recomputes the per-day usage rollup, `tutorials_count` and
+        `last_used_at` of the tags in the queryset from the tutorial-tag
+        relation.
+
+        `days` limits the rollup to the given tutorial creation days, which is
+        all that adding or removing tags of a tutorial can change.
+
+        Returns:
+            int: The number of rollup rows written.
+        """
+        tag_ids = list(self.values_list("pk", flat=True))
+        if not tag_ids:
+            return 0
+
+        relation = self.model._meta.get_field("tutorials")
+        through = relation.through
+        tag_field = relation.field.m2m_reverse_field_name()
+        tutorial_field = relation.field.m2m_field_name()
+        usage_model = self.model._meta.get_field("usage").related_model
+
+        links = (
+            through._default_manager.using(self.db)
+            .filter(**{f"{tag_field}__in": tag_ids})
+            .annotate(day=TruncDate(f"{tutorial_field}__created_at"))
+        )
+        stale = usage_model.objects.using(self.db).filter(tag_id__in=tag_ids)
+        if days is not None:
+            days = set(days)
+            if not days:
+                return 0
+            links = links.filter(day__in=days)
+            stale = stale.filter(day__in=days)
+
+        rows = [
+            usage_model(tag_id=row[tag_field], day=row["day"], count=row["count"])
+            for row in links.values(tag_field, "day").annotate(count=Count("pk"))
+        ]
+        keys = {(row.tag_id, row.day) for row in rows}
+        tag_links = through._default_manager.filter(
+            **{tag_field: OuterRef("pk")}
+        ).values(tag_field)
+
+        features = connections[self.db].features
+        conflict_options = {"update_conflicts": True, "update_fields": ["count"]}
+        if features.supports_update_conflicts_with_target:
+            conflict_options["unique_fields"] = ["tag", "day"]
+
+        with transaction.atomic(using=self.db):
+            removed = [
+                pk
+                for pk, tag_id, day in stale.values_list("pk", "tag_id", "day")
+                if (tag_id, day) not in keys
+            ]
+            usage_model.objects.using(self.db).filter(pk__in=removed).delete()
+            usage_model.objects.using(self.db).bulk_create(rows, **conflict_options)
+            self.model._base_manager.using(self.db).filter(pk__in=tag_ids).update(
+                tutorials_count=Coalesce(
+                    Subquery(tag_links.annotate(total=Count("pk")).values("total")),
+                    0,
+                ),
+                last_used_at=Subquery(
+                    tag_links.annotate(
+                        latest=Max(f"{tutorial_field}__created_at")
+                    ).values("latest")
+                ),
+            )
+        return len(rows)
+
     def annotate_total_tutorials(self) -> QuerySet:
         """
         Annotates each tag with the total number of tutorials in that tag.
@@ -155,8 +265,11 @@ class TagQuerySet(QuerySet):
         """
         Sorts tags based on the number of tutorials associated with each, in descending
         order.
+
+        Reads the denormalized `tutorials_count`, kept up to date on tag changes,
+        so the sort is served by its index instead of a grouped join.
         """
-        qs = self.annotate(tutorials_count=Count("tutorials")).order_by("-tutorials_count")
+        qs = self.order_by("-tutorials_count")
         return qs
 
     def filter_by_tutorial_date_range(self, start_date, end_date) -> QuerySet:
@@ -1,9 +1,284 @@
-from django.db.models import QuerySet
+from collections import defaultdict
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from django.db import transaction
+from django.db.models import Count, F, Max, OuterRef, Q, QuerySet, Subquery
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from sage_ticket.design.state import get_source_states
+from sage_ticket.helper.choice import StatusEnum, TicketStateEnum
+
+
+class BulkTransitionResult(NamedTuple):
+    """Outcome of :meth:`TicketQueryAccess.bulk_transition`.
+
+    Attributes:
+        target (TicketStateEnum): The requested state.
+        updated (int): The number of issues moved to ``target``.
+        rejected (list): ``(pk, state)`` pairs of issues whose current state
+            cannot move to ``target``.
+    """
+
+    target: TicketStateEnum
+    updated: int
+    rejected: List[Tuple[int, str]]
 
 
 class TicketQueryAccess(QuerySet):
+    """
+    A custom QuerySet for the Issue model, providing the filters agents use to
+    build their ticket queues and keyset (seek) pagination over them.
+
+    Queues are always ordered by ``(-created_at, -id)`` so that a page can be
+    continued from the last row of the previous one without an ``OFFSET``.
+    """
+
+    queue_ordering = ("-created_at", "-id")
+
     def get_actives(self):
-        return self.filter(is_read=True)
+        """
+        Returns issues that have not been archived.
+        """
+        return self.filter(is_archive=False)
 
     def get_archive(self):
-        return self.filter(is_read=True)
+        """
+        Returns archived issues.
+        """
+        return self.filter(is_archive=True)
+
+    def filter_unread(self, is_read: bool = False):
+        """
+        Filters issues based on their read status.
+        """
+        return self.filter(is_read=is_read)
+
+    def filter_state(self, *states):
+        """
+        Filters issues that are in any of the given states.
+        """
+        return self.filter(state__in=states)
+
+    def filter_severity(self, *severities):
+        """
+        Filters issues that have any of the given severity levels.
+        """
+        return self.filter(severity__in=severities)
+
+    def filter_department(self, department):
+        """
+        Filters issues assigned to the given department (instance or pk).
+        """
+        return self.filter(department=department)
+
+    def filter_assignee(self, user):
+        """
+        Filters issues assigned to any department the given user is a member of.
+
+        Issues are assigned to departments, so an agent's queue is the set of
+        issues of the departments they belong to.
+        """
+        return self.filter(department__member=user)
+
+    def find_publisher(self, publisher):
+        """
+        Filters issues raised by the given user (instance or pk).
+        """
+        return self.filter(raised_by=publisher)
+
+    def queue(
+        self,
+        state=None,
+        severity=None,
+        department=None,
+        assignee=None,
+        include_archived: bool = False,
+    ):
+        """
+        Builds an agent queue from the optional filters.
+
+        ``state`` and ``severity`` accept a single value or an iterable of
+        values. Archived issues are excluded unless ``include_archived`` is set.
+        The result is ordered newest first, ready for :meth:`seek`.
+        """
+        qs = self if include_archived else self.get_actives()
+
+        if state:
+            qs = qs.filter_state(*self._as_tuple(state))
+
+        if severity:
+            qs = qs.filter_severity(*self._as_tuple(severity))
+
+        if department is not None:
+            qs = qs.filter_department(department)
+
+        if assignee is not None:
+            qs = qs.filter_assignee(assignee)
+
+        return qs.order_by(*self.queue_ordering)
+
+    def seek(
+        self,
+        after: Optional[Union[Any, Tuple[Any, int]]] = None,
+        limit: int = 25,
+    ):
+        """
+        Returns the next page of issues using keyset pagination on
+        ``(created_at, id)``.
+
+        Args:
+            after: The last issue of the previous page, either as an instance
+                or as a ``(created_at, id)`` tuple. ``None`` returns the first
+                page.
+            limit (int): The maximum number of issues to return.
+
+        Examples:
+            >>> page = Issue.objects.queue(department=dep).seek(limit=50)
+            >>> next_page = Issue.objects.queue(department=dep).seek(page[49])
+        """
+        if not isinstance(limit, int) or limit <= 0:
+            raise ValueError("`limit` must be a positive integer")
+
+        qs = self.order_by(*self.queue_ordering)
+
+        if after is not None:
+            created_at, pk = self._cursor(after)
+            qs = qs.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+            )
+
+        return qs[:limit]
+
+    def bulk_transition(self, target, dry_run: bool = False) -> BulkTransitionResult:
+        """
+        Moves every issue in the queryset to ``target`` where the state machine
+        allows it.
+
+        Issues whose current state cannot reach ``target`` are reported in the
+        result instead of raising. The valid ones are moved with a single
+        ``UPDATE ... WHERE state IN (...)`` over the allowed source states, so
+        rows changed concurrently to a disallowed state are left untouched.
+
+        Args:
+            target (TicketStateEnum): The state to move the issues to.
+            dry_run (bool): Only report what would be rejected and how many
+                issues would be updated.
+
+        Examples:
+            >>> old = timezone.now() - timedelta(days=30)
+            >>> Issue.objects.filter(
+            ...     state=TicketStateEnum.RESOLVED, modified_at__lt=old
+            ... ).bulk_transition(TicketStateEnum.CLOSED)
+        """
+        target = TicketStateEnum(target)
+        sources = get_source_states(target)
+        valid = self.filter(state__in=sources)
+
+        with transaction.atomic(using=self.db):
+            rejected = list(
+                self.exclude(state__in=sources)
+                .order_by()
+                .values_list("pk", "state")
+            )
+            if dry_run:
+                updated = valid.count()
+            else:
+                updated = valid.order_by().update(
+                    state=target, modified_at=timezone.now()
+                )
+
+        return BulkTransitionResult(target, updated, rejected)
+
+    def filter_unanswered(self):
+        """
+        Filters issues that have at least one unanswered comment.
+        """
+        return self.filter(unanswered_comments_count__gt=0)
+
+    def order_by_activity(self):
+        """
+        Orders issues by their latest comment, most recent first.
+        """
+        return self.order_by(F("last_activity_at").desc(nulls_last=True), "-id")
+
+    def bump_comment_counters(self, comments: Iterable[Any]) -> int:
+        """
+        Adds newly created comments to the denormalized counters of their
+        issues.
+
+        Deltas are aggregated per issue, so a bulk insert costs one ``UPDATE``
+        per affected issue rather than one per comment. Call it inside the
+        transaction that created the comments.
+
+        Returns:
+            int: The number of issues updated.
+        """
+        deltas = defaultdict(lambda: [0, 0, 0, None])
+        for comment in comments:
+            delta = deltas[comment.issue_id]
+            delta[0] += 1
+            delta[1] += 0 if comment.is_read else 1
+            delta[2] += 1 if comment.status == StatusEnum.UNANSWERED else 0
+            created_at = comment.created_at
+            if created_at and (delta[3] is None or created_at > delta[3]):
+                delta[3] = created_at
+
+        for issue_id, (total, unread, unanswered, last_activity) in deltas.items():
+            last_activity = last_activity or timezone.now()
+            self.filter(pk=issue_id).update(
+                comments_count=F("comments_count") + total,
+                unread_comments_count=F("unread_comments_count") + unread,
+                unanswered_comments_count=(
+                    F("unanswered_comments_count") + unanswered
+                ),
+                last_activity_at=Coalesce(
+                    Greatest(F("last_activity_at"), last_activity), last_activity
+                ),
+            )
+        return len(deltas)
+
+    def refresh_comment_counters(self) -> int:
+        """
+        Recomputes the denormalized comment counters from the comments table
+        for every issue in the queryset with a single ``UPDATE``.
+
+        Returns:
+            int: The number of issues updated.
+        """
+        comment_model = self.model._meta.get_field("comments").related_model
+        comments = comment_model.objects.filter(issue=OuterRef("pk")).order_by()
+
+        def count(**filters):
+            return Coalesce(
+                Subquery(
+                    comments.filter(**filters)
+                    .values("issue")
+                    .annotate(total=Count("pk"))
+                    .values("total")
+                ),
+                0,
+            )
+
+        return self.order_by().update(
+            comments_count=count(),
+            unread_comments_count=count(is_read=False),
+            unanswered_comments_count=count(status=StatusEnum.UNANSWERED),
+            last_activity_at=Subquery(
+                comments.values("issue")
+                .annotate(latest=Max("created_at"))
+                .values("latest")
+            ),
+        )
+
+    @staticmethod
+    def _cursor(after):
+        if isinstance(after, (tuple, list)):
+            return after[0], after[1]
+        return after.created_at, after.pk
+
+    @staticmethod
+    def _as_tuple(value):
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return tuple(value)
+        return (value,)
@@ -1,26 +1,107 @@
+import operator
 from datetime import timedelta
+from functools import reduce
 
 from django.conf import settings
-from django.contrib.postgres.search import SearchQuery, SearchVector, TrigramSimilarity
+from django.contrib.postgres.lookups import TrigramSimilar, TrigramWordSimilar
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramSimilarity,
+    TrigramWordSimilarity,
+)
+from django.core.exceptions import FieldDoesNotExist
 from django.db.models import (
     BooleanField,
     Case,
     Count,
     ExpressionWrapper,
     F,
-    OuterRef,
+    FilteredRelation,
+    FloatField,
+    IntegerField,
     Q,
     QuerySet,
-    Subquery,
     Value,
     When,
+    Window,
     fields,
 )
-from django.db.models.functions import Now
+from django.db.models.functions import Coalesce, Lag, Lead, Now, NullIf
+from django.db.models.query import ModelIterable
 from django.utils import timezone
 
+from modeltranslation.utils import (
+    build_localized_fieldname,
+    get_language,
+    resolution_order,
+)
 from polymorphic.query import PolymorphicQuerySet
 
+from sage_ticket.search import get_search_config
+from sage_ticket.search.backends import get_search_backend
+from sage_ticket.utils.aggregates import GroupConcat
+
+
+def get_subclass_paths(model):
+    """
+    Returns the `select_related` paths from a concrete model to each of its
+    multi-table subclasses, children before grandchildren.
+    """
+    paths = []
+    for relation in model._meta.related_objects:
+        if not (relation.one_to_one and relation.parent_link):
+            continue
+        name = relation.get_accessor_name()
+        paths.append(name)
+        paths += [
+            f"{name}__{path}" for path in get_subclass_paths(relation.related_model)
+        ]
+    return paths
+
+
+class DowncastIterable(ModelIterable):
+    """
+    Yields the most specific subclass instance of each row, as loaded by
+    `select_related` on the subclass paths of the queryset's model.
+    """
+
+    def __iter__(self):
+        paths = get_subclass_paths(self.queryset.model)
+        accessors = {name for path in paths for name in path.split("__")}
+        for obj in super().__iter__():
+            instance = obj
+            for path in paths:
+                # django-polymorphic replaces the subclass accessors with
+                # queries; read the objects select_related() cached instead.
+                child = obj
+                for name in path.split("__"):
+                    child = child._state.fields_cache.get(name)
+                    if child is None:
+                        break
+                else:
+                    instance = child
+            if instance is not obj:
+                self.copy_base_state(obj, instance, accessors)
+            yield instance
+
+    @staticmethod
+    def copy_base_state(obj, instance, accessors):
+        """
+        Hands the base columns, annotations and related objects loaded on the
+        base instance to the subclass instance, which is built from the
+        subclass columns only and would otherwise load them on access.
+        """
+        columns = {field.attname for field in instance._meta.concrete_fields}
+        for key, value in obj.__dict__.items():
+            if key == "_state":
+                continue
+            if key not in columns or key not in instance.__dict__:
+                instance.__dict__[key] = value
+        for name, value in obj._state.fields_cache.items():
+            if name not in accessors:
+                instance._state.fields_cache.setdefault(name, value)
+
 
 class TutorialQuerySet(PolymorphicQuerySet):
     """
@@ -30,8 +111,40 @@ class TutorialQuerySet(PolymorphicQuerySet):
     This class extends the basic functionality of Django's QuerySet to include methods
     specific to the needs of the blog application, such as filtering tutorials by various
     criteria and annotating tutorials with additional computed information.
+
+    Tutorials can be loaded in three modes:
+
+    - polymorphic (default): one query for the base rows plus one query per
+      subclass present in the results, returning subclass instances;
+    - `base_only()`: a single query returning plain `Tutorial` instances, for
+      listings that only show base fields;
+    - `select_subclasses()`: a single query LEFT JOINing every subclass table,
+      returning subclass instances.
     """
 
+    def base_only(self, *fields):
+        """
+        Disables the polymorphic downcast: rows are returned as `Tutorial`
+        instances in one query instead of one per subclass. Subclass fields
+        are not loaded; `fields` optionally restricts the loaded columns.
+        """
+        queryset = self.non_polymorphic()
+        if fields:
+            queryset = queryset.only(*fields)
+        return queryset
+
+    def select_subclasses(self):
+        """
+        Returns subclass instances (e.g. `PictureTutorial`) loaded in one query
+        that LEFT JOINs every subclass table, instead of a follow-up query per
+        subclass. Rows of the base class are returned as `Tutorial` instances.
+        """
+        queryset = self.non_polymorphic().select_related(
+            *get_subclass_paths(self.model)
+        )
+        queryset._iterable_class = DowncastIterable
+        return queryset
+
     def filter_actives(self, is_published=True):
         """
         Returns a queryset of tutorials filtered by their active status.
@@ -82,6 +195,88 @@ class TutorialQuerySet(PolymorphicQuerySet):
         """
         return self.annotate(tags_count=Count("tags"))
 
+    def annotate_tag_titles(self, delimiter=", "):
+        """
+        Annotates each tutorial with the titles of its tags joined into a single
+        string (`tag_titles`).
+
+        The titles are aggregated in the same query, so listings do not need a
+        tags prefetch, which django-polymorphic drops when downcasting rows to
+        their child classes.
+        """
+        return self.annotate(tag_titles=GroupConcat("tags__title", delimiter=delimiter))
+
+    def annotate_reading_time(self):
+        """
+        Annotates each tutorial with the stored reading time of the active
+        language (`reading_minutes`), falling back like modeltranslation does.
+
+        Reading times are computed when descriptions are saved, so listings and
+        serializers can use this annotation without running `readtime`.
+        """
+        columns = self.get_localized_columns("reading_time")
+        if columns == ["reading_time"]:
+            return self.annotate(reading_minutes=F("reading_time"))
+        return self.annotate(
+            reading_minutes=Coalesce(*columns, "reading_time")
+        )
+
+    def refresh_reading_time(self, batch_size=500):
+        """
+        Recomputes the stored reading time of every tutorial in the queryset.
+
+        Use it after `bulk_create`/`bulk_update` or raw imports, which bypass
+        `Tutorial.save`. Rows are processed in batches and written back with
+        `bulk_update`.
+
+        Returns:
+            int: The number of tutorials updated.
+        """
+        pairs = self.model.get_reading_time_fields()
+        descriptions = [description for description, _ in pairs]
+        reading_times = [reading_time for _, reading_time in pairs]
+        queryset = self.non_polymorphic().only("pk", *descriptions).order_by("pk")
+
+        total = 0
+        batch = []
+        for tutorial in queryset.iterator(chunk_size=batch_size):
+            tutorial.update_reading_time(force=True)
+            batch.append(tutorial)
+            if len(batch) >= batch_size:
+                total += self.model.objects.bulk_update(batch, reading_times)
+                batch = []
+        if batch:
+            total += self.model.objects.bulk_update(batch, reading_times)
+        return total
+
+    def refresh_search_documents(self, batch_size=500):
+        """
+        Rebuilds the per-language search documents of every tutorial in the
+        queryset.
+
+        Use it after `bulk_create`/`bulk_update` or raw imports, which bypass
+        `Tutorial.save`.
+
+        Returns:
+            int: The number of documents written.
+        """
+        document_model = self.model._meta.get_field("search_documents").related_model
+        columns = [
+            column for _, *fields in self.model.get_search_fields() for column in fields
+        ]
+        queryset = self.non_polymorphic().only("pk", *columns).order_by("pk")
+
+        total = 0
+        batch = []
+        for tutorial in queryset.iterator(chunk_size=batch_size):
+            batch.append(tutorial)
+            if len(batch) >= batch_size:
+                total += document_model.objects.sync(batch, batch_size=batch_size)
+                batch = []
+        if batch:
+            total += document_model.objects.sync(batch, batch_size=batch_size)
+        return total
+
     def annotate_published_since(self):
         """
         Annotates each tutorial in the queryset with the number of days since it was
@@ -112,116 +307,358 @@ class TutorialQuerySet(PolymorphicQuerySet):
         Annotates each tutorial in the queryset with slugs of the next and previous tutorials
         in the same category.
 
-        This method uses subqueries to determine the 'slug' of the
-        next and previous tutorials based on their primary key (pk)
-        within the same category. The result is the addition
-        of two new fields to each tutorial object in the queryset:
-        `next_tutorial_slug` and `prev_tutorial_slug`.
+        The neighbours are the published tutorials of the category ordered by
+        `published_at`, as precomputed by `refresh_navigation`; they are joined by
+        primary key, which adds `next_tutorial_slug` and `prev_tutorial_slug` to
+        each tutorial object without per-row subqueries.
+        """
+        return self.annotate(
+            next_tutorial_slug=F("next_tutorial__slug"),
+            prev_tutorial_slug=F("prev_tutorial__slug"),
+        )
+
+    def join_navigation(self):
+        """
+        Selects the next and previous tutorials along with each tutorial, e.g.
+        for detail pages linking to their neighbours.
+        """
+        return self.select_related(*self.model.navigation_link_fields)
+
+    def refresh_navigation(self, batch_size=500):
+        """
+        Recomputes the next/previous links of every category of the queryset.
+
+        Published tutorials are chained by `published_at` within their category
+        using the `LAG`/`LEAD` window functions; unpublished ones are unlinked.
+        `Tutorial.save` runs it after every save writing the link columns, as
+        the instance may hold stale links; use it after `update()`,
+        `bulk_create` or raw imports, which bypass `Tutorial.save`.
+
+        Returns:
+            int: The number of tutorials updated.
         """
-        next_tutorial_slug = (
-            self.filter(category=OuterRef("category"), pk__gt=OuterRef("pk"))
-            .order_by("pk")
-            .values("slug")[:1]
+        category_ids = set(
+            self.order_by().values_list("category_id", flat=True).distinct()
+        )
+        if not category_ids:
+            return 0
+
+        model = self.model._meta.get_field("next_tutorial").related_model
+        tutorials = (
+            model.objects.db_manager(self.db)
+            .non_polymorphic()
+            .filter(category_id__in=category_ids)
+        )
+        window = {
+            "partition_by": [F("category_id")],
+            "order_by": [F("published_at").asc(), F("pk").asc()],
+        }
+        links = (
+            tutorials.filter(is_published=True)
+            .annotate(
+                prev_id=Window(Lag("pk"), **window),
+                next_id=Window(Lead("pk"), **window),
+            )
+            .values_list(
+                "pk", "prev_id", "next_id", "prev_tutorial_id", "next_tutorial_id"
+            )
+        )
+        changed = [
+            model(pk=pk, prev_tutorial_id=prev_id, next_tutorial_id=next_id)
+            for pk, prev_id, next_id, old_prev_id, old_next_id in links
+            if (prev_id, next_id) != (old_prev_id, old_next_id)
+        ]
+
+        total = 0
+        if changed:
+            total += model.objects.db_manager(self.db).bulk_update(
+                changed, model.navigation_link_fields, batch_size=batch_size
+            )
+        total += (
+            tutorials.filter(is_published=False)
+            .exclude(prev_tutorial=None, next_tutorial=None)
+            .update(prev_tutorial=None, next_tutorial=None)
         )
+        return total
 
-        # Get the slug of the previous tutorial
-        prev_tutorial_slug = (
-            self.filter(category=OuterRef("category"), pk__lt=OuterRef("pk"))
-            .order_by("-pk")
-            .values("slug")[:1]
+    def filter_recommended_for(self, tutorial):
+        """
+        Filters the precomputed recommendations of a tutorial, best first, and
+        annotates their `recommendation_score`.
+        """
+        return self.filter(recommended_by__tutorial=tutorial).annotate(
+            recommendation_score=F("recommended_by__score")
+        ).order_by("recommended_by__rank")
+
+    def refresh_recommendations(self):
+        """
+        Recomputes the recommendations of the tutorials in the queryset and of
+        the tutorials similar to them.
+
+        Returns:
+            int: The number of recommendations written.
+        """
+        recommendation_model = self.model._meta.get_field(
+            "recommendations"
+        ).related_model
+        return recommendation_model.objects.db_manager(self.db).refresh_for(
+            list(self.values_list("pk", flat=True))
         )
 
-        # Annotate the current queryset with the slugs
+    def join_search_document(self, language=None):
+        """
+        Joins the search document of the given language, the active one by
+        default, as `search_document`. Tutorials without one are kept.
+        """
+        language = language or get_language()
         return self.annotate(
-            next_tutorial_slug=Subquery(next_tutorial_slug),
-            prev_tutorial_slug=Subquery(prev_tutorial_slug),
+            search_document=FilteredRelation(
+                "search_documents",
+                condition=Q(search_documents__language=language),
+            )
         )
 
     def full_text_search(self, search_query):
         """
         Performs a full-text search on 'title' and 'description' fields of the tutorials.
         This method is optimized for finding complete words or phrases, not partial
-        substrings.
+        substrings. Matching is done by the database's search backend over the
+        stored search documents of the active language, and each tutorial is
+        annotated with its `rank`: GIN-indexed vectors on PostgreSQL, FTS5 on
+        SQLite and a FULLTEXT index on MySQL/MariaDB (see
+        `sage_ticket.search.backends`).
         """
-        database_engine = settings.DATABASES["default"]["ENGINE"]
         if search_query:
-            if "postgresql" in database_engine:
-                vector = SearchVector("title", "description")
-                query = SearchQuery(search_query)
-                return self.annotate(search=vector).filter(search=query)
-
-            elif "mysql" in database_engine or "mariadb" in database_engine:
-                return self.filter(
-                    Q(title__icontains=search_query)
-                    | Q(description__icontains=search_query)
-                )
-
-            elif "sqlite" in database_engine:
-                return self.filter(
-                    Q(title__icontains=search_query)
-                    | Q(description__icontains=search_query)
-                )
+            return get_search_backend(self.db).search(self, search_query)
         return self
 
     def substring_search(self, search_query):
         """
         Performs a case-insensitive substring search in 'title' and 'description'
         fields of the tutorials. This method is useful for partial word matching, but it is
-        less efficient than full-text search.
+        less efficient than full-text search. The active language's columns are
+        searched, falling back to the default language where they are empty.
         """
         if search_query:
             return self.filter(
-                Q(title__icontains=search_query)
-                | Q(description__icontains=search_query)
+                self.get_substring_q("title", search_query)
+                | self.get_substring_q("description", search_query)
             )
         return self
 
+    def get_substring_q(self, name, search_query):
+        """
+        Matches `search_query` as a substring of the text of `name` shown in the
+        active language.
+        """
+        return self.localized_q(
+            name, lambda column: Q(**{f"{column}__icontains": search_query})
+        )
+
+    def get_localized_columns(self, name):
+        """
+        Returns the columns holding `name` in modeltranslation's fallback order
+        for the active language, or the base column if `name` is not
+        translated.
+
+        Lookup expressions passed to `filter()` and conditions inside `When()`
+        are not rewritten by modeltranslation, so they must name these columns
+        explicitly.
+        """
+        columns = []
+        for language in resolution_order(get_language()):
+            column = build_localized_fieldname(name, language)
+            try:
+                self.model._meta.get_field(column)
+            except FieldDoesNotExist:
+                continue
+            columns.append(column)
+        return columns or [name]
+
+    def localized_q(self, name, condition):
+        """
+        Builds a condition on the value of `name` that the active language
+        displays: `condition(column)` is checked on the first column of the
+        fallback order that is not empty, so untranslated tutorials are matched
+        on their default language text without an OR across all languages.
+        """
+        clauses = []
+        empty = Q()
+        for column in self.get_localized_columns(name):
+            clauses.append(empty & condition(column))
+            empty &= Q(**{f"{column}__isnull": True}) | Q(**{column: ""})
+        return reduce(operator.or_, clauses)
+
+    def localized_value(self, name):
+        """
+        Returns an expression for the value of `name` that the active language
+        displays, i.e. the first non-empty column of the fallback order.
+        """
+        columns = self.get_localized_columns(name)
+        if len(columns) == 1:
+            return F(columns[0])
+        return Coalesce(*(NullIf(F(column), Value("")) for column in columns))
+
     def trigram_similarity_search(self, search_query):
         """
-        Performs a search using trigram similarity on 'title' and 'description' fields
-        of the tutorials.
+        Performs a search using trigram similarity on the 'title', 'summary' and
+        'description' fields of the tutorials.
         This method supports partial word matches and is more linguistically aware than
-        a simple substring search, but it requires pg_trgm extension for Tutorialgresql.
+        a simple substring search, but it requires the pg_trgm extension for PostgreSQL.
+
+        Rows are selected with the `%` (title) and `%>` (summary, description)
+        operators, which the trigram GIN indexes serve; their cut-offs are the
+        `pg_trgm.similarity_threshold` and `pg_trgm.word_similarity_threshold`
+        settings. Only the matches are scored and ordered by `similarity`.
         """
         database_engine = settings.DATABASES["default"]["ENGINE"]
 
         if "postgresql" in database_engine:
+            matches = ExpressionWrapper(
+                self.localized_q(
+                    "title",
+                    lambda column: Q(TrigramSimilar(F(column), search_query)),
+                )
+                | self.localized_q(
+                    "summary",
+                    lambda column: Q(TrigramWordSimilar(F(column), search_query)),
+                )
+                | self.localized_q(
+                    "description",
+                    lambda column: Q(TrigramWordSimilar(F(column), search_query)),
+                ),
+                output_field=BooleanField(),
+            )
             return (
-                self.annotate(
-                    similarity=TrigramSimilarity("title", search_query)
-                    + TrigramSimilarity("description", search_query)
+                self.filter(matches)
+                .annotate(
+                    similarity=TrigramSimilarity(
+                        self.localized_value("title"), search_query
+                    )
+                    + TrigramWordSimilarity(
+                        search_query, self.localized_value("description")
+                    )
                 )
-                .filter(similarity__gt=0.1)
                 .order_by("-similarity")
             )
 
         elif "mysql" in database_engine or "mariadb" in database_engine:
             # MariaDB does not support trigram similarity directly
             # Mysql does not support trigram similarity directly
-            return self.filter(
-                Q(title__icontains=search_query)
-                | Q(description__icontains=search_query)
-            )
+            return self.substring_search(search_query)
 
         elif "sqlite" in database_engine:
             # SQLite does not support trigram similarity directly
-            return self.filter(
-                Q(title__icontains=search_query)
-                | Q(description__icontains=search_query)
-            )
+            return self.substring_search(search_query)
 
         return self.none()
 
-    def heavy_search(self, search_query):
+    def ranked_search(self, search_query, trigram_candidates=500):
+        """
+        Runs full-text, substring and trigram matching in a single query and
+        orders the matches by relevance.
+
+        Each tutorial is annotated with `search_tier` (3 for full-text, 2 for
+        substring and 1 for trigram matches) and, on PostgreSQL, with the
+        full-text `rank` and trigram `similarity`. Results are ordered by tier
+        first, so full-text matches still come before the fallbacks.
+
+        Trigram candidates are the tutorials whose plain-text search document
+        in the active language passes the `%` (title) or `%>` (body) operator
+        of pg_trgm. Only the `trigram_candidates` most similar of them are
+        kept; pass None to keep every candidate.
+        """
+        if not search_query:
+            return self
+
+        database_engine = settings.DATABASES["default"]["ENGINE"]
+        language = get_language()
+        title_match = self.get_substring_q("title", search_query)
+        substring = title_match | self.get_substring_q("description", search_query)
+
+        if "postgresql" not in database_engine:
+            return (
+                self.filter(substring)
+                .annotate(
+                    search_tier=Case(
+                        When(title_match, then=Value(3)),
+                        default=Value(2),
+                        output_field=IntegerField(),
+                    )
+                )
+                .order_by("-search_tier", "-pk")
+            )
+
+        query = SearchQuery(search_query, config=get_search_config(language))
+        full_text = Q(search_document__vector=query)
+
+        document_model = self.model._meta.get_field("search_documents").related_model
+        candidates = (
+            document_model.objects.filter_language(language)
+            .filter(
+                Q(TrigramSimilar(F("title"), search_query))
+                | Q(TrigramWordSimilar(F("body"), search_query))
+            )
+            .values("tutorial_id")
+        )
+        if trigram_candidates is not None:
+            # Keep the most similar candidates rather than the first returned.
+            candidates = candidates.order_by(
+                (
+                    TrigramSimilarity("title", search_query)
+                    + TrigramWordSimilarity(search_query, "body")
+                ).desc(),
+                "tutorial_id",
+            )[:trigram_candidates]
+        trigram = Q(pk__in=candidates)
+
+        return (
+            self.join_search_document(language)
+            .filter(full_text | substring | trigram)
+            .annotate(
+                search_tier=Case(
+                    When(full_text, then=Value(3)),
+                    When(substring, then=Value(2)),
+                    default=Value(1),
+                    output_field=IntegerField(),
+                ),
+                rank=Case(
+                    When(
+                        full_text,
+                        then=SearchRank(F("search_document__vector"), query),
+                    ),
+                    default=Value(0.0),
+                    output_field=FloatField(),
+                ),
+                similarity=Case(
+                    When(
+                        trigram,
+                        then=TrigramSimilarity("search_document__title", search_query)
+                        + TrigramWordSimilarity(search_query, "search_document__body"),
+                    ),
+                    default=Value(0.0),
+                    output_field=FloatField(),
+                ),
+            )
+            .order_by("-search_tier", "-rank", "-similarity", "-pk")
+        )
+
+    def heavy_search(self, search_query, ranked=False, trigram_candidates=500):
         """
         Combines full-text search, substring search, and trigram similarity search to
         provide a comprehensive search experience. The method first tries a full-text
         search. If it yields no results, it falls back to a substring search. If
         available and suitable, it also uses trigram similarity for nuanced matching.
+
+        With `ranked=True` the three searches run as a single query through
+        `ranked_search` instead of up to three `exists()` round trips.
         """
         if not search_query:
             return self
 
+        if ranked:
+            return self.ranked_search(search_query, trigram_candidates)
+
         # Step 1: Full-text search
         full_text_qs = self.full_text_search(search_query)
         if full_text_qs.exists():
@@ -1,12 +1,24 @@
 from import_export import fields, resources
+from import_export.instance_loaders import CachedInstanceLoader
 
 from sage_ticket.utils.import_export.errors import DataProcessingError
-from sage_ticket.utils.import_export.widget import ForeignKeyNullableWidget
-from sage_ticket.utils.import_export.exclude_fields import get_language_specific_fields
+from sage_ticket.utils.import_export.widget import (
+    ForeignKeyNullableWidget,
+    LookupCacheResourceMixin,
+)
+from sage_ticket.utils.import_export.exclude_fields import LanguageFieldsResourceMixin
+from sage_ticket.utils.import_export.preview import BulkDryRunMixin
+from sage_ticket.utils.import_export.streaming import StreamingExportMixin
 from sage_ticket.models import TutorialCategory
 
 
-class TutorialCategoryResource(resources.ModelResource):
+class TutorialCategoryResource(
+    BulkDryRunMixin,
+    LanguageFieldsResourceMixin,
+    LookupCacheResourceMixin,
+    StreamingExportMixin,
+    resources.ModelResource,
+):
 
     @classmethod
     def get_error_result_class(cls):
@@ -14,9 +26,7 @@ class TutorialCategoryResource(resources.ModelResource):
 
     class Meta:
         model = TutorialCategory
-        base_language_fields = ["title",]
-        exclude = ("id",) + get_language_specific_fields(
-            TutorialCategory,
-            base_language_fields
-        )
+        exclude = ("id",)
         import_id_fields = ("title",)
+        # Loads the existing rows of a dataset with one query.
+        instance_loader_class = CachedInstanceLoader
@@ -1,20 +1,30 @@
 from import_export import resources
+from import_export.instance_loaders import CachedInstanceLoader
 
 from sage_ticket.utils.import_export.errors import DataProcessingError
-from sage_ticket.utils.import_export.exclude_fields import get_language_specific_fields
+from sage_ticket.utils.import_export.exclude_fields import LanguageFieldsResourceMixin
+from sage_ticket.utils.import_export.preview import BulkDryRunMixin
+from sage_ticket.utils.import_export.streaming import StreamingExportMixin
+from sage_ticket.utils.import_export.widget import LookupCacheResourceMixin
 from sage_ticket.models import TutorialTag
 
 
-class TutorialTagResource(resources.ModelResource):
+class TutorialTagResource(
+    BulkDryRunMixin,
+    LanguageFieldsResourceMixin,
+    LookupCacheResourceMixin,
+    StreamingExportMixin,
+    resources.ModelResource,
+):
     @classmethod
     def get_error_result_class(cls):
         return DataProcessingError
 
     class Meta:
         model = TutorialTag
-        base_language_fields = ["title",]
-        exclude = ("id",) + get_language_specific_fields(
-            TutorialTag,
-            base_language_fields
-        )
+        # Usage totals are maintained from the tutorial-tag relation.
+        derived_fields = ("tutorials_count", "last_used_at")
+        exclude = ("id",) + derived_fields
         import_id_fields = ("title",)
+        # Loads the existing rows of a dataset with one query.
+        instance_loader_class = CachedInstanceLoader
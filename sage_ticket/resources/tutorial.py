@@ -1,31 +1,87 @@
 from import_export import fields, resources
-from import_export.widgets import ForeignKeyWidget, ManyToManyWidget
 
 from sage_ticket.utils.import_export.errors import DataProcessingError
-from sage_ticket.utils.import_export.exclude_fields import get_language_specific_fields
+from sage_ticket.utils.import_export.exclude_fields import (
+    LanguageFieldsResourceMixin,
+    get_localized_fields,
+)
+from sage_ticket.utils.import_export.streaming import (
+    StreamingExportMixin,
+    StreamingImportMixin,
+    assign_unique_slugs,
+)
+from sage_ticket.utils.import_export.widget import (
+    CachedLookupForeignKeyWidget,
+    CachedLookupManyToManyWidget,
+    LookupCacheResourceMixin,
+)
 from sage_ticket.models import TutorialCategory, TutorialTag, Tutorial
 
 
-class TutorialResource(resources.ModelResource):
+class TutorialResource(
+    LanguageFieldsResourceMixin,
+    LookupCacheResourceMixin,
+    StreamingImportMixin,
+    StreamingExportMixin,
+    resources.ModelResource,
+):
 
     category = fields.Field(
         column_name="category",
         attribute="category",
-        widget=ForeignKeyWidget(TutorialCategory, "title"),
+        widget=CachedLookupForeignKeyWidget(TutorialCategory, "title"),
     )
 
     tags = fields.Field(
         column_name="tags",
         attribute="tags",
-        widget=ManyToManyWidget(TutorialTag, field="title", separator=";"),
+        widget=CachedLookupManyToManyWidget(
+            TutorialTag, field="title", separator=";"
+        ),
     )
 
+    # Set on write, as `save` does in the row-by-row import.
+    stream_exclude = ("polymorphic_ctype", "slug")
+
     @classmethod
     def get_error_result_class(cls):
         return DataProcessingError
 
+    def before_stream_write(self, new, updated):
+        for tutorial in new:
+            tutorial.pre_save_polymorphic()
+        assign_unique_slugs(Tutorial, new)
+
+    def after_stream_chunk(self, new, updated, changes):
+        """
+        Rebuilds what `Tutorial.save` and the tag signals maintain: reading
+        times, search documents, navigation links and tag usage. Recommendations
+        are left to the `rebuild_recommendations` command.
+        """
+        tutorials = Tutorial.objects.filter(pk__in=[t.pk for t in new + updated])
+        tutorials.refresh_reading_time()
+        tutorials.refresh_search_documents()
+
+        categories = {tutorial.category_id for tutorial in new + updated}
+        categories.update(
+            tutorial._loaded_values.get("category_id") for tutorial in updated
+        )
+        Tutorial.objects.filter(category_id__in=categories).refresh_navigation()
+
+        if "tags" in changes:
+            removed, added = changes["tags"]
+            TutorialTag.objects.filter(pk__in=removed | added).refresh_usage()
+        TutorialTag.objects.invalidate_cache()
+        TutorialCategory.objects.invalidate_cache()
+
     class Meta:
         model = Tutorial
-        base_language_fields = ["title", "summary", "description"]
-        exclude = ("id",) + get_language_specific_fields(Tutorial, base_language_fields)
+        # Reading time is derived from the description on save and the
+        # navigation links from the publication dates of the category.
+        derived_fields = (
+            ("reading_time",)
+            + get_localized_fields(Tutorial, "reading_time")
+            + Tutorial.navigation_link_fields
+        )
+        exclude = ("id",) + derived_fields
         import_id_fields = ("title",)
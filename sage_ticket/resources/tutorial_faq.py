@@ -1,18 +1,27 @@
 from import_export import fields, resources
-from import_export.widgets import ForeignKeyWidget
 
 from sage_ticket.utils.import_export.errors import DataProcessingError
-from sage_ticket.utils.import_export.exclude_fields import get_language_specific_fields
+from sage_ticket.utils.import_export.exclude_fields import LanguageFieldsResourceMixin
+from sage_ticket.utils.import_export.streaming import StreamingExportMixin
+from sage_ticket.utils.import_export.widget import (
+    CachedLookupForeignKeyWidget,
+    LookupCacheResourceMixin,
+)
 
 from sage_ticket.models import TutorialFaq, Tutorial
 
 
-class TutorialFaqResource(resources.ModelResource):
+class TutorialFaqResource(
+    LanguageFieldsResourceMixin,
+    LookupCacheResourceMixin,
+    StreamingExportMixin,
+    resources.ModelResource,
+):
 
     tutorial = fields.Field(
         column_name="tutorial",
         attribute="tutorial",
-        widget=ForeignKeyWidget(Tutorial, "title"),
+        widget=CachedLookupForeignKeyWidget(Tutorial, "title"),
     )
 
     @classmethod
@@ -21,9 +30,5 @@ class TutorialFaqResource(resources.ModelResource):
 
     class Meta:
         model = TutorialFaq
-        base_language_fields = ["question", "answer"]
-        exclude = ("id",) + get_language_specific_fields(
-            TutorialFaq,
-            base_language_fields
-        )
+        exclude = ("id",)
         import_id_fields = ("question",)
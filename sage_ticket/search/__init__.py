@@ -0,0 +1,8 @@
+from .config import get_search_config, get_trigram_thresholds
+from .fields import PortableSearchVectorField
+
+__all__ = [
+    "get_search_config",
+    "get_trigram_thresholds",
+    "PortableSearchVectorField",
+]
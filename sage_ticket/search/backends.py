@@ -0,0 +1,249 @@
+import time
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
+from django.db.models import F, FloatField, Func, Value
+from django.utils.module_loading import import_string
+
+from modeltranslation.utils import get_language
+
+from .config import get_search_config
+
+SEARCH_BACKENDS = {
+    "postgresql": "sage_ticket.search.backends.PostgreSQLSearchBackend",
+    "sqlite": "sage_ticket.search.backends.SQLiteSearchBackend",
+    "mysql": "sage_ticket.search.backends.MySQLSearchBackend",
+}
+"""Default search backend by database vendor."""
+
+FTS_TABLE = "sage_tutorial_search_fts"
+FULLTEXT_INDEX = "sage_tutorial_search_ft"
+
+_instances = {}
+
+
+def get_search_backend(using="default"):
+    """
+    Returns the search backend of a database connection.
+
+    Projects can replace or add backends per vendor with the
+    `SAGE_TICKET_SEARCH_BACKENDS` setting, e.g.
+    ``{"sqlite": "sage_ticket.search.backends.SearchBackend"}`` to keep the
+    substring fallback.
+    """
+    vendor = connections[using].vendor
+    overrides = getattr(settings, "SAGE_TICKET_SEARCH_BACKENDS", {})
+    path = overrides.get(vendor) or SEARCH_BACKENDS.get(
+        vendor, "sage_ticket.search.backends.SearchBackend"
+    )
+    if path not in _instances:
+        _instances[path] = import_string(path)()
+    return _instances[path]
+
+
+def get_document_table():
+    from sage_ticket.models import TutorialSearchDocument
+
+    return TutorialSearchDocument._meta.db_table
+
+
+class SearchBackend:
+    """
+    Full-text search backend of `TutorialQuerySet`.
+
+    Backends match tutorials through their per-language search documents and
+    annotate a `rank`. This base class is the portable fallback: a
+    case-insensitive substring match without ranking.
+    """
+
+    def get_schema_statements(self, connection):
+        """
+        Returns `(table, statement)` pairs creating the structures the backend
+        needs; statements paired with `None` do not depend on a table.
+        """
+        return []
+
+    def is_available(self, connection):
+        """
+        Checks whether the structures of `get_schema_statements` exist.
+        """
+        return True
+
+    def reset_availability(self, connection):
+        """
+        Forgets what `is_available` remembered about the connection, e.g.
+        after its schema was created.
+        """
+
+    def full_text_search(self, queryset, search_query):
+        return queryset.substring_search(search_query)
+
+    def search(self, queryset, search_query):
+        """
+        Runs `full_text_search`, falling back to the substring match while the
+        backend's schema has not been created yet.
+        """
+        if not self.is_available(connections[queryset.db]):
+            return SearchBackend.full_text_search(self, queryset, search_query)
+        return self.full_text_search(queryset, search_query)
+
+
+class PostgreSQLSearchBackend(SearchBackend):
+    """
+    Matches the stored, GIN-indexed search vectors of the active language.
+    """
+
+    def get_schema_statements(self, connection):
+        from .schema import get_postgresql_statements
+
+        return get_postgresql_statements()
+
+    def full_text_search(self, queryset, search_query):
+        language = get_language()
+        query = SearchQuery(search_query, config=get_search_config(language))
+        return queryset.filter(
+            search_documents__language=language,
+            search_documents__vector=query,
+        ).annotate(rank=SearchRank(F("search_documents__vector"), query))
+
+
+class CachedAvailabilityMixin:
+    """
+    Remembers whether the search structures of each connection exist, so the
+    catalog is not inspected on every search.
+
+    Found structures are remembered for good. Missing ones are checked again
+    after `availability_retry` seconds, or as soon as `ensure_search_schema`
+    has run on the connection.
+    """
+
+    availability_retry = 300
+
+    def __init__(self):
+        self.availability = {}
+
+    def is_available(self, connection):
+        available, checked_at = self.availability.get(connection.alias, (False, None))
+        if available:
+            return True
+        now = time.monotonic()
+        if checked_at is None or now - checked_at >= self.availability_retry:
+            available = self.check_schema(connection)
+            self.availability[connection.alias] = (available, now)
+        return available
+
+    def reset_availability(self, connection):
+        self.availability.pop(connection.alias, None)
+
+
+class SQLiteSearchBackend(CachedAvailabilityMixin, SearchBackend):
+    """
+    Matches search documents through an FTS5 index and ranks them by BM25.
+
+    The FTS5 table uses the search document table as external content and is
+    kept in sync by triggers, so bulk writes need no extra work.
+    """
+
+    def get_schema_statements(self, connection):
+        from .schema import get_sqlite_statements
+
+        statements = get_sqlite_statements()
+        if FTS_TABLE not in connection.introspection.table_names():
+            # Index documents written before the FTS table existed.
+            statements.append(
+                (
+                    get_document_table(),
+                    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+                )
+            )
+        return statements
+
+    def check_schema(self, connection):
+        return FTS_TABLE in connection.introspection.table_names()
+
+    @staticmethod
+    def build_match(search_query):
+        """
+        Quotes every term, so FTS5 syntax characters typed by users are
+        searched literally and all terms must match.
+        """
+        terms = search_query.split()
+        return " ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+
+    def full_text_search(self, queryset, search_query):
+        match = self.build_match(search_query)
+        if not match:
+            return queryset.none()
+        # The FTS table is joined once, so BM25 is scored by the same full-text
+        # scan that finds the matches rather than by a subquery per result.
+        # `extra()` is the only way to join a table that has no model.
+        return (
+            queryset.join_search_document()
+            .filter(search_document__isnull=False)
+            .extra(
+                select={"rank": f"-bm25({FTS_TABLE})"},
+                tables=[FTS_TABLE],
+                where=[
+                    f"{FTS_TABLE} MATCH %s",
+                    f"{FTS_TABLE}.rowid = search_document.id",
+                ],
+                params=[match],
+            )
+        )
+
+
+class MatchAgainst(Func):
+    """
+    `MATCH (...) AGAINST (... IN NATURAL LANGUAGE MODE)` relevance score.
+    """
+
+    output_field = FloatField()
+
+    def __init__(self, *columns, query, **extra):
+        super().__init__(*columns, Value(query), **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        *columns, query = self.get_source_expressions()
+        compiled = [compiler.compile(column) for column in columns]
+        query_sql, query_params = compiler.compile(query)
+        sql = "MATCH ({}) AGAINST ({} IN NATURAL LANGUAGE MODE)".format(
+            ", ".join(sql for sql, _ in compiled), query_sql
+        )
+        params = [param for _, params in compiled for param in params]
+        return sql, (*params, *query_params)
+
+
+class MySQLSearchBackend(CachedAvailabilityMixin, SearchBackend):
+    """
+    Matches search documents through an InnoDB FULLTEXT index on MySQL and
+    MariaDB, ranked by the natural language relevance score.
+    """
+
+    def get_schema_statements(self, connection):
+        from .schema import get_mysql_statements
+
+        if self.check_schema(connection):
+            return []
+        return get_mysql_statements()
+
+    def check_schema(self, connection):
+        table = get_document_table()
+        if table not in connection.introspection.table_names():
+            return False
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, table)
+        return FULLTEXT_INDEX in constraints
+
+    def full_text_search(self, queryset, search_query):
+        rank = MatchAgainst(
+            F("search_document__title"),
+            F("search_document__summary"),
+            F("search_document__body"),
+            query=search_query,
+        )
+        return (
+            queryset.join_search_document()
+            .annotate(rank=rank)
+            .filter(rank__gt=0)
+        )
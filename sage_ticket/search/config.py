@@ -0,0 +1,77 @@
+from django.conf import settings
+
+SEARCH_CONFIGS = {
+    "ar": "arabic",
+    "da": "danish",
+    "de": "german",
+    "en": "english",
+    "es": "spanish",
+    "fi": "finnish",
+    "fr": "french",
+    "hu": "hungarian",
+    "it": "italian",
+    "nl": "dutch",
+    "no": "norwegian",
+    "pt": "portuguese",
+    "ro": "romanian",
+    "ru": "russian",
+    "sv": "swedish",
+    "tr": "turkish",
+}
+"""Built-in PostgreSQL text search configurations by language code."""
+
+DEFAULT_SEARCH_CONFIG = "simple"
+
+
+def get_search_config(language):
+    """
+    Returns the PostgreSQL text search configuration for a language.
+
+    Projects can override or extend the mapping with the
+    `SAGE_TICKET_SEARCH_CONFIGS` setting, e.g. ``{"fa": "simple"}``. Languages
+    without a known configuration use ``"simple"``, which only lowercases
+    tokens.
+    """
+    overrides = getattr(settings, "SAGE_TICKET_SEARCH_CONFIGS", {})
+    base_language = (language or "").split("-")[0].split("_")[0]
+    return (
+        overrides.get(language)
+        or overrides.get(base_language)
+        or SEARCH_CONFIGS.get(base_language, DEFAULT_SEARCH_CONFIG)
+    )
+
+
+def get_trigram_thresholds():
+    """
+    Returns the pg_trgm thresholds configured for the project.
+
+    `SAGE_TICKET_TRIGRAM_SIMILARITY_THRESHOLD` and
+    `SAGE_TICKET_TRIGRAM_WORD_SIMILARITY_THRESHOLD` set the limits used by the
+    `%` and `%>` operators; unset values keep the server defaults (0.3 and
+    0.6).
+    """
+    thresholds = {
+        "pg_trgm.similarity_threshold": getattr(
+            settings, "SAGE_TICKET_TRIGRAM_SIMILARITY_THRESHOLD", None
+        ),
+        "pg_trgm.word_similarity_threshold": getattr(
+            settings, "SAGE_TICKET_TRIGRAM_WORD_SIMILARITY_THRESHOLD", None
+        ),
+    }
+    return {name: value for name, value in thresholds.items() if value is not None}
+
+
+def configure_trigram_thresholds(sender, connection, **kwargs):
+    """
+    Applies the configured pg_trgm thresholds to new PostgreSQL connections.
+    Connected to `connection_created`.
+    """
+    if connection.vendor != "postgresql":
+        return
+
+    thresholds = get_trigram_thresholds()
+    if not thresholds:
+        return
+    with connection.cursor() as cursor:
+        for name, value in thresholds.items():
+            cursor.execute("SELECT set_config(%s, %s, false)", [name, str(value)])
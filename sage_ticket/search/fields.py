@@ -0,0 +1,16 @@
+from django.contrib.postgres.search import SearchVectorField
+
+
+class PortableSearchVectorField(SearchVectorField):
+    """
+    A `SearchVectorField` that can be migrated on every supported database.
+
+    The column is a ``tsvector`` on PostgreSQL and a nullable text column
+    elsewhere, where it stays empty and the search backends use their own
+    indexes instead.
+    """
+
+    def db_type(self, connection):
+        if connection.vendor == "postgresql":
+            return "tsvector"
+        return "text"
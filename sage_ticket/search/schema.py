@@ -0,0 +1,176 @@
+import logging
+import re
+
+from django.apps import apps
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections, transaction
+
+logger = logging.getLogger(__name__)
+
+
+def get_trigram_columns():
+    """
+    Returns `(table, column)` pairs that get a trigram GIN index: the
+    localized title, summary and description columns of tutorials, one index
+    per language.
+    """
+    tutorial_model = apps.get_model("sage_ticket", "Tutorial")
+    tutorial_table = tutorial_model._meta.db_table
+    return [
+        (tutorial_table, tutorial_model._meta.get_field(name).column)
+        for _, *names in tutorial_model.get_search_fields()
+        for name in names
+    ]
+
+
+def get_document_languages():
+    """
+    Returns `(language, index suffix, SQL condition)` for every language that
+    gets partial indexes on the search documents.
+    """
+    tutorial_model = apps.get_model("sage_ticket", "Tutorial")
+    languages = []
+    for language, *_ in tutorial_model.get_search_fields():
+        suffix = re.sub(r"\W", "_", language.lower())
+        condition = "language = '{}'".format(language.replace("'", "''"))
+        languages.append((language, suffix, condition))
+    return languages
+
+
+def get_postgresql_statements():
+    """
+    Returns the PostgreSQL-only DDL backing tutorial search.
+
+    The package does not ship migrations and its models must stay portable, so
+    extensions and indexes that only PostgreSQL understands are created here,
+    idempotently, after `migrate`. Statements paired with `None` do not depend
+    on a table.
+    """
+    document_model = apps.get_model("sage_ticket", "TutorialSearchDocument")
+    document_table = document_model._meta.db_table
+    statements = [(None, "CREATE EXTENSION IF NOT EXISTS pg_trgm")]
+    for _, suffix, condition in get_document_languages():
+        # Searches always filter on one language, so each language gets its
+        # own, smaller partial indexes.
+        statements.append(
+            (
+                document_table,
+                f"CREATE INDEX IF NOT EXISTS {document_table}_{suffix}_gin "
+                f"ON {document_table} USING gin (vector) WHERE {condition}",
+            )
+        )
+        for column in ("title", "body"):
+            name = f"{document_table}_{suffix}_{column}_trgm"
+            statements.append(
+                (
+                    document_table,
+                    f"CREATE INDEX IF NOT EXISTS {name} ON {document_table} "
+                    f"USING gin ({column} gin_trgm_ops) WHERE {condition}",
+                )
+            )
+    for table, column in get_trigram_columns():
+        statements.append(
+            (
+                table,
+                f"CREATE INDEX IF NOT EXISTS {table}_{column}_trgm "
+                f"ON {table} USING gin ({column} gin_trgm_ops)",
+            )
+        )
+    return statements
+
+
+def get_sqlite_statements():
+    """
+    Returns the SQLite DDL backing tutorial search: an FTS5 table indexing the
+    search documents as external content, and the triggers keeping it in sync.
+    """
+    from .backends import FTS_TABLE
+
+    document_model = apps.get_model("sage_ticket", "TutorialSearchDocument")
+    table = document_model._meta.db_table
+    columns = "title, summary, body"
+    new_values = "new.id, new.title, new.summary, new.body"
+    old_values = "'delete', old.id, old.title, old.summary, old.body"
+    insert_new = f"INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES ({new_values});"
+    delete_old = (
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns}) "
+        f"VALUES ({old_values});"
+    )
+    return [
+        (
+            table,
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+            f"{columns}, content='{table}', content_rowid='id', "
+            f"tokenize='unicode61 remove_diacritics 2')",
+        ),
+        (
+            table,
+            f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON {table} "
+            f"BEGIN {insert_new} END",
+        ),
+        (
+            table,
+            f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON {table} "
+            f"BEGIN {delete_old} END",
+        ),
+        (
+            table,
+            f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON {table} "
+            f"BEGIN {delete_old} {insert_new} END",
+        ),
+    ]
+
+
+def get_mysql_statements():
+    """
+    Returns the MySQL/MariaDB DDL backing tutorial search: a FULLTEXT index on
+    the plain text of the search documents.
+    """
+    from .backends import FULLTEXT_INDEX
+
+    document_model = apps.get_model("sage_ticket", "TutorialSearchDocument")
+    table = document_model._meta.db_table
+    return [
+        (
+            table,
+            f"CREATE FULLTEXT INDEX {FULLTEXT_INDEX} ON {table} (title, summary, body)",
+        ),
+    ]
+
+
+def ensure_search_schema(using=DEFAULT_DB_ALIAS, **kwargs):
+    """
+    Creates the database-specific search structures that cannot be declared
+    in `Meta.indexes`, as listed by the connection's search backend. Safe to
+    run repeatedly; connected to `post_migrate`.
+
+    A statement that fails, e.g. because the database user may not create the
+    `pg_trgm` extension or SQLite lacks FTS5, is logged and skipped; search
+    keeps working without the index.
+    """
+    from .backends import get_search_backend
+
+    connection = connections[using]
+    backend = get_search_backend(using)
+    statements = backend.get_schema_statements(connection)
+    if statements:
+        run_schema_statements(connection, statements)
+    # The structures may exist now; search must not wait for the next retry.
+    backend.reset_availability(connection)
+
+
+def run_schema_statements(connection, statements):
+    """
+    Runs `(table, statement)` pairs, skipping those whose table does not
+    exist and logging those that fail.
+    """
+    tables = set(connection.introspection.table_names())
+    with connection.cursor() as cursor:
+        for table, statement in statements:
+            if table is not None and table not in tables:
+                continue
+            logger.debug("Ensuring search schema: %s", statement)
+            try:
+                with transaction.atomic(using=connection.alias):
+                    cursor.execute(statement)
+            except DatabaseError as error:
+                logger.warning("Could not run %r: %s", statement, error)
@@ -0,0 +1,106 @@
+from django.db import transaction
+
+from sage_ticket.models import Tutorial, TutorialTag
+from sage_ticket.recommendation import get_recommendation_settings
+from sage_ticket.repository.queryset.tag import to_usage_day
+
+
+def refresh_tag_usage_on_tags_changed(
+    sender, instance, action, reverse, model, pk_set, using, **kwargs
+):
+    """
+    Refreshes the usage rollup of the tags added to or removed from tutorials.
+    Connected to `m2m_changed` of `Tutorial.tags`.
+    """
+    if action == "pre_clear":
+        # The cleared rows are gone by `post_clear`, which has no `pk_set`.
+        related = instance.tutorials if reverse else instance.tags
+        instance._cleared_usage_ids = list(related.values_list("pk", flat=True))
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if action == "post_clear":
+        pk_set = instance.__dict__.pop("_cleared_usage_ids", [])
+    if not pk_set:
+        return
+
+    if reverse:
+        tag_ids = [instance.pk]
+        created = model._base_manager.using(using).filter(pk__in=pk_set)
+        days = {
+            to_usage_day(created_at)
+            for created_at in created.values_list("created_at", flat=True)
+        }
+    else:
+        tag_ids = pk_set
+        days = {to_usage_day(instance.created_at)}
+    TutorialTag.objects.db_manager(using).filter(pk__in=tag_ids).refresh_usage(days)
+
+
+def remember_tutorial_tags(sender, instance, using, **kwargs):
+    """
+    Keeps the tags of a tutorial about to be deleted, whose relation rows are
+    removed without `m2m_changed`. Connected to `pre_delete` of `Tutorial`.
+    """
+    instance._deleted_tag_ids = list(
+        instance.tags.using(using).values_list("pk", flat=True)
+    )
+
+
+def refresh_tag_usage_on_tutorial_delete(sender, instance, using, **kwargs):
+    """
+    Refreshes the usage rollup of the tags of a deleted tutorial. Connected to
+    `post_delete` of `Tutorial`.
+    """
+    tag_ids = instance.__dict__.pop("_deleted_tag_ids", None)
+    if not tag_ids:
+        return
+    TutorialTag.objects.db_manager(using).filter(pk__in=tag_ids).refresh_usage(
+        {to_usage_day(instance.created_at)}
+    )
+
+
+def refresh_navigation_on_tutorial_delete(sender, instance, using, **kwargs):
+    """
+    Relinks the neighbours of a deleted tutorial. Connected to `post_delete` of
+    `Tutorial`.
+    """
+    if not instance.is_published:
+        return
+    Tutorial.objects.db_manager(using).filter(
+        category_id=instance.category_id
+    ).refresh_navigation()
+
+
+def refresh_recommendations_on_tags_changed(
+    sender, instance, action, reverse, model, pk_set, using, **kwargs
+):
+    """
+    Recomputes, on commit, the recommendations of tutorials whose tags
+    changed. Connected to `m2m_changed` of `Tutorial.tags`.
+    """
+    if action == "pre_clear" and reverse:
+        instance._cleared_recommendation_ids = list(
+            instance.tutorials.values_list("pk", flat=True)
+        )
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not get_recommendation_settings()["INCREMENTAL"]:
+        return
+
+    if not reverse:
+        tutorial_ids = [instance.pk]
+    elif action == "post_clear":
+        tutorial_ids = instance.__dict__.pop("_cleared_recommendation_ids", [])
+    else:
+        tutorial_ids = list(pk_set or ())
+    if not tutorial_ids:
+        return
+    transaction.on_commit(
+        lambda: Tutorial.objects.db_manager(using)
+        .filter(pk__in=tutorial_ids)
+        .refresh_recommendations(),
+        using=using,
+    )
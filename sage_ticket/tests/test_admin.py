@@ -0,0 +1,74 @@
+from unittest import mock
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from sage_ticket.models import Issue, TutorialTag
+from sage_ticket.repository.generator import TicketDataGenerator
+from sage_ticket.resources import TutorialTagResource
+
+
+def count_queries(client, url):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+    assert response.status_code == 200
+    return len(context.captured_queries)
+
+
+@pytest.mark.django_db
+class TestIssueAdminQueries:
+    @pytest.fixture
+    def generator(self):
+        return TicketDataGenerator()
+
+    def test_changelist_query_count_is_bounded(self, admin_client, generator):
+        url = reverse("admin:sage_ticket_issue_changelist")
+        users = generator.create_users(5)
+        departments = generator.create_department(3)
+
+        generator.create_issue(5, users, departments)
+        small = count_queries(admin_client, url)
+
+        generator.create_issue(60, users, departments)
+        large = count_queries(admin_client, url)
+
+        assert large == small
+
+    def test_change_form_query_count_is_bounded(self, admin_client, generator):
+        users = generator.create_users(5)
+        departments = generator.create_department(1)
+        issue = generator.create_issue(1, users, departments)[0]
+        url = reverse("admin:sage_ticket_issue_change", args=(issue.pk,))
+
+        generator.create_comment(3, users, [issue])
+        count_queries(admin_client, url)  # warm the content type cache
+        small = count_queries(admin_client, url)
+
+        generator.create_comment(200, users, [issue])
+        large = count_queries(admin_client, url)
+
+        assert large == small
+        assert Issue.objects.get(pk=issue.pk).comments_count == 203
+
+
+@pytest.mark.django_db
+class TestTagAdminBulkDryRun:
+    def test_preview_reports_summary_counts(self, admin_client):
+        TutorialTag.objects.create(title="django")
+        upload = SimpleUploadedFile(
+            "tags.csv", b"title,slug,is_published\ndjango,django,1\ncelery,celery,1\n"
+        )
+        with mock.patch.object(TutorialTagResource, "bulk_dry_run_threshold", 1):
+            response = admin_client.post(
+                reverse("admin:sage_ticket_tutorialtag_import"),
+                {"resource": 0, "format": 0, "import_file": upload},
+            )
+        assert response.status_code == 200
+        assert [str(message) for message in response.context["messages"]] == [
+            "Import preview: 1 new, 1 updated, 0 skipped and 0 invalid rows."
+        ]
+        assert "confirm_form" in response.context
+        assert not TutorialTag.objects.filter(title="celery").exists()
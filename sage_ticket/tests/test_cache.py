@@ -0,0 +1,116 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import caches
+from django.test import override_settings
+
+from sage_ticket.models import (
+    Faq,
+    FaqCategory,
+    Tutorial,
+    TutorialCategory,
+    TutorialTag,
+)
+from sage_ticket.utils.cache import cache
+
+
+@pytest.fixture
+def enabled_cache():
+    with override_settings(SAGE_TICKET_CACHE={"ENABLED": True}):
+        caches["default"].clear()
+        cache.local.clear()
+        cache.versions.clear()
+        yield cache
+
+
+@pytest.mark.django_db
+class TestCachedManagers:
+    @pytest.fixture
+    def tutorial(self):
+        category = TutorialCategory.objects.create(title="Cached")
+        tutorial = Tutorial.objects.create(
+            title="Cached tutorial",
+            description="<p>Body</p>",
+            summary="Summary",
+            category=category,
+            is_published=True,
+        )
+        tutorial.tags.add(TutorialTag.objects.create(title="cached"))
+        return tutorial
+
+    def test_disabled_cache_evaluates_every_call(
+        self, tutorial, django_assert_num_queries
+    ):
+        with django_assert_num_queries(1):
+            tags = TutorialTag.objects.cached.sort_by_popularity()
+        assert isinstance(tags, list)
+        with django_assert_num_queries(1):
+            TutorialTag.objects.cached.sort_by_popularity()
+
+    def test_disabled_cache_skips_invalidation(self, tutorial):
+        with mock.patch.object(cache, "invalidate") as invalidate:
+            tag = TutorialTag.objects.create(title="uncached")
+            tutorial.title = "Renamed"
+            tutorial.save()
+            tutorial.tags.add(tag)
+        invalidate.assert_not_called()
+
+    def test_repeated_calls_are_served_from_cache(
+        self, tutorial, enabled_cache, django_assert_num_queries
+    ):
+        tags = TutorialTag.objects.cached.sort_by_popularity()
+        with django_assert_num_queries(0):
+            assert TutorialTag.objects.cached.sort_by_popularity() == tags
+
+    def test_callers_cannot_change_cached_values(self, tutorial, enabled_cache):
+        categories = TutorialCategory.objects.cached.annotate_total_tutorials()
+        categories[0].total_tutorials = 42
+        categories.append(None)
+
+        categories = TutorialCategory.objects.cached.annotate_total_tutorials()
+        assert len(categories) == 1
+        assert categories[0].total_tutorials == 1
+
+    def test_shared_cache_survives_local_eviction(
+        self, tutorial, enabled_cache, django_assert_num_queries
+    ):
+        TutorialCategory.objects.cached.annotate_total_tutorials()
+        enabled_cache.local.clear()
+        with django_assert_num_queries(0):
+            categories = TutorialCategory.objects.cached.annotate_total_tutorials()
+        assert categories[0].total_tutorials == 1
+
+    def test_tag_changes_invalidate(self, tutorial, enabled_cache):
+        assert len(TutorialTag.objects.cached.sort_by_popularity()) == 1
+        tutorial.tags.add(TutorialTag.objects.create(title="new"))
+        assert len(TutorialTag.objects.cached.sort_by_popularity()) == 2
+
+    def test_tutorial_changes_invalidate(self, tutorial, enabled_cache):
+        categories = TutorialCategory.objects.cached.annotate_total_tutorials()
+        assert categories[0].total_tutorials == 1
+        Tutorial.objects.create(
+            title="Another",
+            description="<p>Body</p>",
+            summary="Summary",
+            category=tutorial.category,
+            is_published=True,
+        )
+        categories = TutorialCategory.objects.cached.annotate_total_tutorials()
+        assert categories[0].total_tutorials == 2
+
+    def test_arguments_are_part_of_the_key(self, tutorial, enabled_cache):
+        assert TutorialCategory.objects.cached.filter_published(True)
+        assert TutorialCategory.objects.cached.filter_published(False) == []
+
+    def test_faq_listing_is_invalidated_by_faqs(self, enabled_cache):
+        category = FaqCategory.objects.create(title="General")
+        Faq.objects.create(question="Why?", answer="Because.", category=category)
+        categories = FaqCategory.objects.cached.annotate_total_faqs()
+        assert categories[0].total_faqs == 1
+        Faq.objects.create(question="How?", answer="Like so.", category=category)
+        categories = FaqCategory.objects.cached.annotate_total_faqs()
+        assert categories[0].total_faqs == 2
+
+    def test_only_listed_methods_are_cached(self):
+        with pytest.raises(AttributeError):
+            TutorialTag.objects.cached.search("django")
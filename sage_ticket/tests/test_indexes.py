@@ -0,0 +1,80 @@
+import pytest
+from django.db import connection
+
+from sage_ticket.helper import TicketStateEnum
+from sage_ticket.models import Issue, Tutorial
+from sage_ticket.search.schema import get_postgresql_statements
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(
+    connection.vendor != "postgresql",
+    reason="Partial index plans are only asserted on PostgreSQL.",
+)
+class TestIssueIndexes:
+    @pytest.fixture(autouse=True)
+    def disable_seqscan(self):
+        # With an almost empty table the planner always prefers a sequential
+        # scan, so force it to reveal which index it would pick.
+        with connection.cursor() as cursor:
+            cursor.execute("SET enable_seqscan = off")
+        yield
+        with connection.cursor() as cursor:
+            cursor.execute("SET enable_seqscan = on")
+
+    def test_department_queue_uses_partial_index(self):
+        plan = (
+            Issue.objects.filter(
+                department_id=1, state=TicketStateEnum.OPEN, is_archive=False
+            )
+            .order_by("-created_at")
+            .explain()
+        )
+        assert "issue_dept_state_created_idx" in plan
+
+    def test_state_queue_uses_partial_index(self):
+        plan = (
+            Issue.objects.filter(state=TicketStateEnum.NEW, is_archive=False)
+            .order_by("-created_at")
+            .explain()
+        )
+        assert "issue_state_created_idx" in plan
+
+    def test_archive_listing_uses_index(self):
+        plan = (
+            Issue.objects.filter(is_archive=True, is_read=False)
+            .order_by("-created_at")
+            .explain()
+        )
+        assert "issue_archive_read_idx" in plan
+
+    def test_default_ordering_uses_index(self):
+        plan = Issue.objects.order_by("-created_at", "-id")[:50].explain()
+        assert "issue_created_id_idx" in plan
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(
+    connection.vendor != "postgresql",
+    reason="Trigram indexes only exist on PostgreSQL.",
+)
+class TestTutorialTrigramIndexes:
+    @pytest.fixture(autouse=True)
+    def disable_seqscan(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SET enable_seqscan = off")
+        yield
+        with connection.cursor() as cursor:
+            cursor.execute("SET enable_seqscan = on")
+
+    def test_trigram_search_uses_index(self):
+        plan = Tutorial.objects.trigram_similarity_search("djang").explain()
+        assert "_trgm" in plan
+
+
+def test_trigram_indexes_cover_search_columns():
+    statements = [statement for _, statement in get_postgresql_statements()]
+    assert statements[0] == "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+    for _, *columns in Tutorial.get_search_fields():
+        for column in columns:
+            assert any(f"({column} gin_trgm_ops)" in s for s in statements)
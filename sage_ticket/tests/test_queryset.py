@@ -1,5 +1,8 @@
 import pytest
-from sage_ticket.models import Issue
+from sage_ticket.forms import CommentForm
+from sage_ticket.helper import StatusEnum, TicketStateEnum
+from sage_ticket.models import Comment, Issue
+from sage_ticket.repository.generator import TicketDataGenerator
 from sage_ticket.repository.manager.ticketing import DataAccessLayerManager
 
 
@@ -32,3 +35,224 @@ class TestDataAccessLayerManager:
             assert (
                 issue.raised_by_id == user_id
             ), f"Expected raised_by_id {user_id}, but got {issue.raised_by_id}"
+
+
+@pytest.mark.django_db
+class TestTicketQueue:
+    @pytest.fixture
+    def issues(self):
+        generator = TicketDataGenerator()
+        users = generator.create_users(3)
+        departments = generator.create_department(2)
+        return generator.create_issue(30, users, departments)
+
+    def test_queue_filters_by_state_and_department(self, issues):
+        department = issues[0].department
+        queue = Issue.objects.queue(
+            state=[TicketStateEnum.NEW, TicketStateEnum.OPEN], department=department
+        )
+        for issue in queue:
+            assert issue.department_id == department.pk
+            assert issue.state in (TicketStateEnum.NEW, TicketStateEnum.OPEN)
+            assert not issue.is_archive
+
+    def test_queue_filters_by_assignee(self, issues):
+        department = issues[0].department
+        agent = issues[0].raised_by
+        department.member.add(agent)
+        queue = Issue.objects.queue(assignee=agent)
+        assert {issue.department_id for issue in queue} == {department.pk}
+
+    def test_seek_walks_every_issue_once(self, issues):
+        seen = []
+        page = list(Issue.objects.queue().seek(limit=7))
+        while page:
+            seen.extend(page)
+            page = list(Issue.objects.queue().seek(after=page[-1], limit=7))
+
+        assert len(seen) == len(issues)
+        assert len({issue.pk for issue in seen}) == len(issues)
+        keys = [(issue.created_at, issue.pk) for issue in seen]
+        assert keys == sorted(keys, reverse=True)
+
+    def test_seek_accepts_tuple_cursor(self, issues):
+        first = Issue.objects.seek(limit=1)[0]
+        page = Issue.objects.seek(after=(first.created_at, first.pk), limit=5)
+        assert first not in page
+
+    def test_seek_rejects_invalid_limit(self):
+        with pytest.raises(ValueError):
+            Issue.objects.seek(limit=0)
+
+
+@pytest.mark.django_db
+class TestBulkTransition:
+    @pytest.fixture
+    def issues(self):
+        generator = TicketDataGenerator()
+        users = generator.create_users(2)
+        departments = generator.create_department(1)
+        return generator.create_issue(40, users, departments)
+
+    def test_bulk_transition_reports_invalid_rows(self, issues):
+        result = Issue.objects.bulk_transition(TicketStateEnum.RESOLVED)
+
+        hold = [issue for issue in issues if issue.state == TicketStateEnum.HOLD]
+        assert result.updated == len(hold)
+        assert len(result.rejected) == len(issues) - len(hold)
+        assert not Issue.objects.filter(state=TicketStateEnum.HOLD).exists()
+
+    def test_bulk_transition_dry_run_changes_nothing(self, issues):
+        before = dict(Issue.objects.values_list("pk", "state"))
+        result = Issue.objects.bulk_transition(TicketStateEnum.CLOSED, dry_run=True)
+
+        assert dict(Issue.objects.values_list("pk", "state")) == before
+        assert result.updated + len(result.rejected) == len(issues)
+
+
+@pytest.mark.django_db
+class TestCommentCounters:
+    @pytest.fixture
+    def data(self):
+        generator = TicketDataGenerator()
+        users = generator.create_users(3)
+        departments = generator.create_department(1)
+        issues = generator.create_issue(5, users, departments)
+        comments = generator.create_comment(50, users, issues)
+        return issues, comments
+
+    def test_bulk_create_updates_counters(self, data):
+        issues, comments = data
+        for issue in Issue.objects.all():
+            own = [comment for comment in comments if comment.issue_id == issue.pk]
+            assert issue.comments_count == len(own)
+            assert issue.unanswered_comments_count == sum(
+                comment.status == StatusEnum.UNANSWERED for comment in own
+            )
+            assert issue.unread_comments_count == 0
+
+    def test_refresh_repairs_drift(self, data):
+        expected = dict(Issue.objects.values_list("pk", "comments_count"))
+        Issue.objects.update(comments_count=0, last_activity_at=None)
+
+        Issue.objects.refresh_comment_counters()
+
+        assert dict(Issue.objects.values_list("pk", "comments_count")) == expected
+        commented = Issue.objects.filter(comments_count__gt=0)
+        assert not commented.filter(last_activity_at__isnull=True).exists()
+
+    def test_save_and_delete_update_counters(self, data):
+        issues, comments = data
+        issue = Issue.objects.get(pk=issues[0].pk)
+        comment = Comment.objects.create(
+            title="new",
+            user=comments[0].user,
+            issue=issue,
+            message="new",
+            is_read=False,
+            status=StatusEnum.UNANSWERED,
+        )
+        issue.refresh_from_db()
+        assert issue.comments_count == Comment.objects.filter(issue=issue).count()
+        assert issue.unread_comments_count == 1
+
+        comment.is_read = True
+        comment.save()
+        issue.refresh_from_db()
+        assert issue.unread_comments_count == 0
+
+        comment.delete()
+        Comment.objects.filter(issue=issue)[:1].get().delete()
+        issue.refresh_from_db()
+        assert issue.comments_count == Comment.objects.filter(issue=issue).count()
+
+    def test_queryset_delete_updates_counters(self, data):
+        Comment.objects.filter(issue__in=data[0][:2]).delete()
+        assert not Issue.objects.filter(
+            pk__in=[issue.pk for issue in data[0][:2]], comments_count__gt=0
+        ).exists()
+
+    def test_comment_form_updates_counters(self, data):
+        issues, comments = data
+        issue = issues[0]
+        count = Comment.objects.filter(issue=issue).count()
+        form = CommentForm(
+            data={"title": "question", "message": "question"},
+            user=comments[0].user,
+            issue=issue,
+        )
+        form.instance.status = StatusEnum.UNANSWERED
+        assert form.is_valid()
+        comment = form.save()
+        issue.refresh_from_db()
+        assert (issue.comments_count, issue.unread_comments_count) == (count + 1, 1)
+        assert issue.last_activity_at == comment.created_at
+
+        form = CommentForm(
+            data={"title": "question", "message": "answered"},
+            instance=Comment.objects.get(pk=comment.pk),
+            issue=issues[1],
+        )
+        assert form.is_valid()
+        moved = form.save()
+        issue.refresh_from_db()
+        assert moved.issue_id == issues[1].pk
+        assert (issue.comments_count, issue.unread_comments_count) == (count, 0)
+        assert Issue.objects.get(pk=issues[1].pk).unread_comments_count == 1
+
+
+@pytest.mark.django_db
+class TestCommentThread:
+    @pytest.fixture
+    def thread(self):
+        generator = TicketDataGenerator()
+        users = generator.create_users(2)
+        departments = generator.create_department(1)
+        issue = generator.create_issue(1, users, departments)[0]
+
+        def reply(parent, title):
+            return Comment.objects.create(
+                title=title,
+                user=users[0],
+                issue=issue,
+                message=title,
+                is_read=False,
+                status=StatusEnum.UNANSWERED,
+                replay=parent,
+            )
+
+        root = reply(None, "root")
+        first = reply(root, "first")
+        reply(first, "nested")
+        reply(root, "second")
+        reply(None, "other root")
+        return issue, root
+
+    def test_thread_loads_in_one_query(self, thread, django_assert_num_queries):
+        issue, _ = thread
+        with django_assert_num_queries(1):
+            roots = Comment.objects.thread(issue)
+            titles = [
+                (reply.title, [child.title for child in reply.replies])
+                for reply in roots[0].replies
+            ]
+            users = [root.user.pk for root in roots]
+
+        assert [root.title for root in roots] == ["root", "other root"]
+        assert titles == [("first", ["nested"]), ("second", [])]
+        assert len(users) == 2
+
+    @pytest.mark.parametrize("use_cte", [True, False])
+    def test_subtree_limits_depth(self, thread, use_cte, django_assert_num_queries):
+        _, root = thread
+        with django_assert_num_queries(1):
+            node = Comment.objects.subtree(root, max_depth=1, use_cte=use_cte)
+        assert [reply.title for reply in node.replies] == ["first", "second"]
+        assert all(reply.replies == [] for reply in node.replies)
+
+    @pytest.mark.parametrize("use_cte", [True, False])
+    def test_subtree_without_limit(self, thread, use_cte):
+        _, root = thread
+        node = Comment.objects.subtree(root, use_cte=use_cte)
+        assert node.replies[0].replies[0].title == "nested"
+        assert node.replies[0].replies[0].depth == 2
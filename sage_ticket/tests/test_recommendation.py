@@ -0,0 +1,95 @@
+import pytest
+from django.core.management import call_command
+
+from sage_ticket.models import (
+    Tutorial,
+    TutorialCategory,
+    TutorialRecommendation,
+    TutorialTag,
+)
+from sage_ticket.recommendation import RecommendationCorpus
+
+
+class TestRecommendationCorpus:
+    weights = {"tags": 0.5, "text": 0.35, "category": 0.15}
+
+    def test_scores_combine_tags_text_and_category(self):
+        corpus = RecommendationCorpus(
+            {
+                1: (1, [1, 2], "gunicorn workers"),
+                2: (1, [1, 2], "gunicorn workers"),
+                3: (2, [3], "celery queues"),
+                4: (2, [4], "redis streams"),
+            },
+            weights=self.weights,
+            max_df=0.5,
+        )
+        assert corpus.score(1, 2) == pytest.approx(1)
+        assert corpus.neighbours(1, 2) == [(2, pytest.approx(1))]
+        assert corpus.neighbours(3, 2) == [(4, pytest.approx(0.15))]
+
+
+@pytest.mark.django_db
+class TestTutorialRecommendations:
+    @pytest.fixture
+    def tags(self):
+        return {
+            name: TutorialTag.objects.create(title=name)
+            for name in ("deployment", "django", "celery")
+        }
+
+    @pytest.fixture
+    def tutorials(self, tags):
+        category = TutorialCategory.objects.create(title="Backend")
+        other = TutorialCategory.objects.create(title="Queues")
+        web = ["deployment", "django"]
+        specs = [
+            ("Gunicorn", category, "Serve django with gunicorn", web),
+            ("Nginx", category, "Put gunicorn behind nginx", web),
+            ("Celery", other, "Run celery workers", ["celery"]),
+        ]
+        tutorials = {}
+        for title, tutorial_category, text, tag_names in specs:
+            tutorial = Tutorial.objects.create(
+                title=title,
+                description=f"<p>{text}</p>",
+                summary=title,
+                category=tutorial_category,
+            )
+            tutorial.tags.set([tags[name] for name in tag_names])
+            tutorials[title] = tutorial
+        return tutorials
+
+    def get_recommended(self, tutorial):
+        return [
+            recommended.title
+            for recommended in Tutorial.objects.filter_recommended_for(tutorial)
+        ]
+
+    def test_rebuild_stores_top_k(self, tutorials, django_assert_num_queries):
+        call_command("rebuild_recommendations", "--top-k", "1", stdout=None)
+        assert TutorialRecommendation.objects.count() == 2
+        with django_assert_num_queries(1):
+            assert self.get_recommended(tutorials["Gunicorn"]) == ["Nginx"]
+        assert self.get_recommended(tutorials["Celery"]) == []
+
+    def test_tag_changes_update_incrementally(
+        self, tutorials, tags, django_capture_on_commit_callbacks
+    ):
+        TutorialRecommendation.objects.rebuild()
+        celery = tutorials["Celery"]
+        with django_capture_on_commit_callbacks(execute=True):
+            celery.tags.add(tags["deployment"], tags["django"])
+        assert "Celery" in self.get_recommended(tutorials["Gunicorn"])
+        assert "Gunicorn" in self.get_recommended(celery)
+
+    def test_unpublishing_removes_recommendations(
+        self, tutorials, django_capture_on_commit_callbacks
+    ):
+        TutorialRecommendation.objects.rebuild()
+        nginx = tutorials["Nginx"]
+        nginx.is_published = False
+        with django_capture_on_commit_callbacks(execute=True):
+            nginx.save()
+        assert self.get_recommended(tutorials["Gunicorn"]) == []
+        assert not TutorialRecommendation.objects.filter(tutorial=nginx).exists()
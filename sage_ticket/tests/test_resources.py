@@ -0,0 +1,283 @@
+import csv
+import io
+import json
+from unittest import mock
+
+import pytest
+import tablib
+from import_export import fields
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from sage_ticket.models import Tutorial, TutorialCategory, TutorialFaq, TutorialTag
+from sage_ticket.resources import (
+    TutorialFaqResource,
+    TutorialResource,
+    TutorialTagResource,
+)
+from sage_ticket.utils.import_export.exclude_fields import (
+    get_translated_columns,
+    get_translation_fields,
+)
+from sage_ticket.utils.import_export.widget import CachedLookupManyToManyWidget
+
+
+def make_csv(rows):
+    lines = ["title,description,summary,category,tags,is_published"]
+    lines += [",".join(row) for row in rows]
+    return io.BytesIO("\n".join(lines).encode())
+
+
+@pytest.mark.django_db
+class TestTutorialStreamingImport:
+    @pytest.fixture(autouse=True)
+    def related(self):
+        category = TutorialCategory.objects.create(title="Backend")
+        TutorialTag.objects.create(title="django")
+        TutorialTag.objects.create(title="celery")
+        return category
+
+    def test_rows_are_created_and_updated(self, related):
+        existing = Tutorial.objects.create(
+            title="Tutorial 0",
+            description="<p>Old</p>",
+            summary="Old",
+            category=related,
+        )
+        rows = [
+            (f"Tutorial {i}", f"<p>Body {i}</p>", "Summary", "Backend", "django", "1")
+            for i in range(5)
+        ]
+        result = TutorialResource().import_stream(make_csv(rows), chunk_size=2)
+
+        assert (result.created, result.updated, result.errors) == (4, 1, [])
+        existing.refresh_from_db()
+        assert existing.description == "<p>Body 0</p>"
+        tutorial = Tutorial.objects.get(title="Tutorial 3")
+        assert tutorial.slug == "tutorial-3"
+        assert tutorial.reading_time == 1
+        assert list(tutorial.tags.values_list("title", flat=True)) == ["django"]
+        assert tutorial.search_documents.exists()
+        assert TutorialTag.objects.get(title="django").tutorials_count == 5
+
+    def test_queries_do_not_grow_with_rows(self, django_assert_max_num_queries):
+        tags = "django;celery"
+        rows = [
+            (f"Tutorial {i}", "<p>Body</p>", "Summary", "Backend", tags, "1")
+            for i in range(50)
+        ]
+        with django_assert_max_num_queries(40):
+            result = TutorialResource().import_stream(make_csv(rows), chunk_size=50)
+        assert result.created == 50
+
+    def test_unknown_category_skips_row(self):
+        rows = [("Orphan", "<p>Body</p>", "Summary", "Missing", "", "1")]
+        result = TutorialResource().import_stream(make_csv(rows))
+        assert result.created == 0
+        assert [number for number, _ in result.errors] == [1]
+
+    def test_dry_run_rolls_back(self):
+        rows = [("Draft", "<p>Body</p>", "Summary", "Backend", "", "1")]
+        result = TutorialResource().import_stream(make_csv(rows), dry_run=True)
+        assert result.created == 1
+        assert not Tutorial.objects.filter(title="Draft").exists()
+
+
+@pytest.mark.django_db
+class TestLookupCacheWidgets:
+    @pytest.fixture
+    def tutorials(self):
+        category = TutorialCategory.objects.create(title="Lookups")
+        return [
+            Tutorial.objects.create(
+                title=f"Tutorial {i}",
+                description="<p>Body</p>",
+                summary="Summary",
+                category=category,
+            )
+            for i in range(3)
+        ]
+
+    def test_related_values_are_queried_once_per_import(self, tutorials):
+        dataset = tablib.Dataset(headers=["question", "answer", "tutorial"])
+        for i in range(30):
+            dataset.append((f"Question {i}", "Answer", f"Tutorial {i % 3}"))
+
+        with CaptureQueriesContext(connection) as context:
+            result = TutorialFaqResource().import_data(dataset, raise_errors=True)
+
+        tutorial_reads = [
+            query
+            for query in context.captured_queries
+            if query["sql"].startswith("SELECT") and '"sage_tutorial"' in query["sql"]
+        ]
+        assert len(tutorial_reads) == 1
+        assert result.totals["new"] == 30
+        assert TutorialFaq.objects.filter(tutorial=tutorials[2]).count() == 10
+
+    def test_unknown_values_are_remembered(self, tutorials, django_assert_num_queries):
+        widget = CachedLookupManyToManyWidget(Tutorial, field="title", separator=";")
+        widget.preload(["Tutorial 0;Missing", "Tutorial 1"])
+        with django_assert_num_queries(0):
+            cleaned = widget.clean("Tutorial 1; Missing ;Tutorial 0")
+        assert cleaned == [tutorials[1], tutorials[0]]
+
+    def test_objects_created_by_earlier_rows_are_found(self, tutorials):
+        class LinkedTutorialResource(TutorialResource):
+            related_tutorials = fields.Field(
+                column_name="related_tutorials",
+                attribute="related_tutorials",
+                widget=CachedLookupManyToManyWidget(
+                    Tutorial, field="title", separator=";"
+                ),
+            )
+
+        dataset = tablib.Dataset(
+            headers=["title", "description", "summary", "category", "related_tutorials"]
+        )
+        dataset.append(("Basics", "<p>Body</p>", "Summary", "Lookups", ""))
+        dataset.append(("Advanced", "<p>Body</p>", "Summary", "Lookups", "Basics"))
+
+        LinkedTutorialResource().import_data(dataset, raise_errors=True)
+
+        advanced = Tutorial.objects.get(title="Advanced")
+        assert [t.title for t in advanced.related_tutorials.all()] == ["Basics"]
+
+    def test_cache_size_is_bounded(self, tutorials, django_assert_num_queries):
+        widget = CachedLookupManyToManyWidget(Tutorial, field="title", cache_size=2)
+        widget.preload([tutorial.title for tutorial in tutorials])
+        assert len(widget.lookup_cache.entries) == 2
+        with django_assert_num_queries(1):
+            assert widget.clean("Tutorial 0,Tutorial 2") == [tutorials[0], tutorials[2]]
+
+
+@pytest.mark.django_db
+class TestStreamingExport:
+    @pytest.fixture(autouse=True)
+    def tutorials(self):
+        category = TutorialCategory.objects.create(title="Export")
+        tags = [TutorialTag.objects.create(title=f"tag {i}") for i in range(2)]
+        tutorials = []
+        for i in range(25):
+            tutorial = Tutorial.objects.create(
+                title=f"Tutorial {i}",
+                description="<p>Body</p>",
+                summary="Summary",
+                category=category,
+            )
+            tutorial.tags.set(tags[: i % 2 + 1])
+            tutorials.append(tutorial)
+        return tutorials
+
+    def test_csv_rows_are_written_per_chunk(self):
+        chunks = list(TutorialResource().export_stream(chunk_size=10))
+        assert len(chunks) == 3
+        rows = list(csv.DictReader(io.StringIO("".join(chunks))))
+        assert len(rows) == 25
+        row = next(row for row in rows if row["title"] == "Tutorial 1")
+        assert row["category"] == "Export"
+        assert sorted(row["tags"].split(";")) == ["tag 0", "tag 1"]
+
+    def test_jsonl_rows(self):
+        lines = "".join(TutorialResource().export_stream(format="jsonl")).splitlines()
+        assert len(lines) == 25
+        assert {json.loads(line)["tags"] for line in lines} == {"tag 0", "tag 0;tag 1"}
+
+    def test_queries_do_not_grow_with_rows(self, django_assert_max_num_queries):
+        # One query per chunk, plus one per many-to-many field and chunk.
+        with django_assert_max_num_queries(4):
+            list(TutorialResource().export_stream(chunk_size=100))
+
+
+@pytest.mark.django_db
+class TestLanguageFields:
+    def test_translated_columns_come_from_the_registry(self):
+        assert get_translation_fields(TutorialTag) == {
+            "title": {"en": "title_en", "fa": "title_fa"}
+        }
+        assert get_translated_columns(TutorialTag, ["slug", "title"], "fa") == (
+            "slug",
+            "title_fa",
+            "title_en",
+        )
+
+    def test_other_languages_are_excluded(self):
+        fields = TutorialResource().fields
+        assert "title_en" in fields and "title_fa" not in fields
+        assert "reading_time_en" not in fields
+
+    def test_exclusion_follows_settings(self):
+        with override_settings(LANGUAGE_CODE="fa"):
+            fields = TutorialFaqResource().fields
+        assert "question_fa" in fields and "question_en" not in fields
+
+    def test_export_skips_other_language_columns(self):
+        category = TutorialCategory.objects.create(title="Columns")
+        tutorial = Tutorial.objects.create(
+            title="Tutorial",
+            description="<p>Body</p>",
+            summary="Summary",
+            category=category,
+        )
+        TutorialFaq.objects.create(question="Q", answer="A", tutorial=tutorial)
+
+        with CaptureQueriesContext(connection) as context:
+            content = "".join(TutorialFaqResource().export_stream())
+
+        assert "Q,Q,A,A,Tutorial" in content
+        sql = context.captured_queries[0]["sql"]
+        assert '"question_fa"' not in sql and '"title_fa"' not in sql
+        assert '"description_en"' not in sql
+
+
+@pytest.mark.django_db
+class TestBulkDryRun:
+    @pytest.fixture
+    def dataset(self):
+        for title in ("django", "celery", "redis"):
+            TutorialTag.objects.create(title=title)
+        dataset = TutorialTagResource().export()
+        dataset.append(("", "", "flask", "flask", "flask", "1"))
+        columns = dataset.headers
+        rows = [dict(zip(columns, row)) for row in dataset]
+        rows[1]["is_published"] = "0"
+        return tablib.Dataset(*[row.values() for row in rows], headers=columns)
+
+    def test_rows_are_classified_with_one_query(
+        self, dataset, django_assert_num_queries
+    ):
+        with django_assert_num_queries(1):
+            preview = TutorialTagResource().preview_import(dataset)
+        assert (preview.new, preview.update, preview.skip, preview.errors) == (
+            1,
+            3,
+            0,
+            [],
+        )
+        [(number, key, changes)] = preview.diffs
+        assert (number, key) == (2, "celery")
+        assert changes == {"is_published": ("1", "0")}
+
+    @pytest.mark.parametrize("skip_unchanged", [False, True])
+    def test_totals_match_the_row_by_row_dry_run(self, dataset, skip_unchanged):
+        with mock.patch.object(
+            TutorialTagResource._meta, "skip_unchanged", skip_unchanged
+        ):
+            resource = TutorialTagResource()
+            resource.bulk_dry_run_threshold = None
+            expected = resource.import_data(dataset, dry_run=True).totals
+            resource.bulk_dry_run_threshold = 1
+            totals = resource.import_data(dataset, dry_run=True).totals
+        assert totals == expected
+
+    def test_large_dry_runs_report_totals(self, dataset):
+        resource = TutorialTagResource()
+        resource.bulk_dry_run_threshold = 2
+        result = resource.import_data(dataset, dry_run=True)
+        assert result.totals["new"] == 1
+        assert result.totals["update"] == 3
+        assert result.totals["skip"] == 0
+        assert result.rows == []
+        assert not TutorialTag.objects.filter(title="flask").exists()
+        assert TutorialTag.objects.get(title="celery").is_published
@@ -7,6 +7,9 @@ from sage_ticket.design.state import (
     OpenState,
     PendingState,
     TicketState,
+    can_transition,
+    get_allowed_transitions,
+    get_source_states,
 )
 from sage_ticket.helper.choice import TicketStateEnum
 from sage_ticket.helper.exception import (
@@ -83,3 +86,44 @@ class TestStateInitialization:
     def test_initialization_closed_state(self):
         ticket = TicketState(ClosedState())
         assert ticket.show_state() == TicketStateEnum.CLOSED
+
+
+class TestAllowedTransitions:
+    def test_transitions_match_state_machine(self):
+        transitions = get_allowed_transitions()
+        assert transitions[TicketStateEnum.NEW] == {
+            TicketStateEnum.OPEN,
+            TicketStateEnum.CLOSED,
+        }
+        assert transitions[TicketStateEnum.HOLD] == {
+            TicketStateEnum.RESOLVED,
+            TicketStateEnum.CLOSED,
+        }
+        assert transitions[TicketStateEnum.CLOSED] == {TicketStateEnum.OPEN}
+
+    def test_source_states(self):
+        assert get_source_states(TicketStateEnum.RESOLVED) == (TicketStateEnum.HOLD,)
+        assert TicketStateEnum.CLOSED not in get_source_states(TicketStateEnum.CLOSED)
+
+
+class TestTransitionTable:
+    def test_can_transition_does_not_raise(self):
+        assert can_transition(TicketStateEnum.NEW, TicketStateEnum.OPEN)
+        assert not can_transition(TicketStateEnum.NEW, TicketStateEnum.RESOLVED)
+        assert not can_transition("unknown", TicketStateEnum.OPEN)
+
+    def test_can_transition_accepts_raw_values(self):
+        assert can_transition("hold", "resolved")
+
+    def test_states_are_singletons(self):
+        assert OpenState() is OpenState()
+        assert OpenState() is not ClosedState()
+
+    def test_ticket_state_can_transition(self):
+        ticket = TicketState(NewState())
+        assert ticket.can_transition(TicketStateEnum.CLOSED)
+        assert not ticket.can_transition(TicketStateEnum.HOLD)
+
+    def test_set_state_accepts_enum(self):
+        ticket = TicketState(TicketStateEnum.PENDING)
+        assert ticket.show_state() == TicketStateEnum.PENDING
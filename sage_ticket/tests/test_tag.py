@@ -0,0 +1,106 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from sage_ticket.models import (
+    Tutorial,
+    TutorialCategory,
+    TutorialTag,
+    TutorialTagUsage,
+)
+
+
+@pytest.mark.django_db
+class TestTagUsageRollup:
+    @pytest.fixture
+    def category(self):
+        return TutorialCategory.objects.create(title="Tags")
+
+    @pytest.fixture
+    def tags(self):
+        return [TutorialTag.objects.create(title=f"tag {i}") for i in range(3)]
+
+    def create_tutorials(self, category, count, days_ago=0):
+        tutorials = [
+            Tutorial.objects.create(
+                title=f"tutorial {days_ago} {i}",
+                description="<p>Body</p>",
+                summary="Summary",
+                category=category,
+            )
+            for i in range(count)
+        ]
+        created_at = timezone.now() - timedelta(days=days_ago)
+        Tutorial.objects.filter(pk__in=[t.pk for t in tutorials]).update(
+            created_at=created_at
+        )
+        for tutorial in tutorials:
+            tutorial.created_at = created_at
+        return tutorials
+
+    def usage(self, tag):
+        tag.refresh_from_db()
+        return sum(tag.usage.values_list("count", flat=True)), tag.tutorials_count
+
+    def test_adding_and_removing_tags_updates_rollup(self, category, tags):
+        tutorial = self.create_tutorials(category, 1)[0]
+        tutorial.tags.add(*tags[:2])
+        assert self.usage(tags[0]) == (1, 1)
+
+        tutorial.tags.remove(tags[0])
+        assert self.usage(tags[0]) == (0, 0)
+        assert not tags[0].usage.exists()
+
+        tutorial.tags.clear()
+        assert self.usage(tags[1]) == (0, 0)
+
+    def test_reverse_changes_and_deletes_update_rollup(self, category, tags):
+        tutorials = self.create_tutorials(category, 3)
+        tags[0].tutorials.add(*tutorials)
+        assert self.usage(tags[0]) == (3, 3)
+
+        tutorials[0].delete()
+        assert self.usage(tags[0]) == (2, 2)
+
+        tags[0].tutorials.clear()
+        assert self.usage(tags[0]) == (0, 0)
+
+    def test_trend_tags_read_rollup(self, category, tags, django_assert_num_queries):
+        for tutorial in self.create_tutorials(category, 5):
+            tutorial.tags.add(tags[0], tags[1])
+        for tutorial in self.create_tutorials(category, 5, days_ago=60):
+            tutorial.tags.add(tags[0])
+
+        with django_assert_num_queries(1):
+            overall = list(TutorialTag.objects.filter_trend_tags(days_ago=0))
+        assert [(tag, tag.total_count) for tag in overall] == [
+            (tags[0], 10),
+            (tags[1], 5),
+        ]
+
+        recent = TutorialTag.objects.filter_trend_tags(days_ago=30, min_count=5)
+        assert "sage_tutorial_tags" not in str(recent.query)
+        assert {tag: tag.recent_count for tag in recent} == {tags[0]: 5, tags[1]: 5}
+        assert not TutorialTag.objects.filter_trend_tags(days_ago=30, min_count=6)
+
+    def test_recent_tags_read_rollup(self, category, tags):
+        self.create_tutorials(category, 1, days_ago=60)[0].tags.add(tags[0])
+        self.create_tutorials(category, 1)[0].tags.add(tags[1])
+
+        assert list(TutorialTag.objects.filter_recent_tags(days_ago=30)) == [tags[1]]
+        latest = TutorialTag.objects.filter_recent_tags(days_ago=0, limit=2)
+        assert list(latest) == [tags[1], tags[0]]
+
+    def test_compaction_repairs_drift(self, category, tags):
+        tutorial = self.create_tutorials(category, 1)[0]
+        tutorial.tags.add(tags[0])
+        TutorialTagUsage.objects.all().delete()
+        TutorialTag.objects.update(tutorials_count=0)
+
+        call_command("compact_tag_usage")
+        assert self.usage(tags[0]) == (1, 1)
+
+        call_command("compact_tag_usage", keep_days=0)
+        assert self.usage(tags[0]) == (1, 1)
@@ -0,0 +1,406 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.utils import timezone, translation
+
+from sage_ticket.models import (
+    PictureTutorial,
+    Tutorial,
+    TutorialCategory,
+    TutorialSearchDocument,
+    VideoTutorial,
+)
+from sage_ticket.search.backends import SQLiteSearchBackend
+
+
+@pytest.mark.django_db
+class TestTutorialReadingTime:
+    @pytest.fixture
+    def tutorial(self):
+        category = TutorialCategory.objects.create(title="Reading")
+        return Tutorial.objects.create(
+            title="Reading time",
+            description="word " * 600,
+            summary="Summary",
+            category=category,
+        )
+
+    def test_reading_time_is_stored_on_create(self, tutorial):
+        assert Tutorial.objects.get(pk=tutorial.pk).reading_time == 3
+
+    def test_reading_time_is_not_recomputed_without_changes(self, tutorial):
+        tutorial = Tutorial.objects.get(pk=tutorial.pk)
+        with mock.patch("readtime.of_text") as of_text:
+            tutorial.title = "Renamed"
+            tutorial.save()
+        of_text.assert_not_called()
+
+    def test_reading_time_follows_description(self, tutorial):
+        tutorial = Tutorial.objects.get(pk=tutorial.pk)
+        tutorial.description = "word " * 1200
+        tutorial.save()
+        assert Tutorial.objects.get(pk=tutorial.pk).reading_time == 5
+
+    def test_annotation_reads_stored_value(self, tutorial):
+        with mock.patch("readtime.of_text") as of_text:
+            annotated = Tutorial.objects.annotate_reading_time().get(pk=tutorial.pk)
+        of_text.assert_not_called()
+        assert annotated.reading_minutes == 3
+
+    def test_refresh_repairs_bulk_changes(self, tutorial):
+        Tutorial.objects.filter(pk=tutorial.pk).update(reading_time=0)
+        Tutorial.objects.refresh_reading_time()
+        assert Tutorial.objects.get(pk=tutorial.pk).reading_time == 3
+
+
+@pytest.mark.django_db
+class TestTutorialSearchDocuments:
+    @pytest.fixture
+    def tutorial(self):
+        category = TutorialCategory.objects.create(title="Search")
+        return Tutorial.objects.create(
+            title="Deploying Django",
+            description="<p>Configure <strong>gunicorn</strong> &amp; nginx</p>",
+            summary="Deployment",
+            category=category,
+        )
+
+    def test_documents_are_built_on_save(self, tutorial):
+        document = TutorialSearchDocument.objects.filter(tutorial=tutorial).first()
+        assert document.title == "Deploying Django"
+        assert document.body == "Configure gunicorn & nginx"
+
+    def test_documents_follow_changes(self, tutorial):
+        tutorial = Tutorial.objects.get(pk=tutorial.pk)
+        tutorial.description = "<p>Use uvicorn</p>"
+        tutorial.save()
+        bodies = set(
+            TutorialSearchDocument.objects.filter(tutorial=tutorial).values_list(
+                "body", flat=True
+            )
+        )
+        assert bodies == {"Use uvicorn"}
+
+    def test_tracked_fields_are_computed_once(self, tutorial):
+        Tutorial.get_tracked_fields()
+        with mock.patch.object(Tutorial, "get_search_fields") as get_search_fields:
+            loaded = Tutorial.objects.non_polymorphic().get(pk=tutorial.pk)
+        get_search_fields.assert_not_called()
+        assert loaded._loaded_values["category_id"] == tutorial.category_id
+
+    def test_refresh_rebuilds_missing_documents(self, tutorial):
+        TutorialSearchDocument.objects.all().delete()
+        assert Tutorial.objects.refresh_search_documents() > 0
+        assert TutorialSearchDocument.objects.filter(tutorial=tutorial).exists()
+
+    @pytest.mark.skipif(
+        connection.vendor != "postgresql", reason="Search vectors need PostgreSQL."
+    )
+    def test_full_text_search_uses_stored_vectors(self, tutorial):
+        results = Tutorial.objects.full_text_search("gunicorn")
+        assert list(results) == [tutorial]
+        assert results[0].rank > 0
+
+
+@pytest.mark.django_db
+class TestTutorialRankedSearch:
+    @pytest.fixture
+    def tutorials(self):
+        category = TutorialCategory.objects.create(title="Ranked")
+        in_body = Tutorial.objects.create(
+            title="Serving apps",
+            description="<p>Run django behind nginx</p>",
+            summary="Serving",
+            category=category,
+        )
+        in_title = Tutorial.objects.create(
+            title="Django basics",
+            description="<p>Models and views</p>",
+            summary="Basics",
+            category=category,
+        )
+        Tutorial.objects.create(
+            title="Flask basics",
+            description="<p>Routes</p>",
+            summary="Flask",
+            category=category,
+        )
+        return in_title, in_body
+
+    def test_single_query(self, tutorials, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            results = list(Tutorial.objects.heavy_search("django", ranked=True))
+        assert set(results) == set(tutorials)
+
+    @pytest.mark.skipif(
+        connection.vendor == "postgresql", reason="Ordering of the icontains fallback."
+    )
+    def test_title_matches_rank_first(self, tutorials):
+        results = list(Tutorial.objects.ranked_search("django"))
+        assert results == list(tutorials)
+        assert results[0].search_tier > results[1].search_tier
+
+    @pytest.mark.skipif(
+        connection.vendor != "postgresql", reason="Search vectors need PostgreSQL."
+    )
+    def test_full_text_matches_rank_first(self, tutorials):
+        results = list(Tutorial.objects.ranked_search("djang", trigram_candidates=10))
+        assert set(results) <= set(tutorials)
+        results = list(Tutorial.objects.ranked_search("django"))
+        assert all(result.search_tier == 3 for result in results)
+        assert all(result.rank > 0 for result in results)
+
+    @pytest.mark.skipif(
+        connection.vendor != "postgresql", reason="Trigram search needs PostgreSQL."
+    )
+    def test_capped_trigram_candidates_are_the_most_similar(self, tutorials):
+        results = list(Tutorial.objects.ranked_search("flask basix", 1))
+        assert [result.title for result in results] == ["Flask basics"]
+        assert results[0].search_tier == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="FTS5 is SQLite only.")
+class TestTutorialFTS5Search:
+    @pytest.fixture
+    def tutorials(self):
+        category = TutorialCategory.objects.create(title="FTS")
+        once = Tutorial.objects.create(
+            title="Serving apps",
+            description="<p>Put <em>gunicorn</em> behind nginx</p>",
+            summary="Serving",
+            category=category,
+        )
+        twice = Tutorial.objects.create(
+            title="Gunicorn workers",
+            description="<p>Tune gunicorn workers and threads</p>",
+            summary="Gunicorn",
+            category=category,
+        )
+        return twice, once
+
+    def test_results_are_ranked(self, tutorials):
+        results = list(Tutorial.objects.full_text_search("gunicorn").order_by("-rank"))
+        assert results == list(tutorials)
+        assert results[0].rank > results[1].rank
+
+    def test_index_follows_changes(self, tutorials):
+        twice, once = tutorials
+        once.description = "<p>Use uvicorn</p>"
+        once.save()
+        assert list(Tutorial.objects.full_text_search("gunicorn")) == [twice]
+        assert list(Tutorial.objects.full_text_search("uvicorn")) == [once]
+
+    def test_syntax_characters_are_literal(self, tutorials):
+        assert list(Tutorial.objects.full_text_search('gunicorn" OR (')) == []
+
+    def test_index_is_matched_once(self, tutorials):
+        queryset = Tutorial.objects.full_text_search("gunicorn")
+        assert str(queryset.query).count("MATCH") == 1
+
+    def test_missing_index_is_not_checked_on_every_search(self):
+        backend = SQLiteSearchBackend()
+        with mock.patch.object(
+            backend, "check_schema", return_value=False
+        ) as check_schema:
+            assert not backend.is_available(connection)
+            assert not backend.is_available(connection)
+            assert check_schema.call_count == 1
+
+            backend.reset_availability(connection)
+            assert not backend.is_available(connection)
+            assert check_schema.call_count == 2
+
+
+@pytest.mark.django_db
+class TestTutorialLanguageAwareSearch:
+    @pytest.fixture
+    def tutorials(self):
+        category = TutorialCategory.objects.create(title="Languages")
+        translated = Tutorial.objects.create(
+            title_en="Django deployment",
+            title_fa="استقرار جنگو",
+            description_en="<p>Deploy</p>",
+            description_fa="<p>استقرار</p>",
+            summary="Deploy",
+            category=category,
+        )
+        untranslated = Tutorial.objects.create(
+            title_en="Django forms",
+            description_en="<p>Forms</p>",
+            summary="Forms",
+            category=category,
+        )
+        return translated, untranslated
+
+    def test_active_language_columns_are_searched(self, tutorials):
+        translated, _ = tutorials
+        with translation.override("fa"):
+            results = list(Tutorial.objects.substring_search("جنگو"))
+        assert results == [translated]
+
+    def test_untranslated_rows_fall_back_to_default_language(self, tutorials):
+        _, untranslated = tutorials
+        with translation.override("fa"):
+            results = list(Tutorial.objects.substring_search("Django"))
+        assert results == [untranslated]
+
+
+@pytest.mark.django_db
+class TestTutorialNavigation:
+    @pytest.fixture
+    def category(self):
+        return TutorialCategory.objects.create(title="Navigation")
+
+    def create(self, category, title, days_ago, **kwargs):
+        return Tutorial.objects.create(
+            title=title,
+            description="<p>Body</p>",
+            summary="Summary",
+            category=category,
+            published_at=timezone.now() - timedelta(days=days_ago),
+            **kwargs,
+        )
+
+    def get_chain(self, category):
+        tutorials = Tutorial.objects.filter(category=category, is_published=True)
+        return {
+            tutorial.title: (tutorial.prev_tutorial_slug, tutorial.next_tutorial_slug)
+            for tutorial in tutorials.annotate_next_and_prev()
+        }
+
+    def test_published_tutorials_are_chained_by_date(self, category):
+        self.create(category, "Third", 1)
+        self.create(category, "First", 3)
+        self.create(category, "Hidden", 2, is_published=False)
+        self.create(category, "Second", 2)
+        assert self.get_chain(category) == {
+            "First": (None, "second"),
+            "Second": ("first", "third"),
+            "Third": ("second", None),
+        }
+
+    def test_unpublishing_relinks_neighbours(self, category):
+        first = self.create(category, "First", 3)
+        second = self.create(category, "Second", 2)
+        self.create(category, "Third", 1)
+        second.is_published = False
+        second.save()
+        assert self.get_chain(category) == {
+            "First": (None, "third"),
+            "Third": ("first", None),
+        }
+        assert Tutorial.objects.get(pk=second.pk).next_tutorial is None
+        assert first.next_tutorial.title == "Third"
+
+    def test_deleting_relinks_neighbours(self, category):
+        self.create(category, "First", 3)
+        self.create(category, "Second", 2).delete()
+        self.create(category, "Third", 1)
+        assert self.get_chain(category) == {
+            "First": (None, "third"),
+            "Third": ("first", None),
+        }
+
+    def test_stale_instances_keep_links(self, category):
+        first = self.create(category, "First", 3)
+        stale = Tutorial.objects.get(pk=first.pk)
+        self.create(category, "Second", 2)
+        stale.summary = "Edited"
+        stale.save()
+        assert self.get_chain(category)["First"] == (None, "second")
+
+    def test_copies_are_inserted_and_linked(self, category):
+        self.create(category, "First", 3)
+        copy = Tutorial.objects.non_polymorphic().get(title="First")
+        copy.pk = copy.id = None
+        copy.title = "Second"
+        copy.slug = "second"
+        copy.published_at = timezone.now()
+        copy.save()
+        assert Tutorial.objects.count() == 2
+        assert self.get_chain(category) == {
+            "First": (None, "second"),
+            "Second": ("first", None),
+        }
+
+    def test_deleted_instances_can_be_saved_again(self, category):
+        first = self.create(category, "First", 3)
+        second = self.create(category, "Second", 2)
+        second = Tutorial.objects.non_polymorphic().get(pk=second.pk)
+        Tutorial.objects.filter(pk=second.pk).delete()
+        second.save()
+        assert self.get_chain(category) == {
+            "First": (None, "second"),
+            "Second": ("first", None),
+        }
+        assert Tutorial.objects.get(pk=first.pk).next_tutorial_id == second.pk
+
+    def test_saves_leave_update_fields_to_the_caller(self, category):
+        tutorial = self.create(category, "First", 3)
+        tutorial = Tutorial.objects.get(pk=tutorial.pk)
+        with mock.patch("django.db.models.signals.post_save.send") as send:
+            tutorial.save()
+        assert send.call_args.kwargs["update_fields"] is None
+
+    def test_refresh_repairs_bulk_changes(self, category):
+        self.create(category, "First", 3)
+        self.create(category, "Second", 2)
+        Tutorial.objects.update(prev_tutorial=None, next_tutorial=None)
+        assert Tutorial.objects.refresh_navigation() == 2
+        assert self.get_chain(category)["First"] == (None, "second")
+
+    def test_detail_page_neighbours_are_joined(
+        self, category, django_assert_num_queries
+    ):
+        self.create(category, "First", 3)
+        second = self.create(category, "Second", 2)
+        with django_assert_num_queries(1):
+            tutorial = Tutorial.objects.join_navigation().get(pk=second.pk)
+            assert tutorial.prev_tutorial.title == "First"
+            assert tutorial.next_tutorial is None
+
+
+@pytest.mark.django_db
+class TestTutorialQueryModes:
+    @pytest.fixture(autouse=True)
+    def tutorials(self):
+        category = TutorialCategory.objects.create(title="Modes")
+        fields = {"description": "<p>Body</p>", "summary": "Summary"}
+        Tutorial.objects.create(title="Plain", category=category, **fields)
+        PictureTutorial.objects.create(title="Picture", category=category, **fields)
+        VideoTutorial.objects.create(
+            title="Video", category=category, video="tutorials/videos/v.mp4", **fields
+        )
+
+    def test_polymorphic_mode_queries_each_subclass(self, django_assert_num_queries):
+        with django_assert_num_queries(3):
+            types = {type(tutorial) for tutorial in Tutorial.objects.all()}
+        assert types == {Tutorial, PictureTutorial, VideoTutorial}
+
+    def test_base_only_mode_runs_one_query(self, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            tutorials = list(Tutorial.objects.base_only("title", "slug"))
+            assert {tutorial.title for tutorial in tutorials} == {
+                "Plain",
+                "Picture",
+                "Video",
+            }
+        assert {type(tutorial) for tutorial in tutorials} == {Tutorial}
+
+    def test_select_subclasses_mode_runs_one_query(self, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            tutorials = {
+                tutorial.title: tutorial
+                for tutorial in Tutorial.objects.select_subclasses()
+                .select_related("category")
+                .annotate_reading_time()
+            }
+            assert tutorials["Video"].video.name == "tutorials/videos/v.mp4"
+            assert tutorials["Picture"].category.title == "Modes"
+            assert tutorials["Picture"].reading_minutes == 1
+        assert type(tutorials["Plain"]) is Tutorial
+        assert type(tutorials["Picture"]) is PictureTutorial
+        assert type(tutorials["Video"]) is VideoTutorial
@@ -0,0 +1,152 @@
+import pytest
+from django.db import connection
+from django.http import StreamingHttpResponse
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse, reverse_lazy
+
+from sage_ticket.models import (
+    PictureTutorial,
+    Tutorial,
+    TutorialCategory,
+    TutorialFaq,
+    TutorialTag,
+    VideoTutorial,
+)
+
+
+@pytest.mark.django_db
+class TestTutorialAdminQueries:
+    @pytest.fixture
+    def category(self):
+        return TutorialCategory.objects.create(title="Getting started")
+
+    @pytest.fixture
+    def tags(self):
+        return [TutorialTag.objects.create(title=f"tag {i}") for i in range(5)]
+
+    def create_tutorials(self, total, category, tags, offset=0):
+        for i in range(offset, offset + total):
+            model = PictureTutorial if i % 2 else VideoTutorial
+            extra = {} if i % 2 else {"video": "tutorials/videos/demo.mp4"}
+            tutorial = model.objects.create(
+                title=f"Tutorial {i}",
+                description="<p>Description</p>",
+                summary="Summary",
+                category=category,
+                **extra,
+            )
+            tutorial.tags.set(tags[: i % len(tags) + 1])
+
+    def count_queries(self, client):
+        url = reverse("admin:sage_ticket_tutorial_changelist")
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url)
+        assert response.status_code == 200
+        return len(context.captured_queries)
+
+    def test_changelist_query_count_is_fixed(self, admin_client, category, tags):
+        self.create_tutorials(4, category, tags)
+        small = self.count_queries(admin_client)
+
+        self.create_tutorials(96, category, tags, offset=4)
+        large = self.count_queries(admin_client)
+
+        assert large == small
+
+    def test_changelist_renders_tag_titles(self, admin_client, category, tags):
+        self.create_tutorials(1, category, tags)
+        response = admin_client.get(reverse("admin:sage_ticket_tutorial_changelist"))
+        assert "tag 0" in response.content.decode()
+
+
+@pytest.mark.django_db
+class TestCategoryAdminQueries:
+    url = reverse_lazy("admin:sage_ticket_tutorialcategory_changelist")
+
+    def create_categories(self, total, offset=0):
+        for i in range(offset, offset + total):
+            category = TutorialCategory.objects.create(title=f"Category {i:02}")
+            for j in range(i % 4):
+                Tutorial.objects.create(
+                    title=f"Tutorial {i}-{j}",
+                    description="<p>Description</p>",
+                    summary="Summary",
+                    category=category,
+                    is_published=j != 0,
+                )
+
+    def count_queries(self, client, query=""):
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(f"{self.url}{query}")
+        assert response.status_code == 200
+        return len(context.captured_queries)
+
+    def get_counts(self, client, query=""):
+        response = client.get(f"{self.url}{query}")
+        return [
+            (category.title, category.published_tutorials_count)
+            for category in response.context["cl"].result_list
+        ]
+
+    def test_changelist_query_count_is_fixed(self, admin_client):
+        self.create_categories(2)
+        small = self.count_queries(admin_client)
+
+        self.create_categories(18, offset=2)
+        large = self.count_queries(admin_client)
+
+        assert large == small
+
+    def test_changelist_orders_by_published_tutorials(self, admin_client):
+        self.create_categories(8)
+        response = admin_client.get(self.url)
+        column = response.context["cl"].list_display.index(
+            "published_tutorials_count"
+        )
+
+        counts = self.get_counts(admin_client, f"?o=-{column}")
+
+        assert [count for _, count in counts] == [2, 2, 1, 1, 0, 0, 0, 0]
+        assert dict(counts) == {
+            f"Category {i:02}": max(i % 4 - 1, 0) for i in range(8)
+        }
+
+    def test_published_tutorials_filter_keeps_counts(self, admin_client):
+        self.create_categories(8)
+
+        counts = self.get_counts(
+            admin_client, "?tutorials_status=published_tutorials"
+        )
+
+        assert counts == [
+            ("Category 02", 1),
+            ("Category 03", 2),
+            ("Category 06", 1),
+            ("Category 07", 2),
+        ]
+
+
+@pytest.mark.django_db
+class TestTutorialFaqAdminExport:
+    def test_csv_export_is_streamed(self, admin_client, settings):
+        settings.IMPORT_EXPORT_SKIP_ADMIN_EXPORT_UI = True
+        category = TutorialCategory.objects.create(title="FAQ")
+        tutorial = Tutorial.objects.create(
+            title="Tutorial",
+            description="<p>Body</p>",
+            summary="Summary",
+            category=category,
+        )
+        for i in range(3):
+            TutorialFaq.objects.create(
+                question=f"Question {i}", answer="Answer", tutorial=tutorial
+            )
+
+        response = admin_client.get(reverse("admin:sage_ticket_tutorialfaq_export"))
+
+        assert isinstance(response, StreamingHttpResponse)
+        assert response["Content-Type"] == "text/csv"
+        content = b"".join(response.streaming_content).decode("utf-8-sig")
+        lines = content.splitlines()
+        assert len(lines) == 4
+        assert "Question 2" in content and "Tutorial" in lines[1]
@@ -3,7 +3,7 @@ Tutorial Category Translation
 """
 from modeltranslation.translator import TranslationOptions, register
 
-from sage_ticket.models import Tutorial
+from sage_ticket.models import PictureTutorial, Tutorial, VideoTutorial
 
 
 @register(Tutorial)
@@ -12,4 +12,28 @@ class TutorialTranslationOptions(TranslationOptions):
     Tutorial Category Translation Option
     """
 
-    fields = ("title", "description", "summary")
+    fields = ("title", "description", "summary", "reading_time")
+
+
+# Multi-table children of a translated model must be registered too, even
+# without fields of their own: modeltranslation then patches their managers
+# and constructors for the inherited translation columns. Those columns live
+# on the parent table, so no migration is involved. Unregistered, creating a
+# child (e.g. `PictureTutorial.objects.create(title=...)`) fails with
+# unexpected `title_en` arguments.
+@register(PictureTutorial)
+class PictureTutorialTranslationOptions(TranslationOptions):
+    """
+    Picture Tutorial Translation Option, inheriting the tutorial fields
+    """
+
+    fields = ()
+
+
+@register(VideoTutorial)
+class VideoTutorialTranslationOptions(TranslationOptions):
+    """
+    Video Tutorial Translation Option, inheriting the tutorial fields
+    """
+
+    fields = ()
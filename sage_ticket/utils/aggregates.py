@@ -0,0 +1,47 @@
+from django.db.models import Aggregate, CharField, TextField, Value
+from django.db.models.functions import Cast
+
+
+class GroupConcat(Aggregate):
+    """
+    Concatenates the values of a column per group into a single string.
+
+    Compiles to ``STRING_AGG`` on PostgreSQL and ``GROUP_CONCAT`` on SQLite,
+    MySQL and MariaDB, so listings can render many-to-many titles from one
+    annotated query instead of a prefetch per row.
+
+    Args:
+        expression: The column or expression to concatenate.
+        delimiter (str): The string placed between values.
+    """
+
+    function = "GROUP_CONCAT"
+    template = "%(function)s(%(expressions)s)"
+    output_field = TextField()
+
+    def __init__(self, expression, delimiter=", ", **extra):
+        self.delimiter = delimiter
+        super().__init__(
+            expression, Value(delimiter, output_field=CharField()), **extra
+        )
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        clone = self.copy()
+        expression, *rest = clone.get_source_expressions()
+        clone.set_source_expressions([Cast(expression, TextField()), *rest])
+        return super(GroupConcat, clone).as_sql(
+            compiler, connection, function="STRING_AGG", **extra_context
+        )
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        # MySQL only accepts a string literal as separator.
+        clone = self.copy()
+        expression = clone.get_source_expressions()[0]
+        clone.set_source_expressions([expression])
+        separator = self.delimiter.replace("\\", "\\\\").replace("'", "''")
+        return super(GroupConcat, clone).as_sql(
+            compiler,
+            connection,
+            template=f"%(function)s(%(expressions)s SEPARATOR '{separator}')",
+            **extra_context,
+        )
@@ -0,0 +1,282 @@
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.db import models, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from modeltranslation.utils import get_language
+
+DEFAULTS = {
+    "ENABLED": False,
+    "ALIAS": "default",
+    "TIMEOUT": 300,
+    "LOCAL_MAXSIZE": 256,
+    "LOCAL_TIMEOUT": 5,
+    "KEY_PREFIX": "sage_ticket",
+}
+"""Defaults of the `SAGE_TICKET_CACHE` setting."""
+
+
+def get_cache_settings():
+    """
+    Returns the `SAGE_TICKET_CACHE` setting merged with `DEFAULTS`.
+
+    Caching is opt-in: set ``SAGE_TICKET_CACHE = {"ENABLED": True}``. Writes
+    made while it is disabled do not invalidate, so entries left from an
+    earlier enabled period are served until `TIMEOUT` after re-enabling.
+    `ALIAS` names the shared Django cache, `TIMEOUT` its entry lifetime,
+    `LOCAL_MAXSIZE` the size of the in-process LRU and `LOCAL_TIMEOUT` how many
+    seconds a process trusts its copy of a namespace version, i.e. the longest
+    it can serve data another process has invalidated.
+    """
+    return {**DEFAULTS, **getattr(settings, "SAGE_TICKET_CACHE", {})}
+
+
+class LocalLRUCache:
+    """
+    A small thread-safe, in-process LRU cache with per-entry expiry.
+    """
+
+    def __init__(self):
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self.entries[key]
+                return default
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout, maxsize):
+        with self.lock:
+            self.entries[key] = (time.monotonic() + timeout, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > maxsize:
+                self.entries.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class VersionedCache:
+    """
+    Two-level cache of computed values grouped in namespaces.
+
+    Values live in the shared Django cache and in a per-process LRU in front
+    of it. Keys embed the namespace version stored in the shared cache, so
+    bumping the version invalidates the namespace for every worker at once;
+    stale entries simply stop being read and expire.
+    """
+
+    missing = object()
+
+    def __init__(self):
+        self.local = LocalLRUCache()
+        self.versions = {}
+
+    @property
+    def shared(self):
+        return caches[get_cache_settings()["ALIAS"]]
+
+    def get_version_key(self, namespace):
+        return f"{get_cache_settings()['KEY_PREFIX']}:version:{namespace}"
+
+    def get_version(self, namespace):
+        config = get_cache_settings()
+        version, checked_at = self.versions.get(namespace, (None, 0))
+        age = time.monotonic() - checked_at
+        if version is not None and age < config["LOCAL_TIMEOUT"]:
+            return version
+
+        key = self.get_version_key(namespace)
+        version = self.shared.get(key)
+        if version is None:
+            # Never restart at a version other processes may still remember.
+            self.shared.add(key, time.time_ns(), timeout=None)
+            version = self.shared.get(key)
+        self.versions[namespace] = (version, time.monotonic())
+        return version
+
+    def invalidate(self, namespace):
+        """
+        Bumps the version of a namespace in the shared cache.
+        """
+        key = self.get_version_key(namespace)
+        try:
+            version = self.shared.incr(key)
+        except ValueError:
+            version = time.time_ns()
+            self.shared.set(key, version, timeout=None)
+        self.versions[namespace] = (version, time.monotonic())
+
+    def get_or_set(self, namespace, key, compute):
+        """
+        Returns the cached value of `key`, computing and storing it on a miss.
+
+        Every caller gets its own deep copy, since the local entry is shared
+        by the whole process: sorting a returned list or setting an attribute
+        on a returned instance must not change what the next call sees.
+        """
+        config = get_cache_settings()
+        full_key = (
+            f"{config['KEY_PREFIX']}:{namespace}:{self.get_version(namespace)}:{key}"
+        )
+
+        value = self.local.get(full_key, self.missing)
+        if value is not self.missing:
+            return copy.deepcopy(value)
+
+        value = self.shared.get(full_key, self.missing)
+        if value is self.missing:
+            value = compute()
+            self.shared.set(full_key, value, timeout=config["TIMEOUT"])
+        self.local.set(
+            full_key, value, timeout=config["TIMEOUT"], maxsize=config["LOCAL_MAXSIZE"]
+        )
+        return copy.deepcopy(value)
+
+
+cache = VersionedCache()
+
+
+def make_cache_key(*parts):
+    """
+    Builds a short key from arguments; model instances are keyed by their
+    label and primary key.
+    """
+    normalized = "|".join(
+        f"{part._meta.label}:{part.pk}"
+        if isinstance(part, models.Model)
+        else repr(part)
+        for part in parts
+    )
+    return hashlib.md5(normalized.encode(), usedforsecurity=False).hexdigest()
+
+
+class CachedMethods:
+    """
+    Proxy calling the whitelisted manager methods through the cache.
+
+    Results are evaluated into lists. When caching is disabled the methods
+    are still evaluated, so callers get the same types either way.
+    """
+
+    def __init__(self, manager):
+        self.manager = manager
+
+    def __getattr__(self, name):
+        if name not in self.manager.cached_methods:
+            raise AttributeError(f"{name!r} is not a cached method.")
+        method = getattr(self.manager, name)
+
+        def call(*args, **kwargs):
+            def compute():
+                return list(method(*args, **kwargs))
+
+            if not get_cache_settings()["ENABLED"]:
+                return compute()
+            key = make_cache_key(
+                name,
+                self.manager.db,
+                get_language(),
+                *args,
+                *sorted(kwargs.items()),
+            )
+            return cache.get_or_set(self.manager.get_cache_namespace(), key, compute)
+
+        return call
+
+
+class CachedManagerMixin:
+    """
+    Adds an opt-in `cached` accessor to a manager, e.g.
+    ``TutorialTag.objects.cached.sort_by_popularity()``.
+
+    `cached_methods` lists the methods that may be cached and
+    `cache_dependencies` the models (as labels) whose saves, deletes and
+    many-to-many changes invalidate them.
+    """
+
+    cached_methods = ()
+    cache_dependencies = ()
+
+    @property
+    def cached(self):
+        return CachedMethods(self)
+
+    def get_cache_namespace(self):
+        return self.model._meta.label_lower
+
+    def invalidate_cache(self):
+        cache.invalidate(self.get_cache_namespace())
+
+
+def get_dependency_senders(label):
+    """
+    Returns the model of a label and its subclasses, which send their own
+    signals (e.g. polymorphic tutorial types), or a many-to-many through model
+    given as ``"app_label.Model.field"``.
+    """
+    app_label, model_name, *field = label.split(".")
+    model = apps.get_model(app_label, model_name)
+    if field:
+        return [model._meta.get_field(field[0]).remote_field.through]
+    return [
+        candidate
+        for candidate in apps.get_models()
+        if issubclass(candidate, model)
+    ]
+
+
+def connect_cache_invalidation():
+    """
+    Connects the signals invalidating every cached manager of the app.
+    """
+    for model in apps.get_app_config("sage_ticket").get_models():
+        manager = model._default_manager
+        if not isinstance(manager, CachedManagerMixin):
+            continue
+
+        namespace = manager.get_cache_namespace()
+
+        def invalidate(sender, namespace=namespace, using=None, **kwargs):
+            action = kwargs.get("action")
+            if action is not None and not action.startswith("post_"):
+                return
+            # Disabled caching must not cost writes a shared cache round trip.
+            if not get_cache_settings()["ENABLED"]:
+                return
+            cache.invalidate(namespace)
+            # Values cached by other requests while the transaction was open
+            # may predate the change.
+            transaction.on_commit(lambda: cache.invalidate(namespace), using=using)
+
+        labels = (model._meta.label, *manager.cache_dependencies)
+        for label in labels:
+            for sender in get_dependency_senders(label):
+                for signal in (post_save, post_delete, m2m_changed):
+                    signal.connect(
+                        invalidate,
+                        sender=sender,
+                        weak=False,
+                        dispatch_uid=(
+                            f"sage_ticket_cache_{namespace}_{sender._meta.label}"
+                        ),
+                    )
@@ -1,21 +1,121 @@
+import functools
+
 from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+
+from modeltranslation.translator import NotRegistered, translator
+from modeltranslation.utils import get_language, resolution_order
+
+
+@functools.lru_cache(maxsize=None)
+def _get_translation_fields(model):
+    opts = translator.get_options_for_model(model)
+    return {
+        name: {field.language: field.name for field in fields}
+        for name, fields in opts.all_fields.items()
+    }
+
+
+def get_translation_fields(model):
+    """
+    Returns the translated fields of a model, as registered in `translation/`,
+    mapped to their column per language, e.g.
+    ``{"title": {"en": "title_en", "fa": "title_fa"}}``.
+
+    The result is cached per model; unregistered models have no translated
+    fields.
+    """
+    try:
+        return _get_translation_fields(model)
+    except NotRegistered:
+        return {}
+
+
+def get_localized_fields(model, *base_fields):
+    """
+    Returns the columns of every language of the given translated fields, or
+    of all translated fields of the model.
+    """
+    translated = get_translation_fields(model)
+    return tuple(
+        column
+        for name, columns in translated.items()
+        if not base_fields or name in base_fields
+        for column in columns.values()
+    )
 
-def get_language_specific_fields(model, base_fields):
+
+@functools.lru_cache(maxsize=None)
+def _get_language_specific_fields(model, base_fields, language_code):
+    return tuple(
+        column
+        for name, columns in get_translation_fields(model).items()
+        if base_fields is None or name in base_fields
+        for language, column in columns.items()
+        if language != language_code
+    )
+
+
+def get_language_specific_fields(model, base_fields=None):
     """
-    Constructs a list of language-specific fields to exclude from import/export
-    based on the available languages in the settings.
+    Returns the translation columns to exclude from import/export: those of
+    every language but `settings.LANGUAGE_CODE`.
 
     :param model: The model class for which the fields are being generated.
-    :param base_fields: A list of base field names to which language codes are appended.
+    :param base_fields: Translated fields to consider (default: all of them).
     :return: A tuple of field names to exclude.
     """
-    language_code = settings.LANGUAGE_CODE  # Default language code
-    languages = settings.LANGUAGES  # List of all languages
-    exclude_fields = []
+    if base_fields is not None:
+        base_fields = tuple(base_fields)
+    # Keyed by the language code read now, so `override_settings` is honoured.
+    return _get_language_specific_fields(model, base_fields, settings.LANGUAGE_CODE)
+
 
-    for lang_code, _ in languages:
-        if lang_code != language_code:
-            for base_field in base_fields:
-                exclude_fields.append(f"{base_field}_{lang_code}")
+@functools.lru_cache(maxsize=None)
+def _get_translated_columns(model, fields, language):
+    translated = get_translation_fields(model)
+    columns = []
+    for name in fields:
+        if name not in translated:
+            columns.append(name)
+            continue
+        fallback_languages = getattr(model, name).fallback_languages
+        columns += [
+            translated[name][lang]
+            for lang in resolution_order(language, fallback_languages)
+            if lang in translated[name]
+        ]
+    return tuple(dict.fromkeys(columns))
+
+
+def get_translated_columns(model, fields, language=None):
+    """
+    Returns the columns `fields` are read from in `language` (default: the
+    active one), for `only()` or `values()`.
+
+    A translated field is replaced by the columns of the language and its
+    fallbacks, so the columns of other languages are never loaded. Returns
+    `None` if a name is not a concrete field of the model.
+    """
+    fields = [model._meta.pk.name if name == "pk" else name for name in fields]
+    for name in fields:
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+        if not field.concrete or field.many_to_many:
+            return None
+    return _get_translated_columns(model, tuple(fields), language or get_language())
+
+
+class LanguageFieldsResourceMixin:
+    """
+    Leaves the translation columns of languages other than
+    `settings.LANGUAGE_CODE` out of each resource instance, instead of
+    excluding them once in `Meta` when the class is defined.
+    """
 
-    return tuple(exclude_fields)
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        for name in get_language_specific_fields(self._meta.model):
+            self.fields.pop(name, None)
@@ -0,0 +1,205 @@
+from typing import Dict, List, NamedTuple, Tuple
+
+from django.contrib import messages
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.utils.translation import gettext as _
+from import_export.results import RowResult
+from import_export.widgets import ManyToManyWidget
+
+
+class ImportPreview(NamedTuple):
+    """Outcome of :meth:`BulkDryRunMixin.preview_import`.
+
+    Attributes:
+        new (int): The number of rows creating an object.
+        update (int): The number of rows changing an existing object.
+        skip (int): The number of rows matching an object without changes,
+            when `Meta.skip_unchanged` is set.
+        errors (list): ``(row number, error)`` pairs of invalid rows.
+        diffs (list): ``(row number, key, {column: (old, new)})`` for the first
+            updated rows.
+    """
+
+    new: int
+    update: int
+    skip: int
+    errors: List[Tuple[int, ValidationError]]
+    diffs: List[Tuple[int, str, Dict[str, tuple]]]
+
+
+class BulkDryRunMixin:
+    """
+    Adds a bulk dry-run mode to a `ModelResource`.
+
+    `preview_import` loads every existing object of a dataset with one query
+    keyed by the import id field and classifies rows as new, updated or
+    skipped in memory, as the import would, without saving, per-row queries
+    or HTML diffs. Dry runs of datasets with at least `bulk_dry_run_threshold`
+    rows, such as the admin import preview, use it and report only summary
+    counts.
+    """
+
+    bulk_dry_run_threshold = 1000
+    """Rows from which dry runs use `preview_import`; `None` disables it."""
+
+    max_preview_diffs = 100
+    """Number of field diffs kept by `preview_import`."""
+
+    def preview_import(self, dataset, max_diffs=None):
+        """
+        Classifies the rows of a dataset against the database.
+
+        Returns:
+            ImportPreview: Row counts by outcome, the invalid rows and the
+            field diffs of the first `max_diffs` updated rows.
+        """
+        if max_diffs is None:
+            max_diffs = self.max_preview_diffs
+        id_fields = self.get_import_id_fields()
+        if len(id_fields) != 1:
+            raise ImproperlyConfigured(
+                "Bulk dry runs need exactly one import id field."
+            )
+        id_field = self.fields[id_fields[0]]
+        fields = [
+            field
+            for field in self.get_import_fields()
+            if field.attribute and field is not id_field
+        ]
+        m2m_fields = [
+            field for field in fields if isinstance(field.widget, ManyToManyWidget)
+        ]
+
+        keyed_rows = []
+        errors = []
+        for number, row in enumerate(dataset.dict, start=1):
+            try:
+                keyed_rows.append((number, row, id_field.clean(row)))
+            except Exception as error:  # noqa: BLE001
+                errors.append((number, self.as_validation_error(error)))
+
+        queryset = self.get_queryset()
+        if hasattr(queryset, "non_polymorphic"):
+            queryset = queryset.non_polymorphic()
+        instances = {
+            id_field.get_value(instance): instance
+            for instance in queryset.filter(
+                **{f"{id_field.attribute}__in": {key for _, _, key in keyed_rows}}
+            ).prefetch_related(*(field.attribute for field in m2m_fields))
+        }
+
+        # Mirrors `skip_row`: unchanged rows are only skipped on request.
+        skip_unchanged = self._meta.skip_unchanged and not self._meta.skip_diff
+        new = update = skip = 0
+        diffs = []
+        for number, row, key in keyed_rows:
+            instance = instances.get(key)
+            is_new = instance is None
+            if is_new:
+                instance = self._meta.model()
+            old = {
+                field.column_name: (field.get_value(instance), field.export(instance))
+                for field in fields
+            }
+            try:
+                self.import_instance(instance, row)
+                related = {
+                    field.column_name: self.clean_preview_relation(field, row)
+                    for field in m2m_fields
+                    if field.column_name in row
+                }
+            except Exception as error:  # noqa: BLE001
+                errors.append((number, self.as_validation_error(error)))
+                continue
+
+            changed = False
+            changes = {}
+            for field in fields:
+                if field.column_name in related:
+                    if is_new:
+                        continue
+                    manager = getattr(instance, field.attribute)
+                    before = {obj.pk for obj in manager.all()}
+                    after = related[field.column_name]
+                    if before != after:
+                        changed = True
+                        changes[field.column_name] = (before, after)
+                    continue
+                value, exported = old[field.column_name]
+                changed = changed or field.get_value(instance) != value
+                if exported != field.export(instance):
+                    changes[field.column_name] = (exported, field.export(instance))
+
+            # Later rows with the same key update the object of this row.
+            instances[key] = instance
+            if is_new:
+                new += 1
+            elif changed or not skip_unchanged:
+                update += 1
+                if changes and len(diffs) < max_diffs:
+                    diffs.append((number, str(key), changes))
+            else:
+                skip += 1
+        return ImportPreview(new, update, skip, sorted(errors), diffs)
+
+    @staticmethod
+    def clean_preview_relation(field, row):
+        return {obj.pk for obj in field.clean(row)}
+
+    @staticmethod
+    def as_validation_error(error):
+        if isinstance(error, ValidationError):
+            return error
+        return ValidationError(str(error))
+
+    def import_data(self, dataset, dry_run=False, raise_errors=False, **kwargs):
+        threshold = self.bulk_dry_run_threshold
+        if not dry_run or threshold is None or len(dataset) < threshold:
+            return super().import_data(
+                dataset, dry_run=dry_run, raise_errors=raise_errors, **kwargs
+            )
+
+        result = self.get_result_class()()
+        result.diff_headers = self.get_diff_headers()
+        result.add_dataset_headers(dataset.headers)
+        self.before_import(dataset, **kwargs)
+        preview = self.preview_import(dataset)
+        if raise_errors and preview.errors:
+            raise preview.errors[0][1]
+        rows = dataset.dict if preview.errors else []
+        for number, error in preview.errors:
+            result.append_invalid_row(number, rows[number - 1], error)
+        result.totals[RowResult.IMPORT_TYPE_NEW] = preview.new
+        result.totals[RowResult.IMPORT_TYPE_UPDATE] = preview.update
+        result.totals[RowResult.IMPORT_TYPE_SKIP] = preview.skip
+        result.totals[RowResult.IMPORT_TYPE_INVALID] = len(preview.errors)
+        result.preview = preview
+        self.after_import(dataset, result, **kwargs)
+        return result
+
+
+class BulkDryRunAdminMixin:
+    """
+    Reports the summary counts of bulk dry runs on the admin import page,
+    whose preview table stays empty for them.
+    """
+
+    def import_action(self, request, **kwargs):
+        response = super().import_action(request, **kwargs)
+        result = getattr(response, "context_data", {}).get("result")
+        preview = getattr(result, "preview", None)
+        if preview is not None:
+            messages.info(
+                request,
+                _(
+                    "Import preview: %(new)d new, %(update)d updated, "
+                    "%(skip)d skipped and %(invalid)d invalid rows."
+                )
+                % {
+                    "new": preview.new,
+                    "update": preview.update,
+                    "skip": preview.skip,
+                    "invalid": len(preview.errors),
+                },
+            )
+        return response
@@ -0,0 +1,558 @@
+import codecs
+import csv
+import io
+import json
+from itertools import islice
+from typing import List, NamedTuple, Tuple
+
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    ImproperlyConfigured,
+    PermissionDenied,
+)
+from django.db import transaction
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
+from django.utils.text import slugify
+from import_export.formats.base_formats import CSV, Format
+from import_export.signals import post_export
+from import_export.widgets import ForeignKeyWidget, ManyToManyWidget
+
+from .exclude_fields import get_translated_columns
+from .widget import LookupCacheMixin
+
+
+class StreamingImportResult(NamedTuple):
+    """Outcome of :meth:`StreamingImportMixin.import_stream`.
+
+    Attributes:
+        created (int): The number of objects created.
+        updated (int): The number of existing objects updated.
+        errors (list): ``(row number, message)`` pairs of skipped rows.
+    """
+
+    created: int
+    updated: int
+    errors: List[Tuple[int, str]]
+
+
+def read_rows(file, format="csv"):
+    """
+    Yields the rows of a CSV or JSON Lines file as dictionaries, one at a
+    time. Binary files are decoded as UTF-8.
+    """
+    if isinstance(file.read(0), bytes):
+        file = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    if format == "csv":
+        yield from csv.DictReader(file)
+    elif format == "jsonl":
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+    else:
+        raise ValueError(f"Unsupported streaming import format: {format!r}.")
+
+
+def assign_unique_slugs(model, objs, field="title"):
+    """
+    Sets a unique slug, derived from `field`, on new objects that are about to
+    be bulk created. Taken slugs are read with one query; only collisions are
+    checked one by one.
+    """
+    manager = model._base_manager
+    bases = [slugify(getattr(obj, field), allow_unicode=True) for obj in objs]
+    taken = set(manager.filter(slug__in=set(bases)).values_list("slug", flat=True))
+    for obj, base in zip(objs, bases):
+        slug, counter = base, 1
+        while slug in taken or (slug != base and manager.filter(slug=slug).exists()):
+            slug = f"{base}-{counter}"
+            counter += 1
+        taken.add(slug)
+        obj.slug = slug
+
+
+class StreamingImportMixin:
+    """
+    Adds a streaming, chunked import mode to a `ModelResource`.
+
+    `import_stream` reads rows lazily and processes them `chunk_size` at a
+    time: the values of every `ForeignKeyWidget` and `ManyToManyWidget`
+    column and the existing objects are resolved with one `IN` query per
+    chunk, objects are written with `bulk_create` and `bulk_update`, and
+    many-to-many rows are inserted into the through tables in bulk. Model
+    `save` and signals are bypassed; resources refresh derived data in
+    `after_stream_chunk`.
+    """
+
+    stream_exclude = ()
+    """Fields that are not imported in streaming mode."""
+
+    def import_stream(self, file, format="csv", chunk_size=1000, dry_run=False):
+        """
+        Imports a CSV or JSON Lines file in chunks, each in its own
+        transaction, rolled back with `dry_run`.
+
+        Returns:
+            StreamingImportResult: Counts of created and updated objects and
+            the errors of skipped rows.
+        """
+        id_fields = self.get_import_id_fields()
+        if len(id_fields) != 1:
+            raise ImproperlyConfigured(
+                "Streaming import needs exactly one import id field."
+            )
+
+        widgets = [
+            field.widget
+            for field in self.get_import_fields()
+            if isinstance(field.widget, LookupCacheMixin)
+        ]
+        for widget in widgets:
+            widget.clear_lookup_cache()
+
+        created = updated = 0
+        errors = []
+        rows = enumerate(read_rows(file, format), start=1)
+        try:
+            while chunk := list(islice(rows, chunk_size)):
+                with transaction.atomic():
+                    chunk_created, chunk_updated, chunk_errors = self.import_chunk(
+                        chunk
+                    )
+                    if dry_run:
+                        transaction.set_rollback(True)
+                created += chunk_created
+                updated += chunk_updated
+                errors += chunk_errors
+        finally:
+            for widget in widgets:
+                widget.clear_lookup_cache()
+        return StreamingImportResult(created, updated, errors)
+
+    def get_stream_fields(self):
+        model = self._meta.model
+        fields = []
+        for field in self.get_import_fields():
+            if field.readonly or not field.attribute:
+                continue
+            if field.attribute in self.stream_exclude:
+                continue
+            fields.append((field, model._meta.get_field(field.attribute)))
+        return fields
+
+    def resolve_related(self, fields, rows):
+        """
+        Maps the values of related columns to primary keys, with one query per
+        foreign key or many-to-many field.
+        """
+        resolved = {}
+        for field, model_field in fields:
+            widget = field.widget
+            if not isinstance(widget, (ForeignKeyWidget, ManyToManyWidget)):
+                continue
+            values = set()
+            for _, row in rows:
+                values.update(self.split_related(field, row))
+            if isinstance(widget, LookupCacheMixin):
+                # Values repeated across chunks are only queried once.
+                resolved[field.column_name] = {
+                    key: obj.pk for key, obj in widget.lookup(values).items()
+                }
+                continue
+            if isinstance(widget, ForeignKeyWidget):
+                queryset = widget.get_queryset(None, None)
+            else:
+                queryset = widget.model._default_manager.all()
+            resolved[field.column_name] = {
+                str(value): pk
+                for value, pk in queryset.filter(
+                    **{f"{widget.field}__in": values}
+                ).values_list(widget.field, "pk")
+            }
+        return resolved
+
+    @staticmethod
+    def split_related(field, row):
+        value = row.get(field.column_name)
+        if value in (None, ""):
+            return []
+        if isinstance(field.widget, ManyToManyWidget):
+            return [
+                item.strip()
+                for item in str(value).split(field.widget.separator)
+                if item.strip()
+            ]
+        return [str(value).strip()]
+
+    def import_chunk(self, rows):
+        model = self._meta.model
+        fields = self.get_stream_fields()
+        resolved = self.resolve_related(fields, rows)
+        id_field = self.fields[self.get_import_id_fields()[0]]
+
+        queryset = self.get_queryset()
+        if hasattr(queryset, "non_polymorphic"):
+            queryset = queryset.non_polymorphic()
+        keys = {str(row.get(id_field.column_name, "")).strip() for _, row in rows}
+        existing = {
+            str(getattr(obj, id_field.attribute)): obj
+            for obj in queryset.filter(**{f"{id_field.attribute}__in": keys})
+        }
+
+        errors = []
+        instances = {}
+        relations = {}
+        columns = set()
+        for number, row in rows:
+            try:
+                key = str(id_field.clean(row)).strip()
+                obj = instances.get(key) or existing.get(key) or model()
+                values, row_relations = self.clean_stream_row(
+                    fields, row, resolved
+                )
+            except Exception as error:  # noqa: BLE001
+                errors.append((number, str(error)))
+                continue
+            for name, value in values.items():
+                setattr(obj, name, value)
+            columns.update(values)
+            instances[key] = obj
+            relations.setdefault(key, {}).update(row_relations)
+
+        new = [obj for obj in instances.values() if obj.pk is None]
+        old = [obj for obj in instances.values() if obj.pk is not None]
+        self.before_stream_write(new, old)
+        model._base_manager.bulk_create(new)
+        if any(obj.pk is None for obj in new):
+            # The database cannot return the primary keys of inserted rows.
+            keys = [getattr(obj, id_field.attribute) for obj in new]
+            pks = dict(
+                model._base_manager.filter(
+                    **{f"{id_field.attribute}__in": keys}
+                ).values_list(id_field.attribute, "pk")
+            )
+            for obj in new:
+                obj.pk = pks[getattr(obj, id_field.attribute)]
+        if old:
+            update_fields = self.get_stream_update_fields(model, old, columns)
+            model._base_manager.bulk_update(old, update_fields)
+        for field, _ in fields:
+            if isinstance(field.widget, LookupCacheMixin):
+                # Later chunks may refer to the objects of this one.
+                field.widget.forget_missing(new + old)
+
+        changes = self.write_relations(fields, instances, relations)
+        self.after_stream_chunk(new, old, changes)
+        return len(new), len(old), errors
+
+    def clean_stream_row(self, fields, row, resolved):
+        """
+        Returns the attribute values and related primary keys of a row.
+        """
+        values = {}
+        relations = {}
+        for field, model_field in fields:
+            if field.column_name not in row:
+                continue
+            if field.column_name not in resolved:
+                values[field.attribute] = field.clean(row)
+                continue
+            mapping = resolved[field.column_name]
+            keys = self.split_related(field, row)
+            if model_field.many_to_many:
+                relations[model_field.name] = {
+                    mapping[key] for key in keys if key in mapping
+                }
+            elif not keys:
+                values[model_field.attname] = None
+            elif keys[0] in mapping:
+                values[model_field.attname] = mapping[keys[0]]
+            else:
+                raise field.widget.model.DoesNotExist(
+                    f"{field.widget.model._meta.object_name} matching "
+                    f"{field.widget.field}={keys[0]!r} does not exist."
+                )
+        return values, relations
+
+    @staticmethod
+    def get_stream_update_fields(model, objs, columns):
+        names = set()
+        for name in columns:
+            model_field = next(
+                field
+                for field in model._meta.concrete_fields
+                if name in (field.name, field.attname)
+            )
+            if not model_field.primary_key:
+                names.add(model_field.name)
+        for model_field in model._meta.concrete_fields:
+            if getattr(model_field, "auto_now", False):
+                for obj in objs:
+                    model_field.pre_save(obj, add=False)
+                names.add(model_field.name)
+        return sorted(names)
+
+    def write_relations(self, fields, instances, relations):
+        """
+        Replaces the many-to-many rows of the imported objects with bulk
+        deletes and inserts into the through tables.
+
+        Returns:
+            dict: The removed and added related primary keys by field name.
+        """
+        changes = {}
+        for _, model_field in fields:
+            if not model_field.many_to_many:
+                continue
+            pairs = [
+                (instances[key].pk, related_pk)
+                for key, row_relations in relations.items()
+                if model_field.name in row_relations
+                for related_pk in row_relations[model_field.name]
+            ]
+            pks = [
+                instances[key].pk
+                for key, row_relations in relations.items()
+                if model_field.name in row_relations
+            ]
+            if not pks:
+                continue
+
+            through = model_field.remote_field.through
+            source = through._meta.get_field(model_field.m2m_field_name()).attname
+            target = through._meta.get_field(
+                model_field.m2m_reverse_field_name()
+            ).attname
+            symmetrical = model_field.remote_field.symmetrical
+            if symmetrical:
+                pairs += [(related_pk, pk) for pk, related_pk in pairs]
+
+            current = through._base_manager.filter(**{f"{source}__in": pks})
+            if symmetrical:
+                current = current | through._base_manager.filter(
+                    **{f"{target}__in": pks}
+                )
+            removed = set(current.values_list(target, flat=True))
+            current.delete()
+            through._base_manager.bulk_create(
+                [
+                    through(**{source: pk, target: related_pk})
+                    for pk, related_pk in pairs
+                ],
+                ignore_conflicts=True,
+            )
+            changes[model_field.name] = (
+                removed,
+                {related_pk for _, related_pk in pairs},
+            )
+        return changes
+
+    def before_stream_write(self, new, updated):
+        """
+        Hook to prepare new and updated objects before they are written.
+        """
+
+    def after_stream_chunk(self, new, updated, changes):
+        """
+        Hook called after a chunk is written, with the many-to-many changes
+        returned by `write_relations`.
+        """
+
+
+class JSONL(Format):
+    """
+    JSON Lines export format: one JSON object per row.
+    """
+
+    CONTENT_TYPE = "application/x-ndjson"
+
+    def __init__(self, encoding=None):
+        self.encoding = encoding
+
+    def get_title(self):
+        return "jsonl"
+
+    def get_extension(self):
+        return "jsonl"
+
+    def get_content_type(self):
+        return self.CONTENT_TYPE
+
+    def is_binary(self):
+        return False
+
+    def get_read_mode(self):
+        return "r"
+
+    def can_export(self):
+        return True
+
+    def export_data(self, dataset, **kwargs):
+        return "".join(
+            json.dumps(dict(zip(dataset.headers, row)), ensure_ascii=False, default=str)
+            + "\n"
+            for row in dataset
+        )
+
+
+class StreamingExportMixin:
+    """
+    Adds a streaming export mode to a `ModelResource`.
+
+    `export_stream` never builds a `Dataset`: the queryset is read with
+    `iterator(chunk_size=...)`, which prefetches many-to-many fields chunk by
+    chunk, foreign keys rendered by a `ForeignKeyWidget` are joined, and rows
+    are serialized as CSV or JSON Lines one chunk at a time, so memory stays
+    bounded by the chunk size.
+    """
+
+    stream_export_formats = ("csv", "jsonl")
+    """Formats `export_stream` can write."""
+
+    def get_stream_export_queryset(self, queryset, export_fields):
+        model = self._meta.model
+        if hasattr(queryset, "non_polymorphic"):
+            queryset = queryset.non_polymorphic()
+        joined = []
+        prefetched = []
+        loaded = []
+        for field in export_fields:
+            try:
+                model_field = model._meta.get_field(field.attribute or "")
+            except FieldDoesNotExist:
+                loaded = None
+                continue
+            if model_field.many_to_many:
+                prefetched.append(self.get_stream_prefetch(model_field, field.widget))
+                continue
+            if loaded is not None:
+                loaded.append(field.attribute)
+            if (
+                model_field.is_relation
+                and model_field.concrete
+                and field.attribute == model_field.name
+                and isinstance(field.widget, ForeignKeyWidget)
+            ):
+                joined.append(model_field.name)
+                related_columns = get_translated_columns(
+                    model_field.related_model, [field.widget.field]
+                )
+                if loaded is not None and related_columns:
+                    loaded += [
+                        f"{model_field.name}__{column}" for column in related_columns
+                    ]
+        if joined:
+            queryset = queryset.select_related(*joined)
+        if prefetched:
+            queryset = queryset.prefetch_related(*prefetched)
+        # Columns of other languages are not loaded; exports with fields that
+        # are not plain model fields load every column.
+        if loaded:
+            local = [name for name in loaded if "__" not in name]
+            columns = get_translated_columns(model, local)
+            if columns is not None:
+                related = [name for name in loaded if "__" in name]
+                queryset = queryset.only(*columns, *related)
+        return queryset
+
+    @staticmethod
+    def get_stream_prefetch(model_field, widget):
+        related_model = model_field.related_model
+        columns = None
+        if isinstance(widget, ManyToManyWidget):
+            columns = get_translated_columns(related_model, [widget.field])
+        if not columns:
+            return model_field.name
+        queryset = related_model._default_manager.all()
+        if hasattr(queryset, "non_polymorphic"):
+            queryset = queryset.non_polymorphic()
+        return Prefetch(model_field.name, queryset=queryset.only(*columns))
+
+    def export_stream(
+        self, queryset=None, format="csv", chunk_size=None, export_fields=None
+    ):
+        """
+        Yields the export of a queryset as CSV or JSON Lines text, one chunk of
+        `chunk_size` rows at a time (default: the resource's chunk size).
+        """
+        if format not in self.stream_export_formats:
+            raise ValueError(f"Unsupported streaming export format: {format!r}.")
+        chunk_size = chunk_size or self.get_chunk_size()
+        if queryset is None:
+            queryset = self.get_queryset()
+        queryset = self.filter_export(queryset)
+        fields = self.get_export_fields(export_fields)
+        headers = self.get_export_headers(export_fields)
+        queryset = self.get_stream_export_queryset(queryset, fields)
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if format == "csv":
+            writer.writerow(headers)
+
+        rows = 0
+        for obj in queryset.iterator(chunk_size=chunk_size):
+            row = self.export_resource(obj, selected_fields=export_fields)
+            if format == "csv":
+                writer.writerow(row)
+            else:
+                buffer.write(
+                    json.dumps(
+                        dict(zip(headers, row)), ensure_ascii=False, default=str
+                    )
+                )
+                buffer.write("\n")
+            rows += 1
+            if rows % chunk_size == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
+
+
+class StreamingExportAdminMixin:
+    """
+    Streams CSV and JSON Lines exports of `ImportExportModelAdmin` whose
+    resource supports it, instead of rendering the whole file in memory.
+    """
+
+    def get_export_formats(self):
+        return [*super().get_export_formats(), JSONL]
+
+    def get_stream_export_format(self, file_format):
+        if isinstance(file_format, CSV):
+            return "csv"
+        if isinstance(file_format, JSONL):
+            return "jsonl"
+        return None
+
+    def _do_file_export(self, file_format, request, queryset, export_form=None):
+        format = self.get_stream_export_format(file_format)
+        resource_class = self.choose_export_resource_class(export_form, request)
+        if format is None or not issubclass(resource_class, StreamingExportMixin):
+            return super()._do_file_export(
+                file_format, request, queryset, export_form=export_form
+            )
+        if not self.has_export_permission(request):
+            raise PermissionDenied
+
+        resource = resource_class(
+            **self.get_export_resource_kwargs(request, export_form=export_form)
+        )
+        export_fields = self.get_export_resource_fields_from_form(export_form)
+        encoder = codecs.getincrementalencoder(self.to_encoding or "utf-8")()
+        response = StreamingHttpResponse(
+            (
+                encoder.encode(text)
+                for text in resource.export_stream(
+                    queryset, format=format, export_fields=export_fields
+                )
+            ),
+            content_type=file_format.get_content_type(),
+        )
+        response["Content-Disposition"] = 'attachment; filename="{}"'.format(
+            self.get_export_filename(request, queryset, file_format),
+        )
+        post_export.send(sender=None, model=self.model)
+        return response
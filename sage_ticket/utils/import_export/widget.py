@@ -1,7 +1,169 @@
+import copy
+import functools
+
 from import_export import widgets
 
+from sage_ticket.utils.cache import LocalLRUCache
+
+
+class LookupCacheMixin:
+    """
+    Resolves related objects through a bounded, per-import LRU cache.
+
+    `preload` fills the cache for a batch of values with one `IN` query;
+    values missing from the cache are fetched together on first use, and
+    values without a match are remembered too, so every value costs at most
+    one query per import. At most `cache_size` objects are kept, which bounds
+    memory on very large reference tables.
+
+    Unlike the upstream widgets, objects are read once per import: an object
+    created or renamed by another process while the import runs is not seen.
+    Objects saved by the import itself are, as `forget_missing` drops the
+    remembered misses of their values.
+    """
+
+    cache_size = 10_000
+    cache_timeout = 3600
+    not_found = object()
+
+    def __init__(self, *args, cache_size=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if cache_size is not None:
+            self.cache_size = cache_size
+        self.lookup_cache = LocalLRUCache()
+
+    def __deepcopy__(self, memo):
+        # Resources copy their fields per instance; each copy gets its own cache.
+        clone = copy.copy(self)
+        clone.lookup_cache = LocalLRUCache()
+        return clone
+
+    def get_lookup_queryset(self):
+        queryset = self.model._default_manager.all()
+        if hasattr(queryset, "non_polymorphic"):
+            queryset = queryset.non_polymorphic()
+        return queryset
+
+    @staticmethod
+    def to_key(value):
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        return str(value).strip()
+
+    def get_keys(self, value):
+        """
+        Returns the lookup values of a cell.
+        """
+        if value in (None, ""):
+            return []
+        return [self.to_key(value)]
+
+    def lookup(self, keys):
+        """
+        Returns the cached objects of the given values by value, fetching the
+        uncached ones with one query.
+        """
+        found = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            obj = self.lookup_cache.get(key)
+            if obj is None:
+                missing.append(key)
+            elif obj is not self.not_found:
+                found[key] = obj
+        for start in range(0, len(missing), self.cache_size):
+            batch = missing[start : start + self.cache_size]
+            loaded = {
+                self.to_key(getattr(obj, self.field)): obj
+                for obj in self.get_lookup_queryset().filter(
+                    **{f"{self.field}__in": batch}
+                )
+            }
+            for key in batch:
+                obj = loaded.get(key, self.not_found)
+                self.lookup_cache.set(
+                    key, obj, timeout=self.cache_timeout, maxsize=self.cache_size
+                )
+                if obj is not self.not_found:
+                    found[key] = obj
+        return found
+
+    def preload(self, values):
+        """
+        Caches the objects of every value of a column.
+        """
+        keys = [key for value in values for key in self.get_keys(value)]
+        self.lookup(keys[: self.cache_size])
+
+    def forget_missing(self, objs):
+        """
+        Drops the remembered misses of the values of `objs`, so objects
+        created during the import are found by later rows.
+        """
+        for obj in objs:
+            if not isinstance(obj, self.model):
+                continue
+            value = getattr(obj, self.field, None)
+            if value in (None, ""):
+                continue
+            key = self.to_key(value)
+            if self.lookup_cache.get(key) is self.not_found:
+                self.lookup_cache.delete(key)
+
+    def clear_lookup_cache(self):
+        self.lookup_cache.clear()
+
+
+class CachedLookupForeignKeyWidget(LookupCacheMixin, widgets.ForeignKeyWidget):
+    """
+    `ForeignKeyWidget` resolving values through the lookup cache instead of a
+    `get()` per row. Lookups customized beyond the widget's `field` fall back
+    to the uncached query.
+    """
 
-class ForeignKeyNullableWidget(widgets.ForeignKeyWidget):
+    def get_lookup_queryset(self):
+        queryset = self.get_queryset(None, None)
+        if hasattr(queryset, "non_polymorphic"):
+            queryset = queryset.non_polymorphic()
+        return queryset
+
+    def get_instance_by_lookup_fields(self, value, row, **kwargs):
+        if self.get_lookup_kwargs(value, row, **kwargs) != {self.field: value}:
+            return super().get_instance_by_lookup_fields(value, row, **kwargs)
+        key = self.to_key(value)
+        obj = self.lookup([key]).get(key)
+        if obj is None:
+            raise self.model.DoesNotExist(
+                f"{self.model._meta.object_name} matching "
+                f"{self.field}={value!r} does not exist."
+            )
+        return obj
+
+
+class CachedLookupManyToManyWidget(LookupCacheMixin, widgets.ManyToManyWidget):
+    """
+    `ManyToManyWidget` resolving values through the lookup cache instead of a
+    query per row. Unknown values are ignored, as by `ManyToManyWidget`.
+    """
+
+    def get_keys(self, value):
+        if value in (None, ""):
+            return []
+        if isinstance(value, (float, int)):
+            return [self.to_key(value)]
+        return [
+            item.strip() for item in str(value).split(self.separator) if item.strip()
+        ]
+
+    def clean(self, value, row=None, **kwargs):
+        keys = self.get_keys(value)
+        if not keys:
+            return self.model.objects.none()
+        found = self.lookup(keys)
+        return [found[key] for key in dict.fromkeys(keys) if key in found]
+
+
+class ForeignKeyNullableWidget(CachedLookupForeignKeyWidget):
     """pass"""
 
     # pylint: disable=W1113
@@ -9,3 +171,53 @@ class ForeignKeyNullableWidget(widgets.ForeignKeyWidget):
         if value:
             return super().clean(value)
         return None
+
+
+class LookupCacheResourceMixin:
+    """
+    Resolves the related columns of a `ModelResource` through lookup caches.
+
+    Foreign key and many-to-many fields built from the model use the caching
+    widgets, and every caching widget is preloaded from its column before the
+    import, so related values cost one query per column instead of one per
+    row.
+    """
+
+    @classmethod
+    def get_fk_widget(cls, field):
+        widget = super().get_fk_widget(field)
+        return functools.partial(
+            CachedLookupForeignKeyWidget, *widget.args, **widget.keywords
+        )
+
+    @classmethod
+    def get_m2m_widget(cls, field):
+        widget = super().get_m2m_widget(field)
+        return functools.partial(
+            CachedLookupManyToManyWidget, *widget.args, **widget.keywords
+        )
+
+    def get_lookup_cache_fields(self):
+        return [
+            field
+            for field in self.get_import_fields()
+            if isinstance(field.widget, LookupCacheMixin)
+        ]
+
+    def before_import(self, dataset, **kwargs):
+        super().before_import(dataset, **kwargs)
+        headers = dataset.headers or []
+        for field in self.get_lookup_cache_fields():
+            field.widget.clear_lookup_cache()
+            if field.column_name in headers:
+                field.widget.preload(dataset[field.column_name])
+
+    def after_save_instance(self, instance, row, **kwargs):
+        super().after_save_instance(instance, row, **kwargs)
+        for field in self.get_lookup_cache_fields():
+            field.widget.forget_missing([instance])
+
+    def after_import(self, dataset, result, **kwargs):
+        super().after_import(dataset, result, **kwargs)
+        for field in self.get_lookup_cache_fields():
+            field.widget.clear_lookup_cache()